@@ -0,0 +1,565 @@
+#!/usr/bin/env python3
+"""
+Widget / Shortcode Benchmark
+Measures what every widget under site-assets/ and every generated shortcode under
+wordpress-migration/shortcodes/ costs a page:
+
+  - transferred bytes (raw, gzip, and gzip of the build_dist.py minified copy; for
+    shortcodes also the stylesheets they enqueue)
+  - external requests referenced by the markup (CDN scripts, stylesheets, images,
+    CMS API endpoints, other fetched hosts)
+  - inline <script> / <style> block counts and bytes
+  - headless render timing (jsdom, optional) against a local mock of
+    cms.carolinapanorama.org (MOCK_CMS_API.py): time until network idle, API calls made, images in
+    the rendered DOM, DOM size and script errors
+
+Results go to a JSON file tagged with the util-ghl-assets@ version (git commit) so
+runs can be compared across versions.
+
+Usage:
+    python3 BENCHMARK_WIDGETS.py                          # write benchmark-results.json
+    python3 BENCHMARK_WIDGETS.py --runs 5 --only headlines
+    python3 BENCHMARK_WIDGETS.py --no-render              # static metrics only
+    python3 BENCHMARK_WIDGETS.py --cms-latency-ms 150     # render against a slow mock CMS
+    python3 BENCHMARK_WIDGETS.py --compare old.json       # report regressions vs. a previous run
+
+Render timing needs node and jsdom (`npm install jsdom` in the repo root, or on
+NODE_PATH); without them the static metrics are still written.
+"""
+
+import argparse
+import gzip
+import json
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import urlparse
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "site-assets" / "cpanoram-global"))
+import build_dist  # noqa: E402
+from GENERATE_SHORTCODES import EXTERNAL_LIBRARIES  # noqa: E402
+from MOCK_CMS_API import MockCMS  # noqa: E402
+
+SOURCE_DIR = Path("site-assets")
+SHORTCODES_DIR = Path("wordpress-migration/shortcodes")
+SHORTCODES_MANIFEST = SHORTCODES_DIR / "SHORTCODES_MANIFEST.json"
+DEFAULT_OUTPUT = Path("benchmark-results.json")
+
+# Build tooling and page chrome, not widgets
+SKIP_WIDGET_DIRS = {"cpanoram-global"}
+
+GLOBAL_JS = SOURCE_DIR / "cpanoram-global" / "carolina-panorama-global.js"
+GLOBAL_CSS = SOURCE_DIR / "cpanoram-global" / "carolina-panorama-global.css"
+CDN_BASE = "https://cdn.jsdelivr.net/gh/Carolina-Panorama/util-ghl-assets@main/"
+
+# Hosts whose requests the render step routes to the mock CMS
+CMS_HOSTS = {"cms.carolinapanorama.org", "api.carolinapanorama.com"}
+
+# Regressions smaller than this (relative) are treated as noise by --compare
+RENDER_NOISE = 0.10
+
+SCRIPT_RE = re.compile(r"<script\b([^>]*)>(.*?)</script\s*>", re.S | re.I)
+STYLE_RE = re.compile(r"<style\b[^>]*>(.*?)</style\s*>", re.S | re.I)
+LINK_RE = re.compile(r"<link\b([^>]*)>", re.I)
+IMG_RE = re.compile(r"<img\b([^>]*)>", re.I)
+IFRAME_RE = re.compile(r"<iframe\b([^>]*)>", re.I)
+ATTR_RE = re.compile(r"""\b([a-z-]+)\s*=\s*(?:"([^"]*)"|'([^']*)')""", re.I)
+API_PATH_RE = re.compile(r"/api/public/[a-z]+(?:/[a-z]+)?")
+FETCH_URL_RE = re.compile(r"""fetch(?:JSON)?\(\s*[`'"](https?://[^/`'"$]+)""")
+FETCH_CALL_RE = re.compile(r"\bfetch(?:JSON)?\(")
+PHP_ECHO_OPEN_RE = re.compile(r"<\?php echo '<\?'; \?>")
+PHP_BLOCK_RE = re.compile(r"<\?php.*?\?>", re.S)
+PHP_PRINT_LIBRARY_RE = re.compile(r"<\?php wp_print_(scripts|styles)\( '([^']+)' \); \?>")
+ENQUEUE_STYLE_RE = re.compile(r"wp_enqueue_style\(\s*'([^']+)'")
+ENQUEUE_SCRIPT_RE = re.compile(r"wp_enqueue_script\(\s*'([^']+)'")
+
+
+# ===== STATIC METRICS =====
+
+def tag_attrs(attr_text):
+    """Attributes of one tag as a dict (lowercased names)."""
+    return {m.group(1).lower(): m.group(2) if m.group(2) is not None else m.group(3) for m in ATTR_RE.finditer(attr_text)}
+
+
+def is_external(url):
+    return bool(url) and url.startswith(("http://", "https://", "//"))
+
+
+def byte_sizes(text):
+    """Raw and gzip byte counts of a string."""
+    data = text.encode("utf-8")
+    return {"raw_bytes": len(data), "gzip_bytes": len(gzip.compress(data, mtime=0))}
+
+
+def analyze_markup(html):
+    """Inline block counts and external requests referenced by a widget's markup."""
+    scripts = []
+    inline_scripts = []
+    for match in SCRIPT_RE.finditer(html):
+        attrs = tag_attrs(match.group(1))
+        if attrs.get("src"):
+            scripts.append(attrs["src"])
+        elif match.group(2).strip():
+            inline_scripts.append(match.group(2))
+    inline_styles = [m.group(1) for m in STYLE_RE.finditer(html)]
+
+    stylesheets = []
+    preconnects = []
+    for match in LINK_RE.finditer(html):
+        attrs = tag_attrs(match.group(1))
+        rel = (attrs.get("rel") or "").lower()
+        if rel == "stylesheet" and attrs.get("href"):
+            stylesheets.append(attrs["href"])
+        elif rel in ("preconnect", "dns-prefetch") and attrs.get("href"):
+            preconnects.append(attrs["href"])
+
+    images = sorted({tag_attrs(m.group(1)).get("src") for m in IMG_RE.finditer(html)} - {None})
+    images = [src for src in images if is_external(src)]
+    iframes = [tag_attrs(m.group(1)).get("src") for m in IFRAME_RE.finditer(html)]
+    iframes = [src for src in iframes if is_external(src)]
+
+    script_text = "\n".join(inline_scripts)
+    api_endpoints = sorted(set(API_PATH_RE.findall(script_text)))
+    other_hosts = sorted(
+        {host for host in FETCH_URL_RE.findall(script_text) if urlparse(host).hostname not in CMS_HOSTS}
+    )
+
+    external = {
+        "scripts": scripts,
+        "stylesheets": stylesheets,
+        "images": images,
+        "iframes": iframes,
+        "api_endpoints": api_endpoints,
+        "other_hosts": other_hosts,
+    }
+    return {
+        "inline_scripts": len(inline_scripts),
+        "inline_script_bytes": len(script_text.encode("utf-8")),
+        "inline_styles": len(inline_styles),
+        "inline_style_bytes": len("\n".join(inline_styles).encode("utf-8")),
+        "fetch_call_sites": len(FETCH_CALL_RE.findall(script_text)),
+        "preconnects": len(preconnects),
+        "external": external,
+        "external_requests": sum(len(urls) for urls in external.values()),
+    }
+
+
+def benchmark_widget(path):
+    """Static metrics for one widget file (as fetched from jsDelivr by the loaders)."""
+    html = path.read_text(encoding="utf-8")
+    minified = build_dist.minify_html(html)
+    result = {"file": path.relative_to(SOURCE_DIR).as_posix(), **byte_sizes(html)}
+    result["min_gzip_bytes"] = byte_sizes(minified)["gzip_bytes"]
+    result.update(analyze_markup(html))
+    return result, html
+
+
+def shortcode_markup(php):
+    """The HTML a shortcode returns: the ob_start() region with PHP echoes dropped."""
+    start = php.find("?>", php.find("ob_start()"))
+    end = php.rfind("<?php")
+    markup = php[start + 2:end] if start != -1 and end > start else ""
+    markup = PHP_ECHO_OPEN_RE.sub("<?", markup)
+    markup = PHP_PRINT_LIBRARY_RE.sub(library_tag, markup)
+    return PHP_BLOCK_RE.sub("", markup).strip() + "\n"
+
+
+def library_tag(match):
+    """The tag wp_print_scripts()/wp_print_styles() emits for a registered library (deps not expanded)."""
+    lib = EXTERNAL_LIBRARIES.get(match.group(2))
+    if lib is None:
+        return ""
+    if match.group(1) == "scripts":
+        strategy = f" {lib['strategy']}" if lib.get("strategy") else ""
+        return f'<script src="{lib["src"]}"{strategy}></script>'
+    return f'<link rel="stylesheet" href="{lib["src"]}">'
+
+
+def style_handle_file(handle):
+    """Generated stylesheet behind a shortcode style handle (None for theme-level handles)."""
+    if handle == "cp-widgets-shared":
+        return SHORTCODES_DIR / "css" / "cp-widgets-shared.css"
+    if handle.startswith("cp-widget-"):
+        return SHORTCODES_DIR / "css" / "widgets" / (handle[len("cp-widget-"):].replace("-", "_") + ".css")
+    return None
+
+
+def benchmark_shortcode(entry):
+    """Static metrics for one generated shortcode: markup plus the stylesheets it enqueues."""
+    php_path = Path(entry["file"])
+    php = php_path.read_text(encoding="utf-8")
+    markup = shortcode_markup(php)
+
+    styles = []
+    for handle in ENQUEUE_STYLE_RE.findall(php):
+        css_path = style_handle_file(handle)
+        if css_path and css_path.exists():
+            styles.append({"handle": handle, "file": css_path.as_posix(), **byte_sizes(css_path.read_text(encoding="utf-8"))})
+        else:
+            styles.append({"handle": handle, "file": None})
+
+    markup_sizes = byte_sizes(markup)
+    result = {
+        "shortcode": entry["shortcode"],
+        "file": php_path.as_posix(),
+        "markup_bytes": markup_sizes["raw_bytes"],
+        "markup_gzip_bytes": markup_sizes["gzip_bytes"],
+        "enqueued_styles": styles,
+        "enqueued_scripts": ENQUEUE_SCRIPT_RE.findall(php),
+        "transfer_gzip_bytes": markup_sizes["gzip_bytes"] + sum(s.get("gzip_bytes", 0) for s in styles),
+    }
+    result.update(analyze_markup(markup))
+    result["external_requests"] += sum(1 for s in styles if s["file"])
+    local_styles = [s["file"] for s in styles if s["file"]]
+    return result, markup, local_styles
+
+
+# ===== HEADLESS RENDER =====
+
+# Runs under node; reads a job on stdin and prints per-page render metrics.
+# Every network request is answered locally: CMS hosts go to the mock, files listed in
+# job.local are served from disk, anything else is counted and answered empty.
+RENDER_SCRIPT = r"""
+import { createRequire } from 'node:module';
+import { readFileSync } from 'node:fs';
+
+const require = createRequire(process.cwd() + '/');
+let jsdom;
+try {
+  jsdom = require('jsdom');
+} catch (error) {
+  process.stdout.write(JSON.stringify({ skipped: 'jsdom is not installed (npm install jsdom)' }));
+  process.exit(0);
+}
+const { JSDOM, ResourceLoader, VirtualConsole } = jsdom;
+
+const job = JSON.parse(readFileSync(0, 'utf8'));
+const cmsHosts = new Set(job.cms_hosts);
+
+function median(values) {
+  const sorted = values.slice().sort((a, b) => a - b);
+  return sorted.length ? sorted[Math.floor(sorted.length / 2)] : null;
+}
+
+function renderOnce(page) {
+  return new Promise(resolve => {
+    const counts = { api: 0, api_bytes: 0, scripts: 0, stylesheets: 0, other: 0 };
+    const errors = [];
+    let inflight = 0;
+    let loaded = false;
+    let lastActivity = 0;
+    let loadMs = null;
+    let idleTimer = null;
+    let finished = false;
+    const start = performance.now();
+
+    const activity = () => {
+      lastActivity = performance.now() - start;
+      if (idleTimer) clearTimeout(idleTimer);
+      if (loaded && inflight === 0) idleTimer = setTimeout(finish, job.settle_ms);
+    };
+
+    class LocalResources extends ResourceLoader {
+      fetch(url, options) {
+        const kind = options.element && options.element.localName === 'link' ? 'stylesheets' : 'scripts';
+        if (job.local[url]) {
+          return Promise.resolve(Buffer.from(readFileSync(job.local[url])));
+        }
+        counts[kind] += 1;
+        return Promise.resolve(Buffer.from(''));
+      }
+    }
+
+    const virtualConsole = new VirtualConsole();
+    virtualConsole.on('jsdomError', error => errors.push(String(error.message || error)));
+
+    const dom = new JSDOM(page.html, {
+      url: 'https://www.carolinapanorama.org/benchmark',
+      runScripts: 'dangerously',
+      resources: new LocalResources(),
+      pretendToBeVisual: true,
+      virtualConsole,
+      beforeParse(window) {
+        window.fetch = async (input, init = {}) => {
+          const url = new URL(typeof input === 'string' ? input : input.url, window.location.href);
+          inflight += 1;
+          activity();
+          try {
+            if (cmsHosts.has(url.hostname)) {
+              counts.api += 1;
+              const response = await fetch(job.api_base + url.pathname + url.search, { method: init.method || 'GET' });
+              const body = await response.arrayBuffer();
+              counts.api_bytes += body.byteLength;
+              return new Response(body, { status: response.status, headers: response.headers });
+            }
+            counts.other += 1;
+            return new Response('', { status: 503 });
+          } finally {
+            inflight -= 1;
+            activity();
+          }
+        };
+        window.matchMedia = window.matchMedia || (() => ({
+          matches: false, addListener() {}, removeListener() {}, addEventListener() {}, removeEventListener() {}
+        }));
+        window.IntersectionObserver = window.IntersectionObserver || class {
+          constructor(callback) { this.callback = callback; }
+          observe(target) { this.callback([{ target, isIntersecting: true, intersectionRatio: 1 }], this); }
+          unobserve() {}
+          disconnect() {}
+        };
+        window.addEventListener('error', event => errors.push(String(event.message)));
+      }
+    });
+
+    const finish = () => {
+      if (finished) return;
+      finished = true;
+      clearTimeout(idleTimer);
+      clearTimeout(deadline);
+      const document = dom.window.document;
+      const images = new Set();
+      for (const img of document.querySelectorAll('img[src]')) {
+        const src = img.getAttribute('src');
+        if (/^(https?:)?\/\//.test(src)) images.add(src);
+      }
+      const result = {
+        render_ms: Math.round(lastActivity * 100) / 100,
+        load_ms: loadMs,
+        timed_out: inflight > 0 || !loaded,
+        requests: counts,
+        images: images.size,
+        dom_nodes: document.getElementsByTagName('*').length,
+        errors
+      };
+      dom.window.close();
+      resolve(result);
+    };
+    const deadline = setTimeout(finish, job.timeout_ms);
+
+    dom.window.addEventListener('load', () => {
+      loadMs = Math.round((performance.now() - start) * 100) / 100;
+      loaded = true;
+      activity();
+    });
+  });
+}
+
+const results = {};
+for (const page of job.pages) {
+  const runs = [];
+  for (let i = 0; i < job.runs; i++) runs.push(await renderOnce(page));
+  const last = runs[runs.length - 1];
+  results[page.id] = {
+    runs: runs.length,
+    render_ms_median: median(runs.map(r => r.render_ms)),
+    render_ms_min: Math.min(...runs.map(r => r.render_ms)),
+    render_ms_max: Math.max(...runs.map(r => r.render_ms)),
+    load_ms_median: median(runs.map(r => r.load_ms).filter(v => v !== null)),
+    timed_out: runs.some(r => r.timed_out),
+    requests: last.requests,
+    images: last.images,
+    dom_nodes: last.dom_nodes,
+    errors: [...new Set(runs.flatMap(r => r.errors))]
+  };
+}
+process.stdout.write(JSON.stringify({ pages: results, jsdom: require('jsdom/package.json').version }));
+"""
+
+
+def render_page(body, stylesheets=()):
+    """Benchmark page: global CSS/JS from the CDN path, extra stylesheets, then the widget."""
+    links = "".join(f'<link rel="stylesheet" href="{href}">' for href in stylesheets)
+    return (
+        "<!DOCTYPE html><html><head><meta charset=\"utf-8\">"
+        f'<link rel="stylesheet" href="{CDN_BASE}{GLOBAL_CSS.as_posix()}">{links}'
+        f'<script src="{CDN_BASE}{GLOBAL_JS.as_posix()}"></script>'
+        f"</head><body>{body}</body></html>"
+    )
+
+
+def run_render(pages, local, runs, cms_latency_ms=0, settle_ms=50, timeout_ms=10000):
+    """Render pages under node/jsdom against the mock CMS; returns (results, skipped_reason)."""
+    if not shutil.which("node"):
+        return {}, "node is not on PATH"
+
+    cms = MockCMS(latency_ms=cms_latency_ms)
+    api_base = cms.start()
+    job = {
+        "pages": pages,
+        "local": local,
+        "runs": runs,
+        "settle_ms": settle_ms,
+        "timeout_ms": timeout_ms,
+        "api_base": api_base,
+        "cms_hosts": sorted(CMS_HOSTS),
+    }
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            script = Path(tmp) / "render.mjs"
+            script.write_text(RENDER_SCRIPT, encoding="utf-8")
+            proc = subprocess.run(
+                ["node", str(script)], input=json.dumps(job), capture_output=True, text=True, cwd=Path.cwd()
+            )
+    finally:
+        cms.stop()
+
+    if proc.returncode != 0:
+        return {}, f"render failed: {proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else proc.returncode}"
+    output = json.loads(proc.stdout)
+    if "skipped" in output:
+        return {}, output["skipped"]
+    return output, None
+
+
+# ===== REPORT =====
+
+def assets_version():
+    """util-ghl-assets@ ref of the working tree (commit hash, plus -dirty when modified)."""
+    try:
+        commit = subprocess.check_output(["git", "rev-parse", "HEAD"], text=True, stderr=subprocess.DEVNULL).strip()
+        dirty = subprocess.check_output(["git", "status", "--porcelain", "--untracked-files=no"], text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return commit + ("-dirty" if dirty else "")
+
+
+def compare_results(old, new):
+    """Lines describing metrics that got worse between two result files."""
+    regressions = []
+    checks = [
+        ("gzip_bytes", 0.0),
+        ("min_gzip_bytes", 0.0),
+        ("transfer_gzip_bytes", 0.0),
+        ("external_requests", 0.0),
+        ("inline_scripts", 0.0),
+        ("inline_styles", 0.0),
+    ]
+    for section, key in (("widgets", "file"), ("shortcodes", "shortcode")):
+        before = {entry[key]: entry for entry in old.get(section, [])}
+        for entry in new.get(section, []):
+            prev = before.get(entry[key])
+            if not prev:
+                continue
+            for metric, tolerance in checks:
+                if metric in entry and metric in prev and entry[metric] > prev[metric] * (1 + tolerance):
+                    regressions.append(f"{entry[key]}: {metric} {prev[metric]} -> {entry[metric]}")
+            now_ms = (entry.get("render") or {}).get("render_ms_median")
+            was_ms = (prev.get("render") or {}).get("render_ms_median")
+            if now_ms is not None and was_ms and now_ms > was_ms * (1 + RENDER_NOISE):
+                regressions.append(f"{entry[key]}: render_ms_median {was_ms} -> {now_ms}")
+            now_api = ((entry.get("render") or {}).get("requests") or {}).get("api")
+            was_api = ((prev.get("render") or {}).get("requests") or {}).get("api")
+            if now_api is not None and was_api is not None and now_api > was_api:
+                regressions.append(f"{entry[key]}: api requests {was_api} -> {now_api}")
+    return regressions
+
+
+def print_summary(results):
+    """Compact per-widget table."""
+    print(f"\n{'widget / shortcode':<48} {'gzip':>7} {'ext req':>7} {'inl js':>6} {'inl css':>7} {'render ms':>9} {'api':>4}")
+    for entry in results["widgets"] + results["shortcodes"]:
+        name = entry.get("file") if "shortcode" not in entry else f"[{entry['shortcode']}]"
+        gz = entry.get("min_gzip_bytes", entry.get("transfer_gzip_bytes"))
+        render = entry.get("render") or {}
+        render_ms = render.get("render_ms_median")
+        api = (render.get("requests") or {}).get("api")
+        print(
+            f"{name:<48} {gz:>7} {entry['external_requests']:>7} {entry['inline_scripts']:>6} "
+            f"{entry['inline_styles']:>7} {render_ms if render_ms is not None else '-':>9} "
+            f"{api if api is not None else '-':>4}"
+        )
+
+
+def parse_args(argv=None):
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="Benchmark Carolina Panorama widgets and generated shortcodes.")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help=f"Results file (default {DEFAULT_OUTPUT})")
+    parser.add_argument("--runs", type=int, default=3, help="Headless renders per page (median is reported)")
+    parser.add_argument("--only", help="Only benchmark widgets/shortcodes whose path or name contains this")
+    parser.add_argument("--no-render", action="store_true", help="Skip headless render timing")
+    parser.add_argument("--cms-latency-ms", type=float, default=0, help="Latency the mock CMS adds to every API call")
+    parser.add_argument("--compare", type=Path, help="Previous results file; report regressions against it")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Benchmark every widget and shortcode and write the JSON results."""
+    args = parse_args(argv)
+
+    widget_paths = sorted(
+        p for p in SOURCE_DIR.rglob("*.html") if p.relative_to(SOURCE_DIR).parts[0] not in SKIP_WIDGET_DIRS
+    )
+    shortcode_entries = json.loads(SHORTCODES_MANIFEST.read_text(encoding="utf-8"))["shortcodes"]
+    if args.only:
+        widget_paths = [p for p in widget_paths if args.only in p.as_posix()]
+        shortcode_entries = [e for e in shortcode_entries if args.only.replace("-", "_") in e["shortcode"]]
+
+    local = {
+        CDN_BASE + GLOBAL_JS.as_posix(): str(GLOBAL_JS),
+        CDN_BASE + GLOBAL_CSS.as_posix(): str(GLOBAL_CSS),
+    }
+    widgets, shortcodes, pages = [], [], []
+    for path in widget_paths:
+        result, html = benchmark_widget(path)
+        widgets.append(result)
+        pages.append({"id": "widget:" + result["file"], "html": render_page(html)})
+
+    for entry in shortcode_entries:
+        result, markup, styles = benchmark_shortcode(entry)
+        shortcodes.append(result)
+        hrefs = []
+        for css_file in styles:
+            href = "https://www.carolinapanorama.org/wp-content/themes/carolina-panorama/" + css_file
+            local[href] = css_file
+            hrefs.append(href)
+        pages.append({"id": "shortcode:" + result["shortcode"], "html": render_page(markup, hrefs)})
+
+    render_skipped = "--no-render" if args.no_render else None
+    render = {}
+    if not args.no_render:
+        print(f"Rendering {len(pages)} pages x{args.runs} under jsdom against the mock CMS...")
+        render, render_skipped = run_render(pages, local, args.runs, cms_latency_ms=args.cms_latency_ms)
+    for result in widgets:
+        result["render"] = render.get("pages", {}).get("widget:" + result["file"])
+    for result in shortcodes:
+        result["render"] = render.get("pages", {}).get("shortcode:" + result["shortcode"])
+
+    results = {
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "assets_version": assets_version(),
+        "render": {
+            "jsdom": render.get("jsdom"),
+            "runs": args.runs,
+            "cms_latency_ms": args.cms_latency_ms,
+            "skipped": render_skipped,
+        },
+        "global_assets": {
+            GLOBAL_JS.as_posix(): byte_sizes(GLOBAL_JS.read_text(encoding="utf-8")),
+            GLOBAL_CSS.as_posix(): byte_sizes(GLOBAL_CSS.read_text(encoding="utf-8")),
+        },
+        "widgets": widgets,
+        "shortcodes": shortcodes,
+    }
+    args.output.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+
+    print_summary(results)
+    if render_skipped:
+        print(f"\nRender timing skipped: {render_skipped}")
+    print(f"\nWrote {args.output}")
+
+    if args.compare:
+        regressions = compare_results(json.loads(args.compare.read_text(encoding="utf-8")), results)
+        print(f"\n{len(regressions)} regression(s) vs {args.compare}")
+        for line in regressions:
+            print(f"  - {line}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
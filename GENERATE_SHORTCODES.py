@@ -1,15 +1,110 @@
 #!/usr/bin/env python3
 """
 WordPress Widget Shortcode Generator
-Generates PHP shortcode wrapper boilerplate for all Carolina Panorama widgets.
+Generates PHP shortcode handlers for all Carolina Panorama widgets listed in
+WORDPRESS_MIGRATION_MANIFEST.json, splicing each widget's real markup and scripts
+from site-assets/ into the PHP. Widget <style> blocks are moved into enqueued,
+cacheable stylesheets under css/ (rules used by several widgets go to one shared file).
+Third-party libraries (Algolia, Quill) become registered handles, loaded only by the
+shortcodes that use them.
 Output: PHP files ready to be included in WordPress theme functions.php or custom plugin.
+
+Usage:
+    python3 GENERATE_SHORTCODES.py                # regenerate everything
+    python3 GENERATE_SHORTCODES.py --incremental  # only outputs whose inputs changed
+    python3 GENERATE_SHORTCODES.py --ssr          # server-render widgets that support it
+
+Unchanged outputs are never rewritten, so their mtime (and filemtime() cache busting) is stable.
 """
 
+import argparse
+import hashlib
 import json
 import os
+import re
+from collections import Counter
 from pathlib import Path
 
-# Widget manifest (simplified version for script generation)
+# Bump whenever the PHP templates below change so incremental builds regenerate
+GENERATOR_VERSION = "4"
+
+# Source of truth for which widgets exist
+MANIFEST_PATH = Path("WORDPRESS_MIGRATION_MANIFEST.json")
+
+# Widget HTML sources live under this directory (WIDGETS[*]["file"] is relative to it)
+SOURCE_DIR = Path("site-assets")
+
+# Build state (input hashes per output file), kept next to the generated files
+BUILD_STATE_FILE = ".build-state.json"
+
+# Generated stylesheets, relative to the output dir (copy to the theme's css/ directory)
+CSS_DIR = "css"
+SHARED_CSS_FILE = "cp-widgets-shared.css"
+SHARED_CSS_HANDLE = "cp-widgets-shared"
+
+# Manifest/WIDGETS dependency names (see dependency_key) that map to handles registered
+# by the theme. Anything else (e.g. "YouTube API") is loaded by the widget markup itself.
+DEPENDENCY_HANDLES = {
+    "carolina-panorama-global.js": "cp-global-js",
+    "shared-article-card-styles.css": "cp-article-card-styles",
+    "instantsearch.js": "instantsearch-js",
+    "instantsearch.css": "algolia-instantsearch-css",
+    "quill.js": "quill-js",
+}
+
+# Third-party libraries: registered on every page, loaded only by shortcodes that need them.
+# Widget <script src>/<link> tags pointing at a "src" below are replaced in place with
+# wp_print_scripts()/wp_print_styles() for the handle, so each loads once per page.
+# "strategy" is WordPress' defer/async loading strategy; None keeps a blocking script
+# (Quill: the content form calls new Quill() inline, right after the tag).
+EXTERNAL_LIBRARIES = {
+    "algolia-instantsearch-css": {
+        "type": "style",
+        "src": "https://cdn.jsdelivr.net/npm/instantsearch.css@7.4.5/themes/satellite-min.css",
+        "ver": "7.4.5",
+    },
+    "algoliasearch-lite-js": {
+        "type": "script",
+        "src": "https://cdn.jsdelivr.net/npm/algoliasearch@4.14.2/dist/algoliasearch-lite.umd.js",
+        "ver": "4.14.2",
+        "strategy": "defer",
+    },
+    "instantsearch-js": {
+        "type": "script",
+        "src": "https://cdn.jsdelivr.net/npm/instantsearch.js@4.49.1/dist/instantsearch.production.min.js",
+        "ver": "4.49.1",
+        "deps": ["algoliasearch-lite-js"],
+        "strategy": "defer",
+    },
+    "quill-snow-css": {
+        "type": "style",
+        "src": "https://cdn.quilljs.com/1.3.6/quill.snow.css",
+        "ver": "1.3.6",
+    },
+    "quill-js": {
+        "type": "script",
+        "src": "https://cdn.quilljs.com/1.3.6/quill.min.js",
+        "ver": "1.3.6",
+        "strategy": None,
+    },
+}
+
+LIBRARY_TAG_RE = re.compile(
+    r"""<script\b[^>]*\bsrc\s*=\s*["']([^"']+)["'][^>]*>\s*</script\s*>"""
+    r"""|<link\b[^>]*\bhref\s*=\s*["']([^"']+)["'][^>]*>""",
+    re.I,
+)
+
+STYLE_BLOCK_RE = re.compile(r"<style\b[^>]*>(.*?)</style>", re.S | re.I)
+CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+
+# Widgets mark the placeholder markup that SSR replaces with server-rendered cards
+SSR_REGION_RE = re.compile(
+    r"[ \t]*<!-- cp-ssr:begin -->[ \t]*\n(.*?)[ \t]*<!-- cp-ssr:end -->[ \t]*\n", re.S
+)
+SSR_HELPERS_FILE = "ssr-helpers.php"
+
+# Per-widget overrides (title, shortcode attrs, deps) layered over WORDPRESS_MIGRATION_MANIFEST.json
 WIDGETS = [
     {
         "name": "article_detail",
@@ -43,6 +138,18 @@ WIDGETS = [
         "attrs": [],
         "js_deps": ["carolina-panorama-global.js"],
         "css": ["shared-article-card-styles.css"],
+        # --ssr: PHP fetch from this CMS endpoint, rendered by this ssr-helpers.php function
+        "ssr": {"endpoint": "/api/public/headlines", "renderer": "cp_ssr_render_headlines_grid"},
+    },
+    {
+        "name": "trending_carousel",
+        "title": "Trending Carousel Widget v2",
+        "file": "site-home-widgets/trending-carousel-v2.html",
+        "shortcode": "cp_trending_carousel",
+        "attrs": [],
+        "js_deps": ["carolina-panorama-global.js"],
+        "css": ["shared-article-card-styles.css"],
+        "ssr": {"endpoint": "/api/public/trending", "renderer": "cp_ssr_render_trending_carousel"},
     },
     {
         "name": "category_grid",
@@ -65,10 +172,202 @@ WIDGETS = [
 ]
 
 
-def generate_shortcode_php(widget):
-    """Generate PHP shortcode handler for a widget."""
+def widget_name_from_file(widget_file):
+    """Derive a widget name from its source path, e.g. "headlines-grid-v2.html" -> "headlines_grid"."""
+    stem = Path(widget_file).stem
+    stem = re.sub(r"(-widget|-v\d+)+$", "", stem)
+    return stem.replace("-", "_")
+
+
+def dependency_key(dep):
+    """Normalize a manifest dependency name, e.g. "Quill.js (rich text editor)" -> "quill.js"."""
+    return re.sub(r"\s*\(.*?\)", "", dep).strip().lower()
+
+
+def load_widgets(manifest_path=MANIFEST_PATH):
+    """Build the widget list from the migration manifest, applying WIDGETS overrides."""
+    with open(manifest_path) as f:
+        manifest = json.load(f)
+
+    overrides = {w["file"]: w for w in WIDGETS}
+    widgets = []
+    for entry in manifest.get("widgets", []):
+        name = widget_name_from_file(entry["file"])
+        deps = [dependency_key(d) for d in entry.get("dependencies") or []]
+        widget = {
+            "name": name,
+            "title": entry["name"],
+            "file": entry["file"],
+            "shortcode": f"cp_{name}",
+            "attrs": [],
+            "js_deps": [d for d in deps if d.endswith(".js")],
+            "css": [d for d in deps if d.endswith(".css")],
+        }
+        widget.update(overrides.pop(entry["file"], {}))
+        widgets.append(widget)
+
+    # Overrides for widgets the manifest doesn't (yet) list
+    widgets.extend(overrides.values())
+    return widgets
+
+
+def split_widget_html(html):
+    """Split widget HTML into its <style> contents and the remaining markup/scripts (in order)."""
+    styles = [m.group(1).strip() for m in STYLE_BLOCK_RE.finditer(html)]
+    body = STYLE_BLOCK_RE.sub("", html)
+    body = re.sub(r"\n\s*\n(\s*\n)+", "\n\n", body).strip()
+    return styles, body
+
+
+def split_css_rules(css):
+    """Split a stylesheet into normalized top-level rules.
+
+    At-rule blocks (@media, @keyframes, ...) are kept whole so they can be compared
+    as a unit; whitespace is collapsed so formatting differences don't defeat dedupe.
+    """
+    css = CSS_COMMENT_RE.sub("", css)
+    rules = []
+    depth = 0
+    start = 0
+    for i, ch in enumerate(css):
+        if ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth = max(depth - 1, 0)
+            if depth == 0:
+                rules.append(css[start:i + 1])
+                start = i + 1
+        elif ch == ";" and depth == 0:
+            # Statement at-rules such as @import / @charset
+            rules.append(css[start:i + 1])
+            start = i + 1
+
+    normalized = (re.sub(r"\s+", " ", rule).strip() for rule in rules)
+    return [rule for rule in normalized if rule]
+
+
+def partition_css(widget_styles):
+    """Split per-widget CSS into rules shared by 2+ widgets and rules unique to each widget.
+
+    widget_styles: {widget_name: [css_block, ...]}
+    Returns (shared_rules, {widget_name: own_rules}); rule order follows first appearance.
+    """
+    per_widget = {}
+    counts = Counter()
+    for name, blocks in widget_styles.items():
+        rules = list(dict.fromkeys(rule for block in blocks for rule in split_css_rules(block)))
+        per_widget[name] = rules
+        counts.update(rules)
+
+    all_rules = dict.fromkeys(rule for rules in per_widget.values() for rule in rules)
+    shared = [rule for rule in all_rules if counts[rule] > 1]
+    shared_set = set(shared)
+    own = {name: [rule for rule in rules if rule not in shared_set] for name, rules in per_widget.items()}
+    return shared, own
+
+
+def extract_library_tags(body):
+    """Replace <script>/<link> tags for EXTERNAL_LIBRARIES with in-place WordPress prints.
+
+    Returns (body, handles) with handles in order of appearance. Printing through
+    WordPress dedupes libraries shared by several widgets on one page and applies the
+    registered loading strategy; tags for unknown URLs are left alone.
+    """
+    by_src = {lib["src"]: handle for handle, lib in EXTERNAL_LIBRARIES.items()}
+    handles = []
+
+    def replace(match):
+        handle = by_src.get(match.group(1) or match.group(2))
+        if handle is None:
+            return match.group(0)
+        handles.append(handle)
+        printer = "wp_print_scripts" if EXTERNAL_LIBRARIES[handle]["type"] == "script" else "wp_print_styles"
+        return f"<?php {printer}( '{handle}' ); ?>"
+
+    return LIBRARY_TAG_RE.sub(replace, body), list(dict.fromkeys(handles))
+
+
+def widget_library_handles(widget):
+    """EXTERNAL_LIBRARIES handles a widget needs: declared deps plus tags found in its markup."""
+    declared = [
+        DEPENDENCY_HANDLES[dep] for dep in widget["js_deps"] + widget["css"]
+        if DEPENDENCY_HANDLES.get(dep) in EXTERNAL_LIBRARIES
+    ]
+    return list(dict.fromkeys(declared + widget.get("printed_libraries", [])))
+
+
+def generate_library_registration_php():
+    """Generate cp_register_external_libs(): registers (never enqueues) EXTERNAL_LIBRARIES."""
+    lines = ""
+    for handle, lib in EXTERNAL_LIBRARIES.items():
+        deps_php = "[ " + ", ".join(f"'{d}'" for d in lib.get("deps", [])) + " ]" if lib.get("deps") else "[]"
+        if lib["type"] == "style":
+            lines += f"    wp_register_style( '{handle}', '{lib['src']}', {deps_php}, '{lib['ver']}' );\n"
+        else:
+            args = "'in_footer' => true"
+            if lib.get("strategy"):
+                args += f", 'strategy' => '{lib['strategy']}'"
+            lines += (
+                f"    wp_register_script( '{handle}', '{lib['src']}', {deps_php}, '{lib['ver']}', [ {args} ] );\n"
+            )
+    return f"""// External libraries (Algolia, Quill): registered everywhere, loaded only by the shortcodes using them
+function cp_register_external_libs() {{
+{lines}}}
+add_action( 'wp_enqueue_scripts', 'cp_register_external_libs', 5 );
+"""
+
+
+def render_css(rules, source):
+    """Render a list of rules as a stylesheet with a provenance header."""
+    header = f"/* Auto-generated by GENERATE_SHORTCODES.py from {source} - do not edit */\n"
+    return header + "\n".join(rules) + "\n"
+
+
+def widget_style_handle(widget):
+    """WordPress style handle for a widget's own stylesheet."""
+    return "cp-widget-" + widget["name"].replace("_", "-")
+
+
+def widget_css_file(widget):
+    """Path of a widget's own stylesheet, relative to the output dir."""
+    return f"{CSS_DIR}/widgets/{widget['name']}.css"
+
+
+def php_literal(html):
+    """Make HTML safe to emit between ?> and <?php (no accidental PHP open tags)."""
+    return html.replace("<?", "<?php echo '<?'; ?>")
+
+
+def apply_ssr_region(body, renderer):
+    """Replace the widget's cp-ssr region with a server-rendered branch (placeholder kept as fallback)."""
+
+    def replace(match):
+        return (
+            "<?php if ( $cp_ssr_articles ) : ?>\n"
+            f"<?php echo {renderer}( $cp_ssr_articles ); ?>\n"
+            "<?php else : ?>\n"
+            f"{match.group(1)}"
+            "<?php endif; ?>\n"
+        )
+
+    return SSR_REGION_RE.sub(replace, body)
+
+
+def strip_ssr_markers(body):
+    """Drop the cp-ssr marker comments, keeping the placeholder markup."""
+    return SSR_REGION_RE.sub(lambda m: m.group(1), body)
+
+
+def generate_shortcode_php(widget, body=None, style_handles=(), ssr=False):
+    """Generate PHP shortcode handler for a widget.
+
+    body is the widget's markup and scripts (styles already extracted); when None
+    (source HTML missing) a loading placeholder is emitted instead. With ssr=True,
+    widgets that have an "ssr" config fetch their articles in PHP (transient-cached,
+    see ssr-helpers.php) and render the cards server-side; the widget JS sees
+    data-cp-ssr on the wrapper and skips its own fetch.
+    """
     shortcode_name = widget["shortcode"].replace("cp_", "")
-    php_class_name = "".join(word.capitalize() for word in shortcode_name.split("_"))
 
     # Build attributes array
     attrs_php = ""
@@ -79,19 +378,23 @@ def generate_shortcode_php(widget):
             default = attr.get("default", "''")
             attrs_php += f"        '{attr['name']}' => {default},\n"
         attrs_php += "    ];\n"
-        attrs_php += "    $atts = shortcode_atts( $defaults, $atts, '{widget['shortcode']}' );\n\n"
+        attrs_php += f"    $atts = shortcode_atts( $defaults, $atts, '{widget['shortcode']}' );\n\n"
 
-    # Build JS/CSS enqueue
+    # Build JS/CSS enqueue (only handles the theme actually registers; libraries the
+    # markup prints in place are not enqueued again)
+    printed = set(widget.get("printed_libraries", []))
     enqueue_code = ""
     for js in widget["js_deps"]:
-        js_handle = js.replace(".js", "").replace("-", "_")
-        enqueue_code += f"    wp_enqueue_script( '{js_handle}' );\n"
+        if js in DEPENDENCY_HANDLES and DEPENDENCY_HANDLES[js] not in printed:
+            enqueue_code += f"    wp_enqueue_script( '{DEPENDENCY_HANDLES[js]}' );\n"
     for css in widget["css"]:
-        css_handle = css.replace(".css", "").replace("-", "_")
-        enqueue_code += f"    wp_enqueue_style( '{css_handle}' );\n"
+        if css in DEPENDENCY_HANDLES and DEPENDENCY_HANDLES[css] not in printed:
+            enqueue_code += f"    wp_enqueue_style( '{DEPENDENCY_HANDLES[css]}' );\n"
+    for handle in style_handles:
+        enqueue_code += f"    wp_enqueue_style( '{handle}' );\n"
 
     # Sanitize shortcode attrs for safe JS
-    sanitize_code = ""
+    sanitize_code = "    $data_attrs = '';\n\n"
     if widget["attrs"]:
         sanitize_code = "    // Pass attributes to JavaScript via data attributes\n"
         sanitize_code += "    $data_attrs = '';\n"
@@ -101,36 +404,42 @@ def generate_shortcode_php(widget):
             sanitize_code += "    }\n"
         sanitize_code += "\n"
 
+    ssr_config = widget.get("ssr") if ssr else None
+    ssr_code = ""
+    if ssr_config and body is not None:
+        ssr_code = "    // Server-side render: cached CMS response (falls back to client fetch on failure)\n"
+        ssr_code += f"    $cp_ssr_articles = cp_ssr_fetch( '{ssr_config['endpoint']}' );\n"
+        ssr_code += "    if ( $cp_ssr_articles ) {\n"
+        ssr_code += "        $data_attrs .= ' data-cp-ssr=\"1\"';\n"
+        ssr_code += "    }\n\n"
+
+    if body is None:
+        widget_html = f'''<div id="cp-{shortcode_name}-container">
+    <p style="color: #999;">Loading {widget['title']}...</p>
+</div>'''
+    elif ssr_config:
+        widget_html = apply_ssr_region(extract_library_tags(php_literal(body))[0], ssr_config["renderer"])
+    else:
+        widget_html = strip_ssr_markers(extract_library_tags(php_literal(body))[0])
+
     php_template = f'''<?php
 /**
  * Shortcode: {widget['shortcode']}
  * Widget: {widget['title']}
- * Auto-generated from WORDPRESS_MIGRATION_MANIFEST.json
+ * Source: site-assets/{widget['file']}
+ * Auto-generated from WORDPRESS_MIGRATION_MANIFEST.json by GENERATE_SHORTCODES.py
  */
 
 function cp_shortcode_{shortcode_name}( $atts = [], $content = null, $tag = '' ) {{
     // Enqueue dependencies
 {enqueue_code}
     
-{attrs_php}{sanitize_code}    // Return the widget HTML
+{attrs_php}{sanitize_code}{ssr_code}    // Return the widget HTML
     ob_start();
     ?>
-    <div class="cp-widget-wrapper cp-widget-{shortcode_name}"{{ $data_attrs }}>
-        <div id="cp-{shortcode_name}-container">
-            <p style="color: #999;">Loading {widget['title']}...</p>
-        </div>
-    </div>
-    <script>
-        // TODO: Initialize widget with $atts data
-        // Example: fetch from API using window.CarolinaPanorama utilities
-        (function() {{
-            var container = document.getElementById('cp-{shortcode_name}-container');
-            if (!container) return;
-            
-            // Replace this with actual widget initialization logic
-            console.log('Widget {shortcode_name} initialized with:', {{}});
-        }})();
-    </script>
+<div class="cp-widget-wrapper cp-widget-{shortcode_name}"<?php echo $data_attrs; ?>>
+{widget_html}
+</div>
     <?php
     return ob_get_clean();
 }}
@@ -142,7 +451,311 @@ add_shortcode( '{widget['shortcode']}', 'cp_shortcode_{shortcode_name}' );
     return php_template
 
 
-def generate_functions_php():
+def generate_widget_styles_php(widgets, style_files):
+    """Generate registration/enqueue code for the extracted widget stylesheets.
+
+    style_files: {handle: (relative_path, content_hash, deps)}
+    Styles are registered once with a content-hash version so browsers/CDNs can cache
+    them long-term, and enqueued in <head> for shortcodes found in the current post
+    (shortcodes also enqueue them on render as a fallback for widgets/templates).
+    Library stylesheets the shortcodes use (EXTERNAL_LIBRARIES) are enqueued the same way.
+    """
+    register_lines = ""
+    for handle, (path, version, deps) in style_files.items():
+        deps_php = "[ " + ", ".join(f"'{d}'" for d in deps) + " ]" if deps else "[]"
+        register_lines += (
+            f"    wp_register_style( '{handle}', $theme_uri . '/{path}', {deps_php}, '{version}' );\n"
+        )
+
+    shortcode_lines = ""
+    for widget in widgets:
+        handles = (widget.get("style_handles") or []) + [
+            handle for handle in widget_library_handles(widget) if EXTERNAL_LIBRARIES[handle]["type"] == "style"
+        ]
+        if handles:
+            handles_php = ", ".join(f"'{h}'" for h in handles)
+            shortcode_lines += f"        '{widget['shortcode']}' => [ {handles_php} ],\n"
+
+    return f'''
+// Widget stylesheets extracted from site-assets by GENERATE_SHORTCODES.py
+function cp_register_widget_styles() {{
+    $theme_uri = get_template_directory_uri();
+{register_lines}}}
+add_action( 'wp_enqueue_scripts', 'cp_register_widget_styles', 5 );
+
+// Enqueue widget styles in <head> when the current post uses their shortcode
+function cp_enqueue_shortcode_styles() {{
+    $post = get_post();
+    if ( ! is_singular() || ! $post ) {{
+        return;
+    }}
+
+    $shortcode_styles = [
+{shortcode_lines}    ];
+    foreach ( $shortcode_styles as $shortcode => $handles ) {{
+        if ( has_shortcode( $post->post_content, $shortcode ) ) {{
+            array_map( 'wp_enqueue_style', $handles );
+        }}
+    }}
+}}
+add_action( 'wp_enqueue_scripts', 'cp_enqueue_shortcode_styles', 20 );
+'''
+
+
+def generate_ssr_helpers_php():
+    """Generate ssr-helpers.php: transient-cached CMS fetches and server-side card renderers."""
+    return """<?php
+/**
+ * Server-side rendering helpers for Carolina Panorama shortcodes
+ * Auto-generated by GENERATE_SHORTCODES.py --ssr
+ *
+ * CMS responses are cached in transients for `cp_ssr_cache_ttl` seconds (option,
+ * default 300; filterable per endpoint). Failed fetches are cached briefly so a
+ * CMS outage doesn't stall every page view - the widget JS then fetches instead.
+ */
+
+if ( ! defined( 'ABSPATH' ) ) {
+    exit;
+}
+
+define( 'CP_SSR_PLACEHOLDER_IMAGE', 'https://storage.googleapis.com/msgsndr/9Iv8kFcMiUgScXzMPv23/media/697bd8644d56831c95c3248d.svg' );
+
+// srcset widths requested from the LeadConnector resize proxy (same as CarolinaPanorama.IMAGE_WIDTHS)
+define( 'CP_SSR_IMAGE_WIDTHS', array( 320, 480, 640, 960, 1200 ) );
+
+// Image sizes per card slot (same as the widgets' JS)
+define( 'CP_SSR_SIZES_HEADLINES_FEATURED', '(max-width: 1024px) 100vw, 700px' );
+define( 'CP_SSR_SIZES_HEADLINES_SMALL', '(max-width: 640px) 100vw, (max-width: 1024px) 50vw, 350px' );
+define( 'CP_SSR_SIZES_TRENDING', '(max-width: 768px) 280px, 320px' );
+
+/**
+ * Fetch `data` from a CMS public endpoint, cached in a transient.
+ * Returns an array (empty on failure).
+ */
+function cp_ssr_fetch( $path, $query = array() ) {
+    $url = rtrim( get_option( 'cp_api_base_url', 'https://cms.carolinapanorama.org' ), '/' ) . $path;
+    if ( $query ) {
+        $url = add_query_arg( $query, $url );
+    }
+
+    $cache_key = 'cp_ssr_' . md5( $url );
+    $cached    = get_transient( $cache_key );
+    if ( false !== $cached ) {
+        return $cached;
+    }
+
+    $ttl      = (int) apply_filters( 'cp_ssr_cache_ttl', get_option( 'cp_ssr_cache_ttl', 300 ), $path );
+    $response = wp_remote_get( $url, array( 'timeout' => 5 ) );
+    $data     = array();
+
+    if ( ! is_wp_error( $response ) && 200 === wp_remote_retrieve_response_code( $response ) ) {
+        $json = json_decode( wp_remote_retrieve_body( $response ), true );
+        if ( ! empty( $json['success'] ) && ! empty( $json['data'] ) && is_array( $json['data'] ) ) {
+            $data = $json['data'];
+        }
+    }
+
+    // Negative-cache failures for a short time only
+    set_transient( $cache_key, $data, $data ? $ttl : min( $ttl, 60 ) );
+    return $data;
+}
+
+/**
+ * LeadConnector resize-proxy URL for an image (same as CarolinaPanorama.proxiedLeadConnectorUrl);
+ * only GHL storage URLs are proxied, anything else is returned unchanged.
+ */
+function cp_ssr_proxied_image_url( $url, $width ) {
+    if ( 'storage.googleapis.com' !== wp_parse_url( $url, PHP_URL_HOST ) ) {
+        return $url;
+    }
+    $url = preg_replace( '#^http://#i', 'https://', trim( $url ) );
+    if ( false !== strpos( $url, '%25' ) ) {
+        $decoded = rawurldecode( $url );
+        if ( preg_match( '#^https?://#i', $decoded ) ) {
+            $url = $decoded;
+        }
+    }
+
+    // encodeURI(): percent-encode everything except the URI syntax characters
+    $safe = strtr( rawurlencode( $url ), array(
+        '%3B' => ';', '%2C' => ',', '%2F' => '/', '%3F' => '?', '%3A' => ':', '%40' => '@',
+        '%26' => '&', '%3D' => '=', '%2B' => '+', '%24' => '$', '%21' => '!', '%2A' => '*',
+        '%27' => "'", '%28' => '(', '%29' => ')', '%23' => '#',
+    ) );
+    return 'https://images.leadconnectorhq.com/image/f_webp/q_80/r_' . (int) $width . '/u_' . $safe;
+}
+
+/**
+ * Responsive <img> (same markup as CarolinaPanorama.imageHtml): srcset/sizes through the
+ * resize proxy, eager + fetchpriority="high" only for the LCP candidate, lazy otherwise.
+ *
+ * $options: alt, class, sizes, priority (bool).
+ */
+function cp_ssr_image( $url, $options = array() ) {
+    $options = wp_parse_args( $options, array(
+        'alt'      => '',
+        'class'    => '',
+        'sizes'    => '100vw',
+        'priority' => false,
+    ) );
+
+    $src    = $url ? $url : CP_SSR_PLACEHOLDER_IMAGE;
+    $widths = CP_SSR_IMAGE_WIDTHS;
+    $srcset = array();
+    if ( ! preg_match( '/\\.svg(?:[?#]|$)/i', $src ) && cp_ssr_proxied_image_url( $src, 1 ) !== $src ) {
+        foreach ( $widths as $width ) {
+            $srcset[] = cp_ssr_proxied_image_url( $src, $width ) . ' ' . $width . 'w';
+        }
+        $src = cp_ssr_proxied_image_url( $src, max( $widths ) );
+    }
+
+    $html  = '<img src="' . esc_url( $src ) . '" alt="' . esc_attr( $options['alt'] ) . '"';
+    $html .= $options['priority'] ? ' loading="eager" fetchpriority="high"' : ' loading="lazy"';
+    $html .= ' decoding="async"';
+    if ( $srcset ) {
+        $html .= ' srcset="' . esc_attr( implode( ', ', $srcset ) ) . '" sizes="' . esc_attr( $options['sizes'] ) . '"';
+    }
+    if ( $options['class'] ) {
+        $html .= ' class="' . esc_attr( $options['class'] ) . '"';
+    }
+    return $html . '>';
+}
+
+/**
+ * Inline style for a category tag (same colors as CarolinaPanorama.getCategoryStyle).
+ */
+function cp_ssr_category_style( $category_name ) {
+    static $colors = null;
+    if ( null === $colors ) {
+        $colors = array();
+        foreach ( cp_ssr_fetch( '/api/public/categories' ) as $category ) {
+            if ( ! empty( $category['name'] ) && ! empty( $category['color_code'] ) ) {
+                $colors[ strtolower( trim( $category['name'] ) ) ] = $category['color_code'];
+            }
+        }
+    }
+    $key   = strtolower( trim( $category_name ) );
+    $color = isset( $colors[ $key ] ) ? $colors[ $key ] : '#3b82f6';
+    return 'background-color: ' . $color . ' !important;';
+}
+
+/**
+ * Render one cp-article-card (markup matches the widget JS).
+ *
+ * $options: variant (featured|medium|small), heading (h2|h3), index (data-article-index),
+ * max_tags, description (bool), sizes (img sizes), priority (bool: LCP candidate).
+ */
+function cp_ssr_article_card( $article, $options = array() ) {
+    $options = wp_parse_args( $options, array(
+        'variant'     => 'small',
+        'heading'     => 'h3',
+        'index'       => null,
+        'max_tags'    => 2,
+        'description' => false,
+        'sizes'       => '100vw',
+        'priority'    => false,
+    ) );
+
+    $title      = isset( $article['title'] ) ? $article['title'] : '';
+    $image      = ! empty( $article['featured_image'] ) ? $article['featured_image'] : '';
+    $image_alt  = ! empty( $article['featured_image_alt'] ) ? $article['featured_image_alt'] : $title;
+    $author     = ! empty( $article['author']['name'] ) ? $article['author']['name'] : 'Carolina Panorama';
+    $date       = ! empty( $article['publish_date'] ) ? date_i18n( 'M j, Y', strtotime( $article['publish_date'] ) ) : '';
+    $categories = ! empty( $article['categories'] ) ? array_slice( $article['categories'], 0, $options['max_tags'] ) : array();
+
+    $tags = '';
+    foreach ( $categories as $category ) {
+        $name  = is_array( $category ) ? $category['name'] : $category;
+        $tags .= sprintf(
+            '<span class="cp-article-tag %s" style="%s">%s</span>',
+            esc_attr( sanitize_title( $name ) ),
+            esc_attr( cp_ssr_category_style( $name ) ),
+            esc_html( $name )
+        );
+    }
+
+    $html  = '<article class="cp-article-card cp-article-card-' . esc_attr( $options['variant'] ) . '">';
+    $html .= '<a href="' . esc_url( isset( $article['url'] ) ? $article['url'] : '#' ) . '" class="cp-article-card-link"';
+    if ( null !== $options['index'] ) {
+        $html .= ' data-article-index="' . (int) $options['index'] . '"';
+    }
+    $html .= '>';
+    $html .= cp_ssr_image( $image, array(
+        'alt'      => $image_alt,
+        'class'    => 'cp-article-image',
+        'sizes'    => $options['sizes'],
+        'priority' => $options['priority'],
+    ) );
+    $html .= '<div class="cp-article-content">';
+    $html .= '<div class="cp-article-tags">' . $tags . '</div>';
+    $html .= '<' . $options['heading'] . ' class="cp-article-title">' . esc_html( $title ) . '</' . $options['heading'] . '>';
+    $html .= '<div class="cp-article-meta">';
+    $html .= '<span class="cp-article-author">' . esc_html( $author ) . '</span>';
+    $html .= '<span class="cp-article-date">' . esc_html( $date ) . '</span>';
+    $html .= '</div>';
+    if ( $options['description'] && ! empty( $article['excerpt'] ) ) {
+        $html .= '<p class="cp-article-description">' . esc_html( $article['excerpt'] ) . '</p>';
+    }
+    $html .= '</div></a></article>';
+    return $html;
+}
+
+/**
+ * Headlines grid: featured center card plus four small cards.
+ */
+function cp_ssr_render_headlines_grid( $articles ) {
+    $slots = array( 'headlines-left-top', 'headlines-left-bottom', 'headlines-right-top', 'headlines-right-bottom' );
+
+    $html  = '<div class="headlines-center"><span class="featured-badge">Featured</span>';
+    $html .= cp_ssr_article_card( $articles[0], array(
+        'variant'     => 'featured',
+        'heading'     => 'h2',
+        'index'       => 0,
+        'description' => true,
+        'sizes'       => CP_SSR_SIZES_HEADLINES_FEATURED,
+        'priority'    => true,
+    ) );
+    $html .= '</div>';
+
+    foreach ( $slots as $i => $slot ) {
+        if ( empty( $articles[ $i + 1 ] ) ) {
+            break;
+        }
+        $html .= '<div class="' . $slot . '">';
+        $html .= cp_ssr_article_card( $articles[ $i + 1 ], array(
+            'index' => $i + 1,
+            'sizes' => CP_SSR_SIZES_HEADLINES_SMALL,
+        ) );
+        $html .= '</div>';
+    }
+    return $html;
+}
+
+/**
+ * Trending carousel: one medium card per article, newest first.
+ */
+function cp_ssr_render_trending_carousel( $articles ) {
+    usort( $articles, function ( $a, $b ) {
+        return strtotime( isset( $b['publish_date'] ) ? $b['publish_date'] : '' )
+            - strtotime( isset( $a['publish_date'] ) ? $a['publish_date'] : '' );
+    } );
+
+    $html = '';
+    foreach ( $articles as $article ) {
+        $html .= '<div class="trending-carousel-item">';
+        $html .= cp_ssr_article_card( $article, array(
+            'variant'  => 'medium',
+            'max_tags' => 1,
+            'sizes'    => CP_SSR_SIZES_TRENDING,
+        ) );
+        $html .= '</div>';
+    }
+    return $html;
+}
+"""
+
+
+def generate_functions_php(widgets=(), style_files=None, ssr=False):
     """Generate enqueue code for functions.php."""
     enqueue_template = '''<?php
 /**
@@ -150,6 +763,19 @@ def generate_functions_php():
  * Auto-generated enqueue code for global assets and shortcodes
  */
 
+// Content hash of the global JS (telemetry version tag), recomputed only when the file changes
+function cp_global_js_version() {
+    $path   = get_template_directory() . '/js/carolina-panorama-global.js';
+    $mtime  = (int) @filemtime( $path );
+    $cached = get_transient( 'cp_global_js_version' );
+    if ( is_array( $cached ) && $cached['mtime'] === $mtime ) {
+        return $cached['hash'];
+    }
+    $hash = $mtime ? substr( md5_file( $path ), 0, 12 ) : '';
+    set_transient( 'cp_global_js_version', [ 'mtime' => $mtime, 'hash' => $hash ] );
+    return $hash;
+}
+
 // Enqueue global assets
 function cp_enqueue_global_assets() {
     // Global CSS
@@ -172,6 +798,9 @@ function cp_enqueue_global_assets() {
     // Optional: Set global API base URL (can override in child theme or settings)
     wp_localize_script( 'cp-global-js', 'CarolinaPanoramaConfig', [
         'apiBaseUrl' => get_option( 'cp_api_base_url', 'https://cms.carolinapanorama.org' ),
+        'homepageApiUrl' => is_front_page() ? get_option( 'cp_homepage_api_url', '' ) : '',
+        'telemetryUrl' => get_option( 'cp_telemetry_url', '' ),
+        'assetVersion' => cp_global_js_version(),
         'siteUrl' => site_url(),
     ]);
 }
@@ -187,73 +816,198 @@ function cp_enqueue_article_card_styles() {
     );
 }
 
-// External libraries (Algolia, YouTube, etc.)
-function cp_enqueue_external_libs() {
-    // Algolia InstantSearch CSS
-    wp_enqueue_style(
-        'algolia-instantsearch-css',
-        'https://cdn.jsdelivr.net/npm/instantsearch.css@7.4.5/themes/satellite-min.css',
-        [],
-        '7.4.5'
-    );
+'''
+    enqueue_template += generate_library_registration_php()
 
-    // Algolia InstantSearch JS
-    wp_enqueue_script(
-        'instantsearch-js',
-        'https://cdn.jsdelivr.net/npm/instantsearch.js@4.33.0/umd/index.umd.production.min.js',
-        [],
-        '4.33.0',
-        true
-    );
+    if style_files or any(widget_library_handles(w) for w in widgets):
+        enqueue_template += generate_widget_styles_php(widgets, style_files or {})
 
-    // Quill Rich Text Editor (for forms)
-    wp_enqueue_style(
-        'quill-snow-css',
-        'https://cdn.quilljs.com/1.3.6/quill.snow.css',
-        [],
-        '1.3.6'
-    );
+    enqueue_template += "\n// Include shortcode handlers\n"
+    if ssr:
+        enqueue_template += f"require_once get_template_directory() . '/inc/shortcodes/{SSR_HELPERS_FILE}';\n"
+    for widget in widgets:
+        enqueue_template += (
+            f"require_once get_template_directory() . '/inc/shortcodes/{widget['name']}.php';\n"
+        )
+    return enqueue_template
 
-    wp_enqueue_script(
-        'quill-js',
-        'https://cdn.quilljs.com/1.3.6/quill.min.js',
-        [],
-        '1.3.6',
-        true
-    );
-}
-add_action( 'wp_enqueue_scripts', 'cp_enqueue_external_libs' );
 
-// TODO: Include shortcode handlers
-// require_once get_template_directory() . '/inc/shortcodes/article-detail.php';
-// require_once get_template_directory() . '/inc/shortcodes/article-feed.php';
-// ... (add all shortcodes)
-'''
-    return enqueue_template
+def hash_inputs(*parts):
+    """Return a sha256 hex digest over the given str/bytes/JSON-able parts."""
+    digest = hashlib.sha256(GENERATOR_VERSION.encode("utf-8"))
+    for part in parts:
+        if isinstance(part, bytes):
+            data = part
+        elif isinstance(part, str):
+            data = part.encode("utf-8")
+        else:
+            data = json.dumps(part, sort_keys=True).encode("utf-8")
+        digest.update(len(data).to_bytes(8, "big"))
+        digest.update(data)
+    return digest.hexdigest()
 
 
-def main():
+def widget_input_hash(widget, source_dir=SOURCE_DIR, *extra):
+    """Hash everything a widget's PHP output depends on: its WIDGETS entry, source HTML and build flags."""
+    source_path = source_dir / widget["file"]
+    source = source_path.read_bytes() if source_path.exists() else b""
+    return hash_inputs(widget, source, *extra)
+
+
+def load_build_state(output_dir):
+    """Load the previous build state, or an empty one if missing/unreadable."""
+    state_path = output_dir / BUILD_STATE_FILE
+    try:
+        with open(state_path) as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return {"generator_version": GENERATOR_VERSION, "outputs": {}}
+    if state.get("generator_version") != GENERATOR_VERSION:
+        # Templates changed: every recorded hash is stale
+        return {"generator_version": GENERATOR_VERSION, "outputs": {}}
+    state.setdefault("outputs", {})
+    return state
+
+
+def save_build_state(output_dir, state):
+    """Persist the build state (only rewritten when it actually changed)."""
+    content = json.dumps(state, indent=2, sort_keys=True) + "\n"
+    write_if_changed(output_dir / BUILD_STATE_FILE, content)
+
+
+def write_if_changed(filepath, content):
+    """Write content to filepath unless the file already holds exactly that content.
+
+    Returns True if the file was written. Leaving identical files untouched keeps
+    their mtime stable, so filemtime()-based cache busting is not triggered.
+    """
+    data = content.encode("utf-8")
+    try:
+        if filepath.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    filepath.write_bytes(data)
+    return True
+
+
+def build_output(output_dir, state, filename, input_hash, render, incremental):
+    """Regenerate one output file if its inputs changed (or always when not incremental)."""
+    filepath = output_dir / filename
+    outputs = state["outputs"]
+
+    if incremental and outputs.get(filename) == input_hash and filepath.exists():
+        print(f"  - Unchanged {filename}")
+        return False
+
+    written = write_if_changed(filepath, render())
+    outputs[filename] = input_hash
+    print(f"  ✓ {'Created' if written else 'Up to date'} {filename}")
+    return written
+
+
+def parse_args(argv=None):
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="Generate WordPress shortcode wrappers for Carolina Panorama widgets.")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=f"Only regenerate outputs whose inputs changed (tracked in {BUILD_STATE_FILE})",
+    )
+    parser.add_argument(
+        "--ssr",
+        action="store_true",
+        help=f"Render widgets with an 'ssr' config server-side (requires {SSR_HELPERS_FILE})",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """Generate all shortcode PHP files."""
+    args = parse_args(argv)
     output_dir = Path("wordpress-migration/shortcodes")
     output_dir.mkdir(parents=True, exist_ok=True)
 
     print(f"Generating shortcode wrappers in: {output_dir}")
+    if args.incremental:
+        print(f"  (incremental: using {output_dir / BUILD_STATE_FILE})")
+    if args.ssr:
+        print(f"  (ssr: homepage widgets rendered server-side via {SSR_HELPERS_FILE})")
+
+    state = load_build_state(output_dir)
+    widgets = load_widgets()
+
+    # Split every widget into styles + body so CSS shared across widgets can be pulled out
+    bodies = {}
+    widget_styles = {}
+    for widget in widgets:
+        source_path = SOURCE_DIR / widget["file"]
+        if not source_path.exists():
+            print(f"  ! Missing source {source_path}, emitting placeholder")
+            bodies[widget["name"]] = None
+            continue
+        widget_styles[widget["name"]], bodies[widget["name"]] = split_widget_html(
+            source_path.read_text(encoding="utf-8")
+        )
+        _, widget["printed_libraries"] = extract_library_tags(bodies[widget["name"]])
+
+    shared_rules, own_rules = partition_css(widget_styles)
+    shared_set = set(shared_rules)
 
-    for widget in WIDGETS:
-        php_code = generate_shortcode_php(widget)
-        filename = f"{widget['name']}.php"
-        filepath = output_dir / filename
-        
-        with open(filepath, "w") as f:
-            f.write(php_code)
-        
-        print(f"  ✓ Created {filename}")
-
-    # Generate functions.php template
-    functions_php = generate_functions_php()
-    with open(output_dir / "functions-template.php", "w") as f:
-        f.write(functions_php)
-    print(f"  ✓ Created functions-template.php")
+    # Write extracted stylesheets; versions are content hashes so they change only with content
+    style_files = {}
+    if shared_rules:
+        shared_path = f"{CSS_DIR}/{SHARED_CSS_FILE}"
+        shared_css = render_css(shared_rules, "rules shared by several widgets")
+        build_output(output_dir, state, shared_path, hash_inputs(shared_css), lambda: shared_css, args.incremental)
+        style_files[SHARED_CSS_HANDLE] = (shared_path, hash_inputs(shared_css)[:12], [])
+
+    for widget in widgets:
+        name = widget["name"]
+        handles = []
+        if own_rules.get(name):
+            css_path = widget_css_file(widget)
+            css = render_css(own_rules[name], f"site-assets/{widget['file']}")
+            build_output(output_dir, state, css_path, hash_inputs(css), lambda css=css: css, args.incremental)
+            uses_shared = any(
+                rule in shared_set for block in widget_styles[name] for rule in split_css_rules(block)
+            )
+            deps = [SHARED_CSS_HANDLE] if uses_shared else []
+            style_files[widget_style_handle(widget)] = (css_path, hash_inputs(css)[:12], deps)
+            handles.append(widget_style_handle(widget))
+        elif name in widget_styles and widget_styles[name] and shared_rules:
+            handles.append(SHARED_CSS_HANDLE)
+        widget["style_handles"] = handles
+
+    for widget in widgets:
+        build_output(
+            output_dir,
+            state,
+            f"{widget['name']}.php",
+            widget_input_hash(widget, SOURCE_DIR, {"ssr": args.ssr}, EXTERNAL_LIBRARIES),
+            lambda widget=widget: generate_shortcode_php(
+                widget, bodies[widget["name"]], widget["style_handles"], ssr=args.ssr
+            ),
+            args.incremental,
+        )
+
+    if args.ssr:
+        ssr_helpers = generate_ssr_helpers_php()
+        build_output(output_dir, state, SSR_HELPERS_FILE, hash_inputs(ssr_helpers), lambda: ssr_helpers, args.incremental)
+    else:
+        # SSR off: drop the helpers left by an earlier --ssr run (functions-template.php no longer requires them)
+        state["outputs"].pop(SSR_HELPERS_FILE, None)
+        ssr_helpers_path = output_dir / SSR_HELPERS_FILE
+        if ssr_helpers_path.exists():
+            ssr_helpers_path.unlink()
+            print(f"  ✓ Removed {SSR_HELPERS_FILE} (client-side rendering)")
+
+    # Generate functions.php template (hashed as rendered, so template edits alone invalidate it)
+    functions_php = generate_functions_php(widgets, style_files, ssr=args.ssr)
+    build_output(
+        output_dir, state, "functions-template.php", hash_inputs(functions_php), lambda: functions_php, args.incremental
+    )
 
     # Generate manifest of all shortcodes
     shortcodes_manifest = {
@@ -262,20 +1016,32 @@ def main():
                 "shortcode": w["shortcode"],
                 "title": w["title"],
                 "file": str(output_dir / f"{w['name']}.php"),
+                "source": f"site-assets/{w['file']}",
                 "attributes": w["attrs"],
+                "styles": w["style_handles"],
+                "libraries": widget_library_handles(w),
             }
-            for w in WIDGETS
+            for w in widgets
         ]
     }
 
-    with open(output_dir / "SHORTCODES_MANIFEST.json", "w") as f:
-        json.dump(shortcodes_manifest, f, indent=2)
-    print(f"  ✓ Created SHORTCODES_MANIFEST.json")
+    build_output(
+        output_dir,
+        state,
+        "SHORTCODES_MANIFEST.json",
+        hash_inputs(shortcodes_manifest),
+        lambda: json.dumps(shortcodes_manifest, indent=2),
+        args.incremental,
+    )
+
+    save_build_state(output_dir, state)
 
     print("\nNext steps:")
     print("1. Copy these PHP files to: wp-content/themes/your-theme/inc/shortcodes/")
-    print("2. Include them in functions.php using require_once")
-    print("3. Enqueue theme JS/CSS and external libraries (see functions-template.php)")
+    print(f"2. Copy {output_dir / CSS_DIR}/ to: wp-content/themes/your-theme/css/")
+    print("3. Merge functions-template.php (style registration + require_once lines) into functions.php")
+    if args.ssr:
+        print("   (set the cp_ssr_cache_ttl option to tune the SSR transient lifetime, default 300s)")
     print("4. Create 16 WP pages and add shortcodes to page content")
     print("5. Test each shortcode in the WP editor\n")
 
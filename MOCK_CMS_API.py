@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+"""
+Mock CMS API
+Local stand-in for the public API at cms.carolinapanorama.org, for repeatable widget
+load and latency testing without touching production. Serves every endpoint the
+widgets call, in the real response shape ({"success": ..., "data": ..., "pagination": ...}):
+
+    /api/public/articles            ?page=&per_page=&category=&tag=&author_id=&search=
+    /api/public/articles/<id>
+    /api/public/articles/slug/<slug>
+    /api/public/categories
+    /api/public/authors
+    /api/public/headlines
+    /api/public/trending
+    /api/public/youtube             ?channel_id=|playlist_id=&max_results=
+
+Fixtures are generated deterministically (--articles N) or loaded from a JSON file with
+"articles", "categories", "authors" and "videos" lists (--fixtures; --dump-fixtures
+writes the defaults as a starting point).
+
+Usage:
+    python3 MOCK_CMS_API.py                                  # http://127.0.0.1:8787
+    python3 MOCK_CMS_API.py --latency-ms 120 --jitter-ms 40  # simulated network/backend time
+    python3 MOCK_CMS_API.py --endpoint-latency trending=800  # one slow endpoint
+    python3 MOCK_CMS_API.py --error-rate 0.1 --error-status 503 --error-endpoint articles
+    python3 MOCK_CMS_API.py --fixtures fixtures.json --seed 7
+
+Per-request overrides: append ?_latency=<ms> or ?_status=<code> to any API URL.
+Control endpoints: GET /__mock/stats (per-endpoint counts, errors, bytes, latency),
+POST /__mock/reset, POST /__mock/config (JSON body with any of latency_ms, jitter_ms,
+endpoint_latency, error_rate, error_status, error_endpoints).
+
+Point a scaffolded WordPress theme at it with `SCAFFOLD_THEME.py --mock-cms <url>`.
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8787
+API_PREFIX = "/api/public"
+
+CATEGORY_FIXTURES = [
+    ("Local News", "#1f4e79"),
+    ("Politics", "#8b1e3f"),
+    ("Business", "#2e7d32"),
+    ("Education", "#6a1b9a"),
+    ("Health", "#00838f"),
+    ("Sports", "#ef6c00"),
+    ("Faith", "#5d4037"),
+    ("Opinion", "#455a64"),
+]
+AUTHOR_COUNT = 5
+VIDEO_COUNT = 12
+IMAGE_BASE = "https://storage.googleapis.com/msgsndr/mock-cms"
+
+# Settings /__mock/config may change at runtime
+CONFIG_KEYS = ("latency_ms", "jitter_ms", "endpoint_latency", "error_rate", "error_status", "error_endpoints")
+
+
+def default_fixtures(article_count=60):
+    """Deterministic categories, authors, articles and videos in the CMS response shape."""
+    categories = [
+        {"id": i + 1, "name": name, "slug": name.lower().replace(" ", "-"), "color_code": color}
+        for i, (name, color) in enumerate(CATEGORY_FIXTURES)
+    ]
+    authors = [
+        {"id": i + 1, "name": f"Staff Writer {i + 1}", "slug": f"staff-writer-{i + 1}"}
+        for i in range(AUTHOR_COUNT)
+    ]
+
+    newest = datetime(2026, 1, 5, 9, tzinfo=timezone.utc)
+    articles = []
+    for i in range(article_count):
+        number = i + 1
+        category = categories[i % len(categories)]
+        extra = categories[(i * 3 + 1) % len(categories)]
+        author = authors[i % len(authors)]
+        title = f"Mock story {number}: {category['name']} update"
+        slug = f"mock-story-{number}"
+        articles.append({
+            "id": number,
+            "slug": slug,
+            "url": f"/article#{slug}",
+            "title": title,
+            "excerpt": f"A short summary of mock story {number} for widget testing.",
+            "content": "".join(f"<p>Paragraph {p + 1} of mock story {number}.</p>" for p in range(6)),
+            "featured_image": f"{IMAGE_BASE}/story-{number}.jpg",
+            "featured_image_alt": title,
+            "publish_date": (newest - timedelta(hours=7 * i)).isoformat().replace("+00:00", "Z"),
+            "author": {"id": author["id"], "name": author["name"]},
+            "categories": [category] if i % 4 else [category, extra],
+            "tags": [category["slug"], "mock"],
+            "meta_title": title,
+            "meta_description": f"Mock story {number}.",
+            "views": (article_count - i) * 37 % 1000,
+        })
+
+    videos = [
+        {
+            "video_id": f"mockvid{i + 1:04d}",
+            "title": f"Mock video {i + 1}",
+            "url": f"https://www.youtube.com/watch?v=mockvid{i + 1:04d}",
+            "thumbnail": f"{IMAGE_BASE}/video-{i + 1}.jpg",
+            "published_at": (newest - timedelta(days=3 * i)).isoformat().replace("+00:00", "Z"),
+            "view_count": 1500 - i * 90,
+        }
+        for i in range(VIDEO_COUNT)
+    ]
+    return {"categories": categories, "authors": authors, "articles": articles, "videos": videos}
+
+
+def load_fixtures(path):
+    """Fixtures from a JSON file; missing lists fall back to the defaults."""
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    fixtures = default_fixtures()
+    fixtures.update({key: value for key, value in data.items() if key in fixtures})
+    return fixtures
+
+
+def paginate(items, query, default_per_page=10):
+    """Slice `items` by ?page=&per_page= and build the pagination block."""
+    try:
+        page = max(1, int(query.get("page", ["1"])[0]))
+        per_page = max(1, min(100, int(query.get("per_page", [str(default_per_page)])[0])))
+    except ValueError:
+        page, per_page = 1, default_per_page
+    total = len(items)
+    pagination = {
+        "page": page,
+        "per_page": per_page,
+        "total": total,
+        "total_pages": (total + per_page - 1) // per_page,
+    }
+    return items[(page - 1) * per_page:page * per_page], pagination
+
+
+class MockCMS:
+    """The mock API: fixture lookups, simulated latency, injected errors and request stats."""
+
+    def __init__(self, fixtures=None, latency_ms=0, jitter_ms=0, endpoint_latency=None,
+                 error_rate=0.0, error_status=500, error_endpoints=None, seed=None):
+        self.fixtures = fixtures or default_fixtures()
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.endpoint_latency = dict(endpoint_latency or {})
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.error_endpoints = set(error_endpoints or ())
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.stats = {}
+        self.server = None
+
+    # ----- routing -----
+
+    def respond(self, path, query):
+        """(endpoint, status, payload) for an API path, before latency/error injection."""
+        if not path.startswith(API_PREFIX + "/"):
+            return "unknown", 404, {"success": False, "error": "Not found"}
+        parts = path[len(API_PREFIX) + 1:].strip("/").split("/")
+        articles = self.fixtures["articles"]
+
+        if parts == ["articles"]:
+            matches = articles
+            if "category" in query:
+                wanted = query["category"][0].lower()
+                matches = [
+                    a for a in matches
+                    if any(wanted in (c["name"].lower(), c.get("slug", "")) for c in a["categories"])
+                ]
+            if "tag" in query:
+                matches = [a for a in matches if query["tag"][0].lower() in a.get("tags", [])]
+            if "author_id" in query:
+                matches = [a for a in matches if str(a["author"]["id"]) == query["author_id"][0]]
+            if "search" in query:
+                needle = query["search"][0].lower()
+                matches = [a for a in matches if needle in a["title"].lower() or needle in a["excerpt"].lower()]
+            data, pagination = paginate(matches, query)
+            return "articles", 200, {"success": True, "data": data, "pagination": pagination}
+
+        if len(parts) == 3 and parts[:2] == ["articles", "slug"]:
+            article = next((a for a in articles if a["slug"] == parts[2]), None)
+            if article:
+                return "article", 200, {"success": True, "data": article}
+            return "article", 404, {"success": False, "error": "Article not found"}
+
+        if len(parts) == 2 and parts[0] == "articles":
+            article = next((a for a in articles if str(a["id"]) == parts[1]), None)
+            if article:
+                return "article", 200, {"success": True, "data": article}
+            return "article", 404, {"success": False, "error": "Article not found"}
+
+        if parts == ["categories"]:
+            return "categories", 200, {"success": True, "data": self.fixtures["categories"]}
+
+        if parts == ["authors"]:
+            return "authors", 200, {"success": True, "data": self.fixtures["authors"]}
+
+        if parts == ["headlines"]:
+            return "headlines", 200, {"success": True, "data": articles[:5], "edition": "mock-edition"}
+
+        if parts == ["trending"]:
+            trending = sorted(articles[:30], key=lambda a: a.get("views", 0), reverse=True)[:10]
+            return "trending", 200, {"success": True, "data": trending, "source": "mock"}
+
+        if parts == ["youtube"]:
+            if "channel_id" not in query and "playlist_id" not in query:
+                return "youtube", 400, {"success": False, "error": "channel_id or playlist_id is required"}
+            try:
+                limit = int(query.get("max_results", ["10"])[0])
+            except ValueError:
+                limit = 10
+            return "youtube", 200, {"success": True, "data": self.fixtures["videos"][:limit]}
+
+        return "unknown", 404, {"success": False, "error": "Not found"}
+
+    def handle(self, path, query):
+        """Full request handling: route, then apply latency and error injection.
+
+        Returns (endpoint, status, payload, delay_seconds).
+        """
+        endpoint, status, payload = self.respond(path, query)
+
+        delay_ms = self.endpoint_latency.get(endpoint, self.latency_ms)
+        if self.jitter_ms:
+            delay_ms += self.random.uniform(0, self.jitter_ms)
+        if "_latency" in query:
+            delay_ms = float(query["_latency"][0])
+
+        if "_status" in query:
+            status = int(query["_status"][0])
+        elif self.error_rate and (not self.error_endpoints or endpoint in self.error_endpoints):
+            if self.random.random() < self.error_rate:
+                status = self.error_status
+        if status >= 500:
+            payload = {"success": False, "error": f"Injected error ({status})"}
+        return endpoint, status, payload, delay_ms / 1000
+
+    def record(self, endpoint, status, nbytes, elapsed_ms):
+        with self.lock:
+            entry = self.stats.setdefault(endpoint, {"requests": 0, "errors": 0, "bytes": 0, "latency_ms": 0.0})
+            entry["requests"] += 1
+            entry["errors"] += status >= 400
+            entry["bytes"] += nbytes
+            entry["latency_ms"] = round(entry["latency_ms"] + elapsed_ms, 2)
+
+    def configure(self, **settings):
+        """Change latency/error settings (used by POST /__mock/config)."""
+        for key, value in settings.items():
+            if key not in CONFIG_KEYS:
+                raise ValueError(f"Unknown setting: {key}")
+            setattr(self, key, set(value) if key == "error_endpoints" else value)
+
+    def snapshot(self):
+        with self.lock:
+            return {name: dict(entry) for name, entry in self.stats.items()}
+
+    def reset(self):
+        with self.lock:
+            self.stats = {}
+
+    # ----- server -----
+
+    def make_handler(self):
+        cms = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def send_json(self, status, payload, extra_headers=None):
+                body = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("Access-Control-Allow-Origin", "*")
+                self.send_header("Cache-Control", "no-store")
+                for name, value in (extra_headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+                return len(body)
+
+            def do_OPTIONS(self):
+                self.send_response(204)
+                self.send_header("Access-Control-Allow-Origin", "*")
+                self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
+                self.send_header("Access-Control-Allow-Headers", "Content-Type")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                if url.path == "/__mock/stats":
+                    return self.send_json(200, {"success": True, "data": cms.snapshot()})
+
+                start = time.perf_counter()
+                endpoint, status, payload, delay = cms.handle(url.path, parse_qs(url.query))
+                if delay > 0:
+                    time.sleep(delay)
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                nbytes = self.send_json(status, payload, {"Server-Timing": f"mock;dur={elapsed_ms:.1f}"})
+                cms.record(endpoint, status, nbytes, elapsed_ms)
+
+            def do_POST(self):
+                url = urlparse(self.path)
+                if url.path == "/__mock/reset":
+                    cms.reset()
+                    return self.send_json(200, {"success": True})
+                if url.path == "/__mock/config":
+                    length = int(self.headers.get("Content-Length") or 0)
+                    try:
+                        cms.configure(**json.loads(self.rfile.read(length) or b"{}"))
+                    except (ValueError, TypeError) as error:
+                        return self.send_json(400, {"success": False, "error": str(error)})
+                    return self.send_json(200, {"success": True})
+                return self.send_json(405, {"success": False, "error": "Method not allowed"})
+
+        return Handler
+
+    def start(self, host=DEFAULT_HOST, port=0):
+        """Serve in a background thread; returns the base URL."""
+        self.server = ThreadingHTTPServer((host, port), self.make_handler())
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return f"http://{host}:{self.server.server_address[1]}"
+
+    def stop(self):
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+
+
+def parse_endpoint_latency(values):
+    """["trending=800", ...] -> {"trending": 800.0}"""
+    latency = {}
+    for value in values or ():
+        name, _, ms = value.partition("=")
+        if not ms:
+            raise argparse.ArgumentTypeError(f"Expected endpoint=ms, got {value!r}")
+        latency[name] = float(ms)
+    return latency
+
+
+def parse_args(argv=None):
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="Serve a local mock of the Carolina Panorama CMS public API.")
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"Bind address (default {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port (default {DEFAULT_PORT})")
+    parser.add_argument("--fixtures", help="JSON file with articles/categories/authors/videos lists")
+    parser.add_argument("--articles", type=int, default=60, help="Generated article count (without --fixtures)")
+    parser.add_argument("--dump-fixtures", help="Write the generated fixtures to this file and exit")
+    parser.add_argument("--latency-ms", type=float, default=0, help="Base latency added to every API response")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="Random extra latency, 0..N ms")
+    parser.add_argument(
+        "--endpoint-latency",
+        action="append",
+        metavar="ENDPOINT=MS",
+        help="Latency for one endpoint (articles, article, categories, authors, headlines, trending, youtube)",
+    )
+    parser.add_argument("--error-rate", type=float, default=0, help="Fraction of responses replaced by an error")
+    parser.add_argument("--error-status", type=int, default=500, help="Status code for injected errors")
+    parser.add_argument("--error-endpoint", action="append", help="Only inject errors on these endpoints")
+    parser.add_argument("--seed", type=int, help="Random seed for jitter and error injection")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Run the mock API until interrupted."""
+    args = parse_args(argv)
+    fixtures = load_fixtures(args.fixtures) if args.fixtures else default_fixtures(args.articles)
+
+    if args.dump_fixtures:
+        Path(args.dump_fixtures).write_text(json.dumps(fixtures, indent=2) + "\n", encoding="utf-8")
+        print(f"Wrote {args.dump_fixtures}")
+        return
+
+    cms = MockCMS(
+        fixtures,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        endpoint_latency=parse_endpoint_latency(args.endpoint_latency),
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        error_endpoints=args.error_endpoint,
+        seed=args.seed,
+    )
+    base_url = cms.start(args.host, args.port)
+    print(f"Mock CMS API serving {len(fixtures['articles'])} articles at {base_url}{API_PREFIX}/")
+    print(f"  stats: {base_url}/__mock/stats   (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        cms.stop()
+        print("\nRequests served:")
+        for endpoint, entry in sorted(cms.snapshot().items()):
+            average = entry["latency_ms"] / entry["requests"] if entry["requests"] else 0
+            print(f"  {endpoint:<12} {entry['requests']:>6} req  {entry['errors']:>4} err  {average:>8.1f} ms avg")
+
+
+if __name__ == "__main__":
+    main()
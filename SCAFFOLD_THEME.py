@@ -3,12 +3,57 @@
 WordPress Theme Scaffold Generator
 Creates a minimal but complete WordPress theme structure for Carolina Panorama.
 Output: theme directory with functions.php, template files, CSS/JS copied from source.
+
+Usage:
+    python3 SCAFFOLD_THEME.py
+    python3 SCAFFOLD_THEME.py --mock-cms [URL]   # point cp_api_base_url at MOCK_CMS_API.py
 """
 
+import argparse
+import hashlib
 import os
+import re
 import shutil
+import sys
 from pathlib import Path
 
+from GENERATE_SHORTCODES import (
+    SOURCE_DIR,
+    generate_library_registration_php,
+    load_widgets,
+    partition_css,
+    split_css_rules,
+    split_widget_html,
+)
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "site-assets" / "cpanoram-global"))
+from build_dist import minify_css  # noqa: E402
+
+GLOBAL_CSS_SOURCE = SOURCE_DIR / "cpanoram-global" / "carolina-panorama-global.css"
+GLOBAL_JS_SOURCE = SOURCE_DIR / "cpanoram-global" / "carolina-panorama-global.js"
+
+# Content hashes of the theme's versioned assets, read by cp_asset_version() in functions.php.
+# Versions only change when the content does, so the files can be cached for a year.
+ASSET_MANIFEST_FILE = "inc/asset-manifest.php"
+VERSIONED_ASSETS = ["css/carolina-panorama-global.css", "js/carolina-panorama-global.js"]
+ASSET_CACHE_MAX_AGE = 365 * 24 * 3600
+
+# Article card component: rules whose selectors all target these classes move out of the
+# global stylesheet into one shared, content-hashed stylesheet enqueued by card widgets
+CARD_CSS_DEP = "shared-article-card-styles.css"
+CARD_CSS_STEM = "shared-article-card-styles"
+CARD_SELECTOR = ".cp-article-"
+
+# Above-the-fold widgets of the front page whose rules are inlined into header.php,
+# and the inline budget (minified bytes; roughly what fits the first round trips)
+CRITICAL_WIDGETS = ["headlines_grid"]
+CRITICAL_CSS_BUDGET = 14 * 1024
+INTERACTIVE_STATE_RE = re.compile(r":(hover|focus|focus-within|focus-visible|active|visited)\b")
+
+# Written only with --mock-cms; functions.php includes it when present
+MOCK_CMS_FILE = "inc/mock-cms.php"
+MOCK_CMS_DEFAULT_URL = "http://127.0.0.1:8787"
+
 TEMPLATE = """
 # WordPress Theme Scaffold
 
@@ -35,11 +80,14 @@ carolina-panorama/
 ├── search.php
 ├── 404.php
 ├── js/
+│   ├── .htaccess (year-long immutable caching, Apache)
 │   └── carolina-panorama-global.js (copied from source)
 ├── css/
-│   ├── carolina-panorama-global.css (copied from source)
-│   └── shared-article-card-styles.css (extracted from widgets)
+│   ├── .htaccess (same as js/.htaccess)
+│   ├── carolina-panorama-global.css (from source, minus the article card rules)
+│   └── shared-article-card-styles.<hash>.css (card rules, deduplicated across widgets)
 ├── inc/
+│   ├── asset-manifest.php (content hashes used as asset versions)
 │   ├── shortcodes/
 │   │   ├── article-detail.php
 │   │   ├── article-feed.php
@@ -64,6 +112,19 @@ carolina-panorama/
 After theme scaffold is active, run `GENERATE_SHORTCODES.py` to create shortcode PHP files,
 then include them in functions.php.
 
+## Asset versions
+
+`inc/asset-manifest.php` maps each versioned asset to a hash of its content, written at
+build time. Enqueues use it as the `?ver=` string (no `filemtime()` on each request), so
+a redeploy only changes URLs whose content changed. Re-run the scaffold after editing
+`js/` or `css/` by hand. On nginx, mirror the `.htaccess` rules:
+
+```
+location ~* /themes/carolina-panorama/(css|js)/ {
+    add_header Cache-Control "public, max-age=31536000, immutable";
+}
+```
+
 ## Customization
 
 - `style.css`: Modify theme metadata (author, version, URI, etc.)
@@ -96,9 +157,13 @@ to WordPress while preserving widget-based architecture and API-driven content.
 """
 
 
-def create_functions_php():
-    """Create functions.php with enqueue hooks."""
-    return """<?php
+def create_functions_php(card_css_file=f"css/{CARD_CSS_DEP}"):
+    """Create functions.php with enqueue hooks.
+
+    card_css_file: theme-relative path of the (content-hashed) shared article card stylesheet
+    """
+    return (
+        """<?php
 /**
  * Carolina Panorama Theme Functions
  */
@@ -108,19 +173,30 @@ if ( ! defined( 'ABSPATH' ) ) {
     exit;
 }
 
+/**
+ * Content-hash version of a theme asset, from the manifest written by SCAFFOLD_THEME.py.
+ * Loaded once per request (and served from opcache), instead of stat-ing every file.
+ */
+function cp_asset_version( $path ) {
+    static $manifest = null;
+    if ( null === $manifest ) {
+        $manifest = require get_template_directory() . '/__ASSET_MANIFEST_FILE__';
+    }
+    return isset( $manifest[ $path ] ) ? $manifest[ $path ] : null;
+}
+
 /**
  * Enqueue global assets
  */
 function cp_enqueue_global_assets() {
     $theme_uri = get_template_directory_uri();
-    $theme_dir = get_template_directory();
 
     // Global CSS
     wp_enqueue_style(
         'cp-global-css',
         $theme_uri . '/css/carolina-panorama-global.css',
         [],
-        filemtime( $theme_dir . '/css/carolina-panorama-global.css' )
+        cp_asset_version( 'css/carolina-panorama-global.css' )
     );
 
     // Global JS (loaded in footer, must run before any shortcode JS)
@@ -128,13 +204,16 @@ function cp_enqueue_global_assets() {
         'cp-global-js',
         $theme_uri . '/js/carolina-panorama-global.js',
         [],
-        filemtime( $theme_dir . '/js/carolina-panorama-global.js' ),
+        cp_asset_version( 'js/carolina-panorama-global.js' ),
         true // Load in footer
     );
 
     // Pass config to JS
     wp_localize_script( 'cp-global-js', 'CarolinaPanoramaConfig', [
         'apiBaseUrl' => get_option( 'cp_api_base_url', 'https://cms.carolinapanorama.org' ),
+        'homepageApiUrl' => is_front_page() ? get_option( 'cp_homepage_api_url', '' ) : '',
+        'telemetryUrl' => get_option( 'cp_telemetry_url', '' ),
+        'assetVersion' => cp_asset_version( 'js/carolina-panorama-global.js' ),
         'siteUrl' => site_url(),
         'restUrl' => rest_url(),
     ]);
@@ -142,47 +221,31 @@ function cp_enqueue_global_assets() {
 add_action( 'wp_enqueue_scripts', 'cp_enqueue_global_assets', 10 );
 
 /**
- * Enqueue shared article styles (used by multiple widgets)
+ * Register shared article card styles; shortcodes that render cards enqueue the handle.
+ * The file name carries a content hash, so no version query string is needed.
  */
-function cp_enqueue_article_card_styles() {
-    wp_enqueue_style(
+function cp_register_article_card_styles() {
+    wp_register_style(
         'cp-article-card-styles',
-        get_template_directory_uri() . '/css/shared-article-card-styles.css',
-        [],
-        filemtime( get_template_directory() . '/css/shared-article-card-styles.css' )
+        get_template_directory_uri() . '/__CARD_CSS_FILE__',
+        [ 'cp-global-css' ],
+        null
     );
 }
+add_action( 'wp_enqueue_scripts', 'cp_register_article_card_styles', 10 );
 
 /**
- * Enqueue external libraries (Algolia, Quill, YouTube, etc.)
+ * Enqueue shared article styles (used by multiple widgets)
  */
-function cp_enqueue_external_libs() {
-    // Algolia InstantSearch CSS
-    wp_enqueue_style(
-        'algolia-instantsearch-css',
-        'https://cdn.jsdelivr.net/npm/instantsearch.css@7.4.5/themes/satellite-min.css',
-        [],
-        '7.4.5'
-    );
-
-    // Quill Rich Text Editor
-    wp_enqueue_style(
-        'quill-snow-css',
-        'https://cdn.quilljs.com/1.3.6/quill.snow.css',
-        [],
-        '1.3.6'
-    );
-
-    wp_enqueue_script(
-        'quill-js',
-        'https://cdn.quilljs.com/1.3.6/quill.min.js',
-        [],
-        '1.3.6',
-        true
-    );
+function cp_enqueue_article_card_styles() {
+    wp_enqueue_style( 'cp-article-card-styles' );
 }
-add_action( 'wp_enqueue_scripts', 'cp_enqueue_external_libs', 11 );
 
+/**
+ * Register external libraries (Algolia, Quill). Nothing is enqueued here: shortcodes
+ * that use a library print or enqueue its handle when they render.
+ */
+__EXTERNAL_LIBS__
 /**
  * Theme supports
  */
@@ -227,11 +290,37 @@ add_action( 'widgets_init', 'cp_register_widget_areas' );
  * Include template tags
  */
 require_once get_template_directory() . '/inc/template-tags.php';
-"""
 
-
-def create_header_php():
-    """Create header.php template."""
+/**
+ * Local mock CMS API (development only; written by SCAFFOLD_THEME.py --mock-cms)
+ */
+if ( file_exists( get_template_directory() . '/inc/mock-cms.php' ) ) {
+    require_once get_template_directory() . '/inc/mock-cms.php';
+}
+""".replace("__CARD_CSS_FILE__", card_css_file).replace("__ASSET_MANIFEST_FILE__", ASSET_MANIFEST_FILE)
+        .replace("__EXTERNAL_LIBS__", generate_library_registration_php().split("\n", 1)[1])
+    )
+
+
+def critical_css_block(critical_css):
+    """<style> blocks for header.php: base rules always, front-page rules on the front page only."""
+    if not critical_css:
+        return ""
+    lines = []
+    if critical_css.get("base"):
+        lines.append(f'    <style id="cp-critical-css">{critical_css["base"]}</style>')
+    if critical_css.get("front_page"):
+        lines.append("    <?php if ( is_front_page() ) : ?>")
+        lines.append(f'    <style id="cp-critical-front-page-css">{critical_css["front_page"]}</style>')
+        lines.append("    <?php endif; ?>")
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def create_header_php(critical_css=None):
+    """Create header.php template.
+
+    critical_css: {"base": css, "front_page": css} inlined ahead of wp_head() (see build_theme_css)
+    """
     return """<?php
 /**
  * The header for Carolina Panorama theme
@@ -247,7 +336,7 @@ if ( ! defined( 'ABSPATH' ) ) {
     <meta charset="<?php bloginfo( 'charset' ); ?>">
     <meta name="viewport" content="width=device-width, initial-scale=1">
     <link rel="profile" href="https://gmpg.org/xfn/11">
-    <?php wp_head(); ?>
+__CRITICAL_CSS__    <?php wp_head(); ?>
 </head>
 
 <body <?php body_class(); ?>>
@@ -294,7 +383,7 @@ if ( ! defined( 'ABSPATH' ) ) {
         </header><!-- #masthead -->
 
         <main id="content" class="site-content">
-"""
+""".replace("__CRITICAL_CSS__", critical_css_block(critical_css))
 
 
 def create_footer_php():
@@ -448,8 +537,167 @@ function cp_get_featured_image( $post_id = null, $size = 'post-thumbnail' ) {
 """
 
 
-def main():
+def rule_selectors(rule):
+    """Selectors of a normalized rule; for @media blocks, those of the rules inside it."""
+    if rule.startswith("@media"):
+        inner = rule[rule.index("{") + 1:rule.rindex("}")]
+        return [sel for sub in split_css_rules(inner) for sel in rule_selectors(sub)]
+    if rule.startswith("@"):
+        return []
+    return [sel.strip() for sel in rule.split("{", 1)[0].split(",")]
+
+
+def is_card_rule(rule):
+    """True if every selector of the rule targets the article card component."""
+    selectors = rule_selectors(rule)
+    return bool(selectors) and all(CARD_SELECTOR in sel for sel in selectors)
+
+
+def is_first_paint_rule(rule):
+    """False for rules that only style interactive states (:hover, :focus, ...)."""
+    selectors = rule_selectors(rule)
+    return not selectors or not all(INTERACTIVE_STATE_RE.search(sel) for sel in selectors)
+
+
+def widget_css_rules(widgets, names=None):
+    """{widget_name: [css_block, ...]} from the widgets' <style> blocks."""
+    styles = {}
+    for widget in widgets:
+        path = SOURCE_DIR / widget["file"]
+        if (names is None or widget["name"] in names) and path.exists():
+            styles[widget["name"]], _ = split_widget_html(path.read_text(encoding="utf-8"))
+    return styles
+
+
+def critical_subset(rules, budget):
+    """Minified first-paint rules, in order, until the byte budget is used up."""
+    picked = []
+    used = 0
+    for rule in rules:
+        if not is_first_paint_rule(rule):
+            continue
+        size = len(minify_css(rule).encode("utf-8"))
+        if used + size > budget:
+            break
+        picked.append(rule)
+        used += size
+    return minify_css("\n".join(picked)) if picked else ""
+
+
+def build_theme_css(global_css_path=GLOBAL_CSS_SOURCE):
+    """Split the global and widget CSS into the theme's stylesheets.
+
+    Returns {"global": css, "card": css, "critical": {"base": css, "front_page": css}}:
+    the article card component and the rules card widgets share (deduplicated) go to one
+    shared stylesheet instead of the global one, and the first-paint rules of the global
+    sheet (every page) and of the card/front-page widgets (front page) are inlined.
+    """
+    global_rules = split_css_rules(global_css_path.read_text(encoding="utf-8"))
+    card_rules = [rule for rule in global_rules if is_card_rule(rule)]
+    base_rules = [rule for rule in global_rules if not is_card_rule(rule)]
+
+    widgets = load_widgets()
+    card_widgets = {w["name"] for w in widgets if CARD_CSS_DEP in w.get("css", [])}
+    shared_rules, _ = partition_css(widget_css_rules(widgets, card_widgets))
+    card_rules += [rule for rule in shared_rules if rule not in card_rules and rule not in base_rules]
+
+    front_page_rules = list(card_rules)
+    for blocks in widget_css_rules(widgets, CRITICAL_WIDGETS).values():
+        for block in blocks:
+            front_page_rules += [rule for rule in split_css_rules(block) if rule not in front_page_rules]
+
+    base_critical = critical_subset(base_rules, CRITICAL_CSS_BUDGET)
+    front_page_critical = critical_subset(front_page_rules, CRITICAL_CSS_BUDGET - len(base_critical.encode("utf-8")))
+
+    def render(rules, what):
+        header = f"/* Auto-generated by SCAFFOLD_THEME.py: {what} - do not edit */\n"
+        return header + "\n".join(rules) + "\n"
+
+    return {
+        "global": render(base_rules, f"{global_css_path} without the article card rules"),
+        "card": render(card_rules, "article card component + rules shared by card widgets"),
+        "critical": {"base": base_critical, "front_page": front_page_critical},
+    }
+
+
+def content_hash(content):
+    """Short sha256 digest of str/bytes content, used in asset file names and versions."""
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    return hashlib.sha256(data).hexdigest()[:10]
+
+
+def card_css_filename(card_css):
+    """Content-hashed file name for the shared card stylesheet."""
+    return f"css/{CARD_CSS_STEM}.{content_hash(card_css)}.css"
+
+
+def create_asset_manifest_php(versions):
+    """Create inc/asset-manifest.php: {theme-relative path: content hash}."""
+    lines = "".join(f"    '{path}' => '{version}',\n" for path, version in sorted(versions.items()))
+    return f"""<?php
+/**
+ * Asset versions (content hashes). Auto-generated by SCAFFOLD_THEME.py - do not edit.
+ */
+
+return [
+{lines}];
+"""
+
+
+def create_htaccess():
+    """Create css/.htaccess and js/.htaccess: long-lived immutable caching for versioned assets (Apache)."""
+    return f"""# Auto-generated by SCAFFOLD_THEME.py: CSS/JS URLs change with their content
+# (content-hash ?ver= from inc/asset-manifest.php, or a hash in the file name)
+<IfModule mod_headers.c>
+    <FilesMatch "\\.(css|js)$">
+        Header set Cache-Control "public, max-age={ASSET_CACHE_MAX_AGE}, immutable"
+    </FilesMatch>
+</IfModule>
+"""
+
+
+def create_mock_cms_php(base_url):
+    """Create inc/mock-cms.php, overriding cp_api_base_url with a local mock API."""
+    return f"""<?php
+/**
+ * Development only: route CMS API calls (widgets and server-side rendering) to a
+ * local MOCK_CMS_API.py server. Generated by SCAFFOLD_THEME.py --mock-cms;
+ * delete this file (or re-run without --mock-cms) to use the real API again.
+ */
+
+if ( ! defined( 'ABSPATH' ) ) {{
+    exit;
+}}
+
+if ( ! defined( 'CP_MOCK_CMS_URL' ) ) {{
+    define( 'CP_MOCK_CMS_URL', '{base_url}' );
+}}
+
+add_filter( 'pre_option_cp_api_base_url', function () {{
+    return CP_MOCK_CMS_URL;
+}} );
+
+// The homepage payload worker aggregates the real CMS, so bypass it here
+add_filter( 'pre_option_cp_homepage_api_url', '__return_empty_string' );
+"""
+
+
+def parse_args(argv=None):
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="Scaffold the Carolina Panorama WordPress theme.")
+    parser.add_argument(
+        "--mock-cms",
+        nargs="?",
+        const=MOCK_CMS_DEFAULT_URL,
+        metavar="URL",
+        help=f"Point cp_api_base_url at a local MOCK_CMS_API.py server (default {MOCK_CMS_DEFAULT_URL})",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """Generate theme scaffold."""
+    args = parse_args(argv)
     theme_dir = Path("wordpress-migration/themes/carolina-panorama")
     theme_dir.mkdir(parents=True, exist_ok=True)
 
@@ -467,33 +715,69 @@ def main():
         d.mkdir(parents=True, exist_ok=True)
         print(f"  ✓ Created {d.relative_to(theme_dir.parent.parent)}/")
 
+    # Theme CSS: card rules deduplicated into one hashed stylesheet, critical subset inlined
+    theme_css = build_theme_css()
+    card_css_file = card_css_filename(theme_css["card"])
+    for stale in (theme_dir / "css").glob(f"{CARD_CSS_STEM}*.css"):
+        if stale.name != Path(card_css_file).name:
+            stale.unlink()
+            print(f"  ✓ Removed stale css/{stale.name}")
+
+    # Versioned assets are written as bytes exactly as hashed
+    assets = {
+        "css/carolina-panorama-global.css": theme_css["global"].encode("utf-8"),
+        "js/carolina-panorama-global.js": GLOBAL_JS_SOURCE.read_bytes(),
+    }
+    versions = {path: content_hash(assets[path]) for path in VERSIONED_ASSETS}
+
     # Create files
     files = {
         "style.css": create_style_css(),
-        "functions.php": create_functions_php(),
-        "header.php": create_header_php(),
+        "functions.php": create_functions_php(card_css_file),
+        "header.php": create_header_php(theme_css["critical"]),
         "footer.php": create_footer_php(),
         "page.php": create_page_php(),
         "404.php": create_404_php(),
         "inc/template-tags.php": create_template_tags(),
+        ASSET_MANIFEST_FILE: create_asset_manifest_php(versions),
+        "css/.htaccess": create_htaccess(),
+        "js/.htaccess": create_htaccess(),
+        card_css_file: theme_css["card"],
         "README.md": TEMPLATE,
     }
 
+    mock_cms_file = theme_dir / MOCK_CMS_FILE
+    if args.mock_cms:
+        files[MOCK_CMS_FILE] = create_mock_cms_php(args.mock_cms.rstrip("/"))
+    elif mock_cms_file.exists():
+        mock_cms_file.unlink()
+        print(f"  ✓ Removed {MOCK_CMS_FILE} (using the real CMS API)")
+
     for filename, content in files.items():
         filepath = theme_dir / filename
         filepath.write_text(content)
         print(f"  ✓ Created {filename}")
 
-    # TODO: Copy CSS/JS from source (we'll do this in next step with actual file paths)
+    for filename, data in assets.items():
+        (theme_dir / filename).write_bytes(data)
+        print(f"  ✓ Copied {filename} (version {versions[filename]})")
+
+    if args.mock_cms:
+        print(f"\n  cp_api_base_url -> {args.mock_cms} (start it with: python3 MOCK_CMS_API.py)")
+
+    critical = theme_css["critical"]
+    print(
+        f"\n  Inlined critical CSS: {len(critical['base'])} bytes on every page, "
+        f"{len(critical['front_page'])} more on the front page"
+    )
 
     print("\nTheme scaffold created!")
     print(f"  Theme directory: {theme_dir}")
     print("\nNext steps:")
-    print("1. Copy global CSS/JS from source to theme/css and theme/js")
-    print("2. Run GENERATE_SHORTCODES.py to create shortcode files")
-    print("3. Copy theme to wp-content/themes/ in your WP installation")
-    print("4. Activate theme in WP Admin")
-    print("5. Create 16 pages and add shortcodes\n")
+    print("1. Run GENERATE_SHORTCODES.py to create shortcode files")
+    print("2. Copy theme to wp-content/themes/ in your WP installation")
+    print("3. Activate theme in WP Admin")
+    print("4. Create 16 pages and add shortcodes\n")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Telemetry Collector
+Local endpoint for the widget performance samples that carolina-panorama-global.js sends
+with navigator.sendBeacon (set CarolinaPanorama.TELEMETRY_URL, or the cp_telemetry_url
+WordPress option, to http://127.0.0.1:8788/collect). Keeps the latest samples per
+widget / phase / asset version and reports their p50 and p95.
+
+Beacon body (sent as text/plain so the beacon needs no CORS preflight):
+
+    {"page": "/", "samples": [{"widget": "trending-carousel-v2", "phase": "fetch",
+      "duration_ms": 182.4, "ok": true, "version": "v1.4.0"}, ...]}
+
+Widget phases are fetch / parse / render; the GHL loaders report loader-fetch /
+loader-parse / loader-render for the same widget names.
+
+Usage:
+    python3 TELEMETRY_COLLECTOR.py                          # http://127.0.0.1:8788/collect
+    python3 TELEMETRY_COLLECTOR.py --log samples.jsonl      # also append every sample to a file
+    python3 TELEMETRY_COLLECTOR.py --report samples.jsonl   # summarize a log and exit
+
+Control endpoints: GET /stats (the summary as JSON), POST /reset.
+"""
+
+import argparse
+import json
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlparse
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8788
+MAX_BODY_BYTES = 64 * 1024
+DEFAULT_MAX_SAMPLES = 1000  # kept per widget/phase/version for the percentiles
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def parse_samples(payload):
+    """Valid samples from a beacon payload, each tagged with the reporting page."""
+    page = str(payload.get("page") or "")
+    entries = payload.get("samples")
+    if not isinstance(entries, list):
+        return []
+    samples = []
+    for sample in entries:
+        if not isinstance(sample, dict):
+            continue
+        try:
+            samples.append({
+                "widget": str(sample["widget"]),
+                "phase": str(sample["phase"]),
+                "duration_ms": float(sample["duration_ms"]),
+                "ok": bool(sample.get("ok", True)),
+                "version": str(sample.get("version") or "unknown"),
+                "page": page,
+            })
+        except (KeyError, TypeError, ValueError):
+            continue
+    return samples
+
+
+class TelemetryStore:
+    """Bounded per-key sample windows plus running counts."""
+
+    def __init__(self, max_samples=DEFAULT_MAX_SAMPLES, log_path=None):
+        self.max_samples = max_samples
+        self.log_path = log_path
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.durations = {}
+            self.counts = {}
+
+    def add(self, samples):
+        with self.lock:
+            for sample in samples:
+                key = (sample["widget"], sample["phase"], sample["version"])
+                window = self.durations.setdefault(key, deque(maxlen=self.max_samples))
+                window.append(sample["duration_ms"])
+                count = self.counts.setdefault(key, {"samples": 0, "errors": 0})
+                count["samples"] += 1
+                count["errors"] += not sample["ok"]
+            if self.log_path and samples:
+                with open(self.log_path, "a", encoding="utf-8") as log:
+                    for sample in samples:
+                        log.write(json.dumps(sample) + "\n")
+
+    def summary(self):
+        """[{widget, phase, version, samples, errors, p50_ms, p95_ms}] sorted by widget/phase/version."""
+        with self.lock:
+            rows = []
+            for key in sorted(self.durations):
+                values = list(self.durations[key])
+                widget, phase, version = key
+                rows.append({
+                    "widget": widget,
+                    "phase": phase,
+                    "version": version,
+                    **self.counts[key],
+                    "p50_ms": round(percentile(values, 50), 1),
+                    "p95_ms": round(percentile(values, 95), 1),
+                })
+            return rows
+
+    # ----- server -----
+
+    def make_handler(self):
+        store = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def send_json(self, status, payload):
+                body = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("Access-Control-Allow-Origin", "*")
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_OPTIONS(self):
+                self.send_response(204)
+                self.send_header("Access-Control-Allow-Origin", "*")
+                self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
+                self.send_header("Access-Control-Allow-Headers", "Content-Type")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def do_GET(self):
+                if urlparse(self.path).path == "/stats":
+                    return self.send_json(200, {"success": True, "data": store.summary()})
+                return self.send_json(404, {"success": False, "error": "Not found"})
+
+            def do_POST(self):
+                path = urlparse(self.path).path
+                if path == "/reset":
+                    store.reset()
+                    return self.send_json(200, {"success": True})
+                if path != "/collect":
+                    return self.send_json(404, {"success": False, "error": "Not found"})
+                length = int(self.headers.get("Content-Length") or 0)
+                if length > MAX_BODY_BYTES:
+                    return self.send_json(413, {"success": False, "error": "Payload too large"})
+                try:
+                    payload = json.loads(self.rfile.read(length) or b"{}")
+                except ValueError:
+                    return self.send_json(400, {"success": False, "error": "Invalid JSON"})
+                samples = parse_samples(payload) if isinstance(payload, dict) else []
+                store.add(samples)
+                return self.send_json(200, {"success": True, "accepted": len(samples)})
+
+        return Handler
+
+    def start(self, host=DEFAULT_HOST, port=0):
+        """Serve in a background thread; returns the base URL."""
+        self.server = ThreadingHTTPServer((host, port), self.make_handler())
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return f"http://{host}:{self.server.server_address[1]}"
+
+    def stop(self):
+        if getattr(self, "server", None):
+            self.server.shutdown()
+            self.server.server_close()
+
+
+def print_summary(rows):
+    """p50/p95 table, one line per widget / phase / asset version."""
+    if not rows:
+        print("No samples.")
+        return
+    print(f"  {'widget':<28} {'phase':<14} {'version':<14} {'n':>6} {'err':>4} {'p50 ms':>9} {'p95 ms':>9}")
+    for row in rows:
+        print(
+            f"  {row['widget']:<28} {row['phase']:<14} {row['version']:<14} "
+            f"{row['samples']:>6} {row['errors']:>4} {row['p50_ms']:>9.1f} {row['p95_ms']:>9.1f}"
+        )
+
+
+def parse_args(argv=None):
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="Collect and summarize widget performance telemetry.")
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"Bind address (default {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port (default {DEFAULT_PORT})")
+    parser.add_argument("--log", help="Append every accepted sample to this JSONL file")
+    parser.add_argument("--report", help="Summarize a JSONL sample log and exit")
+    parser.add_argument(
+        "--max-samples",
+        type=int,
+        default=DEFAULT_MAX_SAMPLES,
+        help=f"Samples kept per widget/phase/version for the percentiles (default {DEFAULT_MAX_SAMPLES})",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Run the collector until interrupted (or summarize a log with --report)."""
+    args = parse_args(argv)
+    store = TelemetryStore(max_samples=args.max_samples, log_path=None if args.report else args.log)
+
+    if args.report:
+        lines = Path(args.report).read_text(encoding="utf-8").splitlines()
+        store.add([json.loads(line) for line in lines if line.strip()])
+        print_summary(store.summary())
+        return
+
+    base_url = store.start(args.host, args.port)
+    print(f"Telemetry collector listening at {base_url}/collect")
+    print(f"  stats: {base_url}/stats   (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        store.stop()
+        print()
+        print_summary(store.summary())
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,22 @@
 // - ALGOLIA_CLASSIFIEDS_INDEX: Your classifieds index name (e.g., "classifieds")
 // - GHL_WEBHOOK_SECRET: Shared secret for validating GHL webhooks
 // - CLASSIFIEDS_KV: KV namespace for storing classifieds metadata and expiration tracking
+//
+// Expiration tracking: besides `classified:<id>`, each listing has an index key
+// `expires:<YYYY-MM-DD>:<id>` (expiry day, UTC) whose KV list metadata holds the id
+// and expires_at. The sweep lists only the day buckets between the last fully swept
+// day and today, so its cost follows the number of due listings, not all live ones.
+
+const EXPIRY_PREFIX = 'expires:';
+const EXPIRY_SWEPT_KEY = 'expiry-sweep:last-day';
+const EXPIRY_MIGRATED_KEY = 'expiry-sweep:migrated';
+const EXPIRY_MIGRATION_CURSOR_KEY = 'expiry-sweep:migration-cursor';
+// Legacy listings indexed per cron run: each costs a GET and two PUTs, keeping a run
+// well inside the per-invocation KV operation limit
+const EXPIRY_MIGRATION_PAGE_SIZE = 100;
+const EXPIRY_GRACE_SECONDS = 7 * 24 * 60 * 60; // keep keys past expiry so the sweep sees them
+const MAX_SWEEP_DAYS = 31;
+const ALGOLIA_BATCH_LIMIT = 1000;
 
 export default {
   async fetch(request, env) {
@@ -174,17 +190,13 @@ async function handleSubmission(request, env, corsHeaders) {
     
     // Store metadata in KV for expiration tracking
     if (env.CLASSIFIEDS_KV) {
-      await env.CLASSIFIEDS_KV.put(
-        `classified:${classifiedId}`,
-        JSON.stringify({
-          id: classifiedId,
-          expires_at: expirationDate.toISOString(),
-          category: classified.category,
-          title: classified.title,
-          ghl_task_id: classified.ghl_task_id
-        }),
-        { expirationTtl: Math.floor((expirationDate.getTime() - now.getTime()) / 1000) }
-      );
+      await trackExpiration(env, {
+        id: classifiedId,
+        expires_at: expirationDate.toISOString(),
+        category: classified.category,
+        title: classified.title,
+        ghl_task_id: classified.ghl_task_id
+      });
     }
 
     return new Response(JSON.stringify({ 
@@ -299,7 +311,7 @@ async function handleDelete(request, env, corsHeaders) {
     
     // Delete from KV
     if (env.CLASSIFIEDS_KV) {
-      await env.CLASSIFIEDS_KV.delete(`classified:${data.classified_id}`);
+      await untrackExpiration(env, data.classified_id);
     }
 
     return new Response(JSON.stringify({ 
@@ -460,6 +472,138 @@ async function deleteFromAlgolia(classifiedId, env) {
   console.log(`Deleted classified ${classifiedId} from Algolia`);
 }
 
+// Send a batch of write operations to Algolia in one request
+async function algoliaBatch(requests, env) {
+  const appId = env.ALGOLIA_APP_ID;
+  const apiKey = env.ALGOLIA_WRITE_API_KEY;
+  const indexName = env.ALGOLIA_CLASSIFIEDS_INDEX || 'classifieds';
+  
+  if (!appId || !apiKey) {
+    throw new Error('Algolia credentials not configured');
+  }
+
+  const url = `https://${appId}-dsn.algolia.net/1/indexes/${indexName}/batch`;
+
+  const response = await fetch(url, {
+    method: 'POST',
+    headers: {
+      'X-Algolia-API-Key': apiKey,
+      'X-Algolia-Application-Id': appId,
+      'Content-Type': 'application/json'
+    },
+    body: JSON.stringify({ requests })
+  });
+
+  if (!response.ok) {
+    const error = await response.text();
+    throw new Error(`Algolia API error: ${response.status} - ${error}`);
+  }
+
+  return await response.json();
+}
+
+// Mark classifieds expired in Algolia (one batch request per 1000 records)
+async function expireInAlgolia(classifiedIds, env) {
+  const updatedAt = new Date().toISOString();
+  for (let i = 0; i < classifiedIds.length; i += ALGOLIA_BATCH_LIMIT) {
+    const requests = classifiedIds.slice(i, i + ALGOLIA_BATCH_LIMIT).map(id => ({
+      action: 'partialUpdateObjectNoCreate',
+      body: { objectID: id, status: 'expired', updated_at: updatedAt }
+    }));
+    await algoliaBatch(requests, env);
+  }
+}
+
+// Expiry bucket for a timestamp: "YYYY-MM-DD" (UTC)
+function expiryDay(date) {
+  return new Date(date).toISOString().slice(0, 10);
+}
+
+// Day after a "YYYY-MM-DD" bucket
+function nextExpiryDay(day) {
+  return expiryDay(new Date(`${day}T00:00:00Z`).getTime() + 24 * 60 * 60 * 1000);
+}
+
+// Store a classified's metadata plus its expiry-day index key
+async function trackExpiration(env, metadata) {
+  const secondsLeft = Math.floor((new Date(metadata.expires_at).getTime() - Date.now()) / 1000);
+  const options = { expirationTtl: Math.max(60, secondsLeft + EXPIRY_GRACE_SECONDS) };
+  await Promise.all([
+    env.CLASSIFIEDS_KV.put(`classified:${metadata.id}`, JSON.stringify(metadata), options),
+    env.CLASSIFIEDS_KV.put(`${EXPIRY_PREFIX}${expiryDay(metadata.expires_at)}:${metadata.id}`, '', {
+      ...options,
+      metadata: { id: metadata.id, expires_at: metadata.expires_at }
+    })
+  ]);
+}
+
+// Remove a classified's KV metadata and expiry index key
+async function untrackExpiration(env, classifiedId, expiresAt = null) {
+  if (!expiresAt) {
+    const metadata = await env.CLASSIFIEDS_KV.get(`classified:${classifiedId}`, { type: 'json' });
+    expiresAt = metadata?.expires_at;
+  }
+  const deletes = [env.CLASSIFIEDS_KV.delete(`classified:${classifiedId}`)];
+  if (expiresAt) {
+    deletes.push(env.CLASSIFIEDS_KV.delete(`${EXPIRY_PREFIX}${expiryDay(expiresAt)}:${classifiedId}`));
+  }
+  await Promise.all(deletes);
+}
+
+// List every key under a prefix, following pagination cursors
+async function listAllKeys(kv, prefix) {
+  const keys = [];
+  let cursor;
+  do {
+    const page = await kv.list({ prefix, cursor });
+    keys.push(...page.keys);
+    cursor = page.list_complete ? null : page.cursor;
+  } while (cursor);
+  return keys;
+}
+
+// One-time: index classifieds stored before expiry buckets existed. Resumable: each
+// run handles one page of `classified:` keys and stores the list cursor, so a large
+// namespace is migrated over several runs; the flag is set after the last page.
+// Listings already due are expired here rather than indexed into a day bucket the
+// sweep may have finished; the rest expire from now on, in buckets not yet swept.
+async function migrateLegacyExpirations(env) {
+  if (await env.CLASSIFIEDS_KV.get(EXPIRY_MIGRATED_KEY)) return;
+
+  const cursor = await env.CLASSIFIEDS_KV.get(EXPIRY_MIGRATION_CURSOR_KEY);
+  const page = await env.CLASSIFIEDS_KV.list({
+    prefix: 'classified:',
+    limit: EXPIRY_MIGRATION_PAGE_SIZE,
+    cursor: cursor || undefined
+  });
+  const now = new Date();
+  const due = [];
+  for (let i = 0; i < page.keys.length; i += 20) {
+    await Promise.all(page.keys.slice(i, i + 20).map(async key => {
+      const metadata = await env.CLASSIFIEDS_KV.get(key.name, { type: 'json' });
+      if (!metadata?.id || !metadata.expires_at) return;
+      if (new Date(metadata.expires_at) <= now) {
+        due.push(metadata.id);
+      } else {
+        await trackExpiration(env, metadata);
+      }
+    }));
+  }
+  if (due.length > 0) {
+    await expireInAlgolia(due, env);
+    await Promise.all(due.map(id => env.CLASSIFIEDS_KV.delete(`classified:${id}`)));
+  }
+
+  if (page.list_complete) {
+    await env.CLASSIFIEDS_KV.put(EXPIRY_MIGRATED_KEY, new Date().toISOString());
+    if (cursor) await env.CLASSIFIEDS_KV.delete(EXPIRY_MIGRATION_CURSOR_KEY);
+    console.log(`Indexed ${page.keys.length} existing classifieds by expiry day; migration complete`);
+  } else {
+    await env.CLASSIFIEDS_KV.put(EXPIRY_MIGRATION_CURSOR_KEY, page.cursor);
+    console.log(`Indexed ${page.keys.length} existing classifieds by expiry day; continuing next run`);
+  }
+}
+
 // Expire a specific classified
 async function expireClassified(classifiedId, env) {
   // Update status in Algolia
@@ -468,17 +612,11 @@ async function expireClassified(classifiedId, env) {
     throw new Error('Classified not found');
   }
 
-  const expiredClassified = {
-    ...existing,
-    status: 'expired',
-    updated_at: new Date().toISOString()
-  };
-
-  await submitToAlgolia(expiredClassified, env);
+  await expireInAlgolia([classifiedId], env);
   
   // Remove from KV (no longer needs expiration tracking)
   if (env.CLASSIFIEDS_KV) {
-    await env.CLASSIFIEDS_KV.delete(`classified:${classifiedId}`);
+    await untrackExpiration(env, classifiedId, existing.expires_at);
   }
   
   console.log(`Expired classified ${classifiedId}`);
@@ -491,28 +629,42 @@ async function cleanupExpiredClassifieds(env) {
     return [];
   }
 
-  const expired = [];
-  const now = new Date();
+  await migrateLegacyExpirations(env);
 
-  // List all classifieds in KV
-  const { keys } = await env.CLASSIFIEDS_KV.list({ prefix: 'classified:' });
+  const now = new Date();
+  const today = expiryDay(now);
+
+  // Buckets from the day after the last fully swept one up to today. Without a
+  // recorded sweep, start at yesterday: listings due after its last run are still
+  // pending (legacy keys expired exactly at expiry, so nothing older can be)
+  const lastSwept = await env.CLASSIFIEDS_KV.get(EXPIRY_SWEPT_KEY)
+    || expiryDay(now.getTime() - 2 * 24 * 60 * 60 * 1000);
+  const days = [];
+  for (let day = nextExpiryDay(lastSwept); day <= today && days.length < MAX_SWEEP_DAYS; day = nextExpiryDay(day)) {
+    days.push(day);
+  }
 
-  for (const key of keys) {
-    try {
-      const metadata = await env.CLASSIFIEDS_KV.get(key.name, { type: 'json' });
-      if (!metadata) continue;
+  const buckets = await Promise.all(
+    days.map(day => listAllKeys(env.CLASSIFIEDS_KV, `${EXPIRY_PREFIX}${day}:`))
+  );
+  const due = buckets.flat()
+    .map(key => key.metadata)
+    .filter(metadata => metadata?.id && new Date(metadata.expires_at) <= now);
+
+  const expired = due.map(metadata => metadata.id);
+  if (expired.length > 0) {
+    await expireInAlgolia(expired, env);
+    await Promise.all(due.map(metadata => untrackExpiration(env, metadata.id, metadata.expires_at)));
+  }
 
-      const expiresAt = new Date(metadata.expires_at);
-      if (now > expiresAt) {
-        await expireClassified(metadata.id, env);
-        expired.push(metadata.id);
-      }
-    } catch (error) {
-      console.error(`Error processing expired classified ${key.name}:`, error);
-    }
+  // Past days are done once swept (every listing in them was due); today's bucket
+  // is revisited on the next run
+  const lastComplete = days.filter(day => day < today).pop();
+  if (lastComplete) {
+    await env.CLASSIFIEDS_KV.put(EXPIRY_SWEPT_KEY, lastComplete);
   }
 
-  console.log(`Cleaned up ${expired.length} expired classifieds:`, expired);
+  console.log(`Cleaned up ${expired.length} expired classifieds (${days.length} day bucket(s) swept):`, expired);
   return expired;
 }
 
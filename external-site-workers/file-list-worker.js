@@ -1,5 +1,38 @@
+// Cloudflare Worker: e-edition PDF list and date search
+//
+// Bindings:
+// - MY_BUCKET: R2 bucket holding the dated PDFs
+//
+// The bucket listing is kept in an index object (INDEX_KEY) mapping each file to
+// its date and each date to its file, so requests never list the bucket. The index
+// is rebuilt (paginating the listing with cursors) by the cron trigger, lazily when
+// it is older than INDEX_MAX_AGE_MS (the stale copy is served meanwhile), or
+// synchronously if it doesn't exist yet. Responses carry an ETag derived from the
+// index version plus the route and query, so clients and caches can revalidate each
+// URL with a 304. Not-found responses are never cached.
+
+// Cron trigger: 0 * * * * (hourly)
+
+const INDEX_KEY = '_index/file-list.json';
+const INDEX_MAX_AGE_MS = 15 * 60 * 1000;
+const MEMORY_INDEX_TTL_MS = 60 * 1000;
+const PUBLIC_BASE_URL = 'https://files.carolinapanorama.org';
+const CACHE_CONTROL = 'public, max-age=300, stale-while-revalidate=3600';
+const NOT_FOUND_CACHE_CONTROL = 'no-store';
+const MAX_PAGE_SIZE = 500;
+
+// Per-isolate copy of the index, so warm requests skip the R2 read too
+let memoryIndex = null;
+let memoryIndexLoadedAt = 0;
+let rebuildPromise = null;
+
 export default {
-  async fetch(request, env) {
+  async scheduled(event, env, ctx) {
+    const index = await rebuildFileIndex(env.MY_BUCKET);
+    console.log(`File index rebuilt: ${Object.keys(index.files).length} files`);
+  },
+
+  async fetch(request, env, ctx) {
     // Helper function to normalize date strings to M-D-YYYY format (no leading zeros)
     const normalizeDateForSearch = (dateString) => {
       // Try to parse various formats: M/D/YYYY, MM/DD/YYYY, M-D-YYYY, etc.
@@ -34,7 +67,8 @@ export default {
     const corsHeaders = {
       'Access-Control-Allow-Origin': '*',
       'Access-Control-Allow-Methods': 'GET, OPTIONS',
-      'Access-Control-Allow-Headers': 'Content-Type',
+      'Access-Control-Allow-Headers': 'Content-Type, If-None-Match',
+      'Access-Control-Expose-Headers': 'ETag',
       'Content-Type': 'application/json'
     };
 
@@ -50,7 +84,7 @@ export default {
     if (url.pathname !== '/' && url.pathname !== '' && url.pathname !== '/search') {
       return new Response('Not Found', { 
         status: 404,
-        headers: { 'Content-Type': 'text/plain' }
+        headers: { 'Content-Type': 'text/plain', 'Cache-Control': NOT_FOUND_CACHE_CONTROL }
       });
     }
 
@@ -80,6 +114,16 @@ export default {
     }
 
     try {
+      const index = await getFileIndex(env.MY_BUCKET, ctx);
+      // Each route and query has its own representation, so its own validator
+      const etag = '"' + await sha256Hex(index.etag + url.pathname + url.search, 16) + '"';
+      const cacheHeaders = { ...corsHeaders, 'Cache-Control': CACHE_CONTROL, 'ETag': etag };
+
+      // Unchanged since the client's copy: no body
+      if (etagMatches(request.headers.get('If-None-Match'), etag)) {
+        return new Response(null, { status: 304, headers: cacheHeaders });
+      }
+
       // Search endpoint - find file by date
       if (url.pathname === '/search') {
         const dateParam = url.searchParams.get('date');
@@ -93,51 +137,49 @@ export default {
         // Normalize date to match file format (M-D-YYYY without leading zeros)
         const normalizedDate = normalizeDateForSearch(dateParam);
         
-        // List all objects in the bucket
-        const listed = await env.MY_BUCKET.list();
-        
-        // Find matching file
-        for (const object of listed.objects) {
-          if (object.key.match(/\d+-\d+-\d+.*\.pdf$/i)) {
-            const dateMatch = object.key.match(/(\d+-\d+-\d+)/);
-            if (dateMatch && dateMatch[1] === normalizedDate) {
-              const publicUrl = `https://files.carolinapanorama.org/${object.key}`;
-              return new Response(JSON.stringify({ 
-                url: publicUrl, 
-                date: dateMatch[1] 
-              }), {
-                headers: corsHeaders
-              });
-            }
-          }
+        const key = index.dates[normalizedDate];
+        if (key) {
+          return new Response(JSON.stringify({ 
+            url: `${PUBLIC_BASE_URL}/${key}`, 
+            date: normalizedDate 
+          }), {
+            headers: cacheHeaders
+          });
         }
         
+        // A file for this date may be uploaded at any time
         return new Response(JSON.stringify({ error: 'File not found' }), {
           status: 404,
-          headers: corsHeaders
+          headers: { ...corsHeaders, 'Cache-Control': NOT_FOUND_CACHE_CONTROL }
         });
       }
       
-      // List all objects in the bucket
-      const listed = await env.MY_BUCKET.list();
+      // Optional pagination: ?limit=N[&cursor=...] returns { files, cursor }
+      if (url.searchParams.has('limit')) {
+        const limit = Math.min(Math.max(parseInt(url.searchParams.get('limit'), 10) || MAX_PAGE_SIZE, 1), MAX_PAGE_SIZE);
+        const offset = parseInt(url.searchParams.get('cursor') || '0', 10) || 0;
+        const keys = Object.keys(index.files).slice(offset, offset + limit);
+        const files = {};
+        for (const key of keys) {
+          files[`${PUBLIC_BASE_URL}/${key}`] = index.files[key];
+        }
+        const nextOffset = offset + keys.length;
+        return new Response(JSON.stringify({
+          files,
+          cursor: nextOffset < Object.keys(index.files).length ? String(nextOffset) : null
+        }), {
+          headers: cacheHeaders
+        });
+      }
       
-      // Filter and format files
+      // Full list: { publicUrl: date }
       const fileList = {};
-      
-      for (const object of listed.objects) {
-        // Only include PDF files with date pattern
-        if (object.key.match(/\d+-\d+-\d+.*\.pdf$/i)) {
-          const dateMatch = object.key.match(/(\d+-\d+-\d+)/);
-          if (dateMatch) {
-            // Construct public URL
-            const publicUrl = `https://files.carolinapanorama.org/${object.key}`;
-            fileList[publicUrl] = dateMatch[1];
-          }
-        }
+      for (const [key, date] of Object.entries(index.files)) {
+        fileList[`${PUBLIC_BASE_URL}/${key}`] = date;
       }
       
       return new Response(JSON.stringify(fileList), {
-        headers: corsHeaders
+        headers: cacheHeaders
       });
       
     } catch (error) {
@@ -147,4 +189,86 @@ export default {
       });
     }
   }
-};
\ No newline at end of file
+};
+
+async function sha256Hex(text, bytes = 32) {
+  const digest = await crypto.subtle.digest('SHA-256', new TextEncoder().encode(text));
+  return [...new Uint8Array(digest).slice(0, bytes)].map(b => b.toString(16).padStart(2, '0')).join('');
+}
+
+// If-None-Match check. Cloudflare weakens the ETag (W/"...") when it compresses the
+// response, and the header may list several tags, so compare the opaque parts of each.
+function etagMatches(ifNoneMatch, etag) {
+  if (!ifNoneMatch || !etag) return false;
+  const opaque = tag => tag.trim().replace(/^W\//, '');
+  return ifNoneMatch.split(',').some(tag => tag.trim() === '*' || opaque(tag) === opaque(etag));
+}
+
+// Date part of a dated PDF key ("4-15-2025"), or null for other objects
+function fileDate(key) {
+  if (!key.match(/\d+-\d+-\d+.*\.pdf$/i)) return null;
+  const dateMatch = key.match(/(\d+-\d+-\d+)/);
+  return dateMatch ? dateMatch[1] : null;
+}
+
+// Return the file index: memory copy, else the R2 index object, else a fresh build.
+// A stale index is served while a rebuild runs in the background.
+async function getFileIndex(bucket, ctx) {
+  const now = Date.now();
+  if (!memoryIndex || now - memoryIndexLoadedAt > MEMORY_INDEX_TTL_MS) {
+    const object = await bucket.get(INDEX_KEY);
+    if (object) {
+      memoryIndex = await object.json();
+      memoryIndexLoadedAt = now;
+    } else {
+      return rebuildFileIndex(bucket);
+    }
+  }
+
+  if (now - memoryIndex.generatedAt > INDEX_MAX_AGE_MS && !rebuildPromise) {
+    const rebuild = rebuildFileIndex(bucket).catch(error => console.error('File index rebuild failed:', error));
+    if (ctx) ctx.waitUntil(rebuild);
+  }
+  return memoryIndex;
+}
+
+// List the whole bucket (following cursors) and write the index object
+async function rebuildFileIndex(bucket) {
+  if (rebuildPromise) return rebuildPromise;
+
+  rebuildPromise = (async () => {
+    const entries = [];
+    let cursor;
+    do {
+      const listed = await bucket.list({ cursor, limit: 1000 });
+      for (const object of listed.objects) {
+        const date = fileDate(object.key);
+        if (date) entries.push([object.key, date]);
+      }
+      cursor = listed.truncated ? listed.cursor : undefined;
+    } while (cursor);
+
+    entries.sort((a, b) => a[0].localeCompare(b[0]));
+    const files = Object.fromEntries(entries);
+    const dates = {};
+    for (const [key, date] of entries) {
+      if (!dates[date]) dates[date] = key;
+    }
+
+    const etag = '"' + await sha256Hex(JSON.stringify(files), 16) + '"';
+
+    const index = { generatedAt: Date.now(), etag, files, dates };
+    await bucket.put(INDEX_KEY, JSON.stringify(index), {
+      httpMetadata: { contentType: 'application/json' }
+    });
+    memoryIndex = index;
+    memoryIndexLoadedAt = Date.now();
+    return index;
+  })();
+
+  try {
+    return await rebuildPromise;
+  } finally {
+    rebuildPromise = null;
+  }
+}
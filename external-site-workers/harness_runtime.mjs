@@ -0,0 +1,436 @@
+// Node runtime for worker_harness.py: runs a Cloudflare Worker module's fetch/scheduled
+// handlers against in-memory KV, R2 and Cache API (caches.default) stand-ins, with every
+// binding call counted, sized and timed. Reads a scenario (JSON) on stdin, writes a report (JSON) on stdout.
+//
+// Scenario:
+// {
+//   "worker": "external-site-workers/rss-sync-worker.js",
+//   "env": { "VAR": "value" },
+//   "kv": { "BINDING": [{ "key": "...", "value": "...", "metadata": {...} }] },
+//   "r2": { "BINDING": [{ "key": "...", "value": "..." }] },
+//   "latency_ms": { "kv": 0, "r2": 0, "cache": 0 }, // simulated per-call latency
+//   "algolia_base": "http://127.0.0.1:PORT",      // *.algolia.net is rewritten here
+//   "fresh_isolate": false,                       // re-import the module for every step
+//   "steps": [
+//     { "handler": "scheduled", "repeat": 3 },
+//     { "handler": "fetch", "url": "https://w.dev/search?date=1-2-2025", "headers": {...} },
+//     { "handler": "fetch", "url": "https://w.dev/", "delay_ms": 1500 }  // wait before the step
+//   ]
+// }
+
+import { readFileSync } from 'node:fs';
+
+const encoder = new TextEncoder();
+
+function byteLength(value) {
+  if (value === null || value === undefined) return 0;
+  if (typeof value === 'string') return encoder.encode(value).length;
+  if (value instanceof ArrayBuffer) return value.byteLength;
+  if (ArrayBuffer.isView(value)) return value.byteLength;
+  return encoder.encode(JSON.stringify(value)).length;
+}
+
+const sleep = ms => (ms > 0 ? new Promise(resolve => setTimeout(resolve, ms)) : Promise.resolve());
+
+// ===== STATS =====
+
+class BindingStats {
+  constructor() {
+    this.reset();
+  }
+
+  reset() {
+    this.bindings = {};
+  }
+
+  record(binding, op, { bytesIn = 0, bytesOut = 0, ms = 0 } = {}) {
+    const stats = this.bindings[binding] ||= { calls: {}, total_calls: 0, bytes_in: 0, bytes_out: 0, latency_ms: 0 };
+    stats.calls[op] = (stats.calls[op] || 0) + 1;
+    stats.total_calls += 1;
+    stats.bytes_in += bytesIn;
+    stats.bytes_out += bytesOut;
+    stats.latency_ms += ms;
+  }
+
+  snapshot() {
+    const out = {};
+    for (const [name, stats] of Object.entries(this.bindings)) {
+      out[name] = { ...stats, calls: { ...stats.calls }, latency_ms: Math.round(stats.latency_ms * 100) / 100 };
+    }
+    return out;
+  }
+}
+
+const stats = new BindingStats();
+
+async function timed(binding, op, latency, fn, sizes) {
+  const start = performance.now();
+  await sleep(latency);
+  const result = await fn();
+  stats.record(binding, op, { ...sizes(result), ms: performance.now() - start });
+  return result;
+}
+
+// ===== KV =====
+
+class MemoryKV {
+  constructor(name, entries = [], latency = 0) {
+    this.name = name;
+    this.latency = latency;
+    this.store = new Map();
+    for (const entry of entries) {
+      this.store.set(entry.key, { value: entry.value, metadata: entry.metadata ?? null, expiresAt: null });
+    }
+  }
+
+  _live(key) {
+    const entry = this.store.get(key);
+    if (entry && entry.expiresAt !== null && entry.expiresAt <= Date.now()) {
+      this.store.delete(key);
+      return null;
+    }
+    return entry || null;
+  }
+
+  _decode(entry, type) {
+    if (!entry) return null;
+    if (type === 'json') return JSON.parse(entry.value);
+    if (type === 'arrayBuffer') return encoder.encode(entry.value).buffer;
+    return entry.value;
+  }
+
+  async get(key, options) {
+    const type = typeof options === 'string' ? options : options?.type;
+    return timed(this.name, 'get', this.latency, () => this._decode(this._live(key), type), () => ({
+      bytesOut: byteLength(this._live(key)?.value)
+    }));
+  }
+
+  async getWithMetadata(key, options) {
+    const type = typeof options === 'string' ? options : options?.type;
+    return timed(this.name, 'getWithMetadata', this.latency, () => {
+      const entry = this._live(key);
+      return { value: this._decode(entry, type), metadata: entry ? entry.metadata : null };
+    }, () => ({ bytesOut: byteLength(this._live(key)?.value) }));
+  }
+
+  async put(key, value, options = {}) {
+    const text = typeof value === 'string' ? value : new TextDecoder().decode(value);
+    return timed(this.name, 'put', this.latency, () => {
+      let expiresAt = null;
+      if (options.expirationTtl) expiresAt = Date.now() + options.expirationTtl * 1000;
+      if (options.expiration) expiresAt = options.expiration * 1000;
+      this.store.set(key, { value: text, metadata: options.metadata ?? null, expiresAt });
+    }, () => ({ bytesIn: byteLength(text) + byteLength(options.metadata) }));
+  }
+
+  async delete(key) {
+    return timed(this.name, 'delete', this.latency, () => {
+      this.store.delete(key);
+    }, () => ({}));
+  }
+
+  async list({ prefix = '', cursor = null, limit = 1000 } = {}) {
+    return timed(this.name, 'list', this.latency, () => {
+      // The cursor is the last key returned, so keys deleted between pages don't shift
+      // later pages (as with KV's own cursors)
+      const names = [...this.store.keys()]
+        .filter(key => key.startsWith(prefix) && (!cursor || key > cursor) && this._live(key))
+        .sort();
+      const page = names.slice(0, limit);
+      const complete = names.length <= limit;
+      return {
+        keys: page.map(name => {
+          const entry = this.store.get(name);
+          const key = { name };
+          if (entry.metadata !== null) key.metadata = entry.metadata;
+          if (entry.expiresAt !== null) key.expiration = Math.floor(entry.expiresAt / 1000);
+          return key;
+        }),
+        list_complete: complete,
+        cursor: complete ? undefined : page[page.length - 1]
+      };
+    }, result => ({ bytesOut: byteLength(result.keys) }));
+  }
+
+  dump() {
+    return { keys: this.store.size, bytes: [...this.store.values()].reduce((sum, e) => sum + byteLength(e.value), 0) };
+  }
+}
+
+// ===== R2 =====
+
+class MemoryR2Object {
+  constructor(key, data, options = {}) {
+    this.key = key;
+    this.size = data.byteLength;
+    this.etag = String(data.byteLength) + '-' + key.length;
+    this.httpEtag = `"${this.etag}"`;
+    this.uploaded = new Date();
+    this.httpMetadata = options.httpMetadata || {};
+    this.customMetadata = options.customMetadata || {};
+    this._data = data;
+  }
+
+  get body() {
+    const data = this._data;
+    return new ReadableStream({
+      start(controller) {
+        controller.enqueue(data);
+        controller.close();
+      }
+    });
+  }
+
+  async text() {
+    return new TextDecoder().decode(this._data);
+  }
+
+  async json() {
+    return JSON.parse(await this.text());
+  }
+
+  async arrayBuffer() {
+    return this._data.buffer.slice(this._data.byteOffset, this._data.byteOffset + this._data.byteLength);
+  }
+}
+
+class MemoryR2 {
+  constructor(name, entries = [], latency = 0) {
+    this.name = name;
+    this.latency = latency;
+    this.objects = new Map();
+    for (const entry of entries) {
+      this.objects.set(entry.key, new MemoryR2Object(entry.key, encoder.encode(entry.value ?? '')));
+    }
+  }
+
+  async get(key) {
+    return timed(this.name, 'get', this.latency, () => this.objects.get(key) || null, object => ({
+      bytesOut: object ? object.size : 0
+    }));
+  }
+
+  async head(key) {
+    return timed(this.name, 'head', this.latency, () => this.objects.get(key) || null, () => ({}));
+  }
+
+  async put(key, value, options = {}) {
+    const data = typeof value === 'string' ? encoder.encode(value)
+      : value instanceof ArrayBuffer ? new Uint8Array(value)
+      : ArrayBuffer.isView(value) ? new Uint8Array(value.buffer, value.byteOffset, value.byteLength)
+      : encoder.encode(await new Response(value).text());
+    return timed(this.name, 'put', this.latency, () => {
+      const object = new MemoryR2Object(key, data, options);
+      this.objects.set(key, object);
+      return object;
+    }, () => ({ bytesIn: data.byteLength }));
+  }
+
+  async delete(keys) {
+    return timed(this.name, 'delete', this.latency, () => {
+      for (const key of [].concat(keys)) this.objects.delete(key);
+    }, () => ({}));
+  }
+
+  async list({ prefix = '', cursor = null, limit = 1000 } = {}) {
+    return timed(this.name, 'list', this.latency, () => {
+      const keys = [...this.objects.keys()].filter(key => key.startsWith(prefix)).sort();
+      const start = cursor ? Number(cursor) : 0;
+      const page = keys.slice(start, start + limit);
+      const truncated = start + limit < keys.length;
+      return {
+        objects: page.map(key => this.objects.get(key)),
+        truncated,
+        cursor: truncated ? String(start + limit) : undefined,
+        delimitedPrefixes: []
+      };
+    }, result => ({ bytesOut: byteLength(result.objects.map(o => o.key)) }));
+  }
+
+  dump() {
+    return { objects: this.objects.size, bytes: [...this.objects.values()].reduce((sum, o) => sum + o.size, 0) };
+  }
+}
+
+// ===== CACHE API =====
+
+// caches.default: entries expire after the stored response's s-maxage / max-age
+class MemoryCache {
+  constructor(latency = 0) {
+    this.name = 'CACHE';
+    this.latency = latency;
+    this.entries = new Map();
+  }
+
+  _key(request) {
+    return new URL(typeof request === 'string' ? request : request.url).toString();
+  }
+
+  _live(key) {
+    const entry = this.entries.get(key);
+    if (entry && entry.expiresAt <= Date.now()) {
+      this.entries.delete(key);
+      return null;
+    }
+    return entry || null;
+  }
+
+  async match(request) {
+    const key = this._key(request);
+    return timed(this.name, 'match', this.latency, () => {
+      const entry = this._live(key);
+      return entry ? new Response(entry.body.slice(0), { status: entry.status, headers: entry.headers }) : undefined;
+    }, () => ({ bytesOut: this._live(key)?.body.byteLength || 0 }));
+  }
+
+  async put(request, response) {
+    const key = this._key(request);
+    const body = new Uint8Array(await response.arrayBuffer());
+    const cacheControl = response.headers.get('Cache-Control') || '';
+    const maxAge = /s-maxage=(\d+)/.exec(cacheControl) || /max-age=(\d+)/.exec(cacheControl);
+    return timed(this.name, 'put', this.latency, () => {
+      if (/no-store|private/.test(cacheControl) || !maxAge) return;
+      this.entries.set(key, {
+        body,
+        status: response.status,
+        headers: [...response.headers],
+        expiresAt: Date.now() + Number(maxAge[1]) * 1000
+      });
+    }, () => ({ bytesIn: body.byteLength }));
+  }
+
+  async delete(request) {
+    const key = this._key(request);
+    return timed(this.name, 'delete', this.latency, () => this.entries.delete(key), () => ({}));
+  }
+
+  dump() {
+    return { entries: this.entries.size, bytes: [...this.entries.values()].reduce((sum, e) => sum + e.body.byteLength, 0) };
+  }
+}
+
+// ===== FETCH =====
+
+// Route *.algolia.net to the stub server and record every outbound request
+function installFetch(algoliaBase) {
+  const realFetch = globalThis.fetch;
+  globalThis.fetch = async (input, init = {}) => {
+    const request = new Request(input, init);
+    let url = new URL(request.url);
+    let binding = 'FETCH';
+    if (url.hostname.endsWith('.algolia.net') || url.hostname.endsWith('.algolianet.com')) {
+      binding = 'ALGOLIA';
+      if (algoliaBase) url = new URL(url.pathname + url.search, algoliaBase);
+    }
+    const body = ['GET', 'HEAD'].includes(request.method) ? undefined : await request.arrayBuffer();
+    const start = performance.now();
+    const response = await realFetch(url, {
+      method: request.method,
+      headers: request.headers,
+      body,
+      signal: init.signal
+    });
+    stats.record(binding, request.method, {
+      bytesIn: body ? body.byteLength : 0,
+      bytesOut: Number(response.headers.get('Content-Length') || 0),
+      ms: performance.now() - start
+    });
+    return response;
+  };
+}
+
+// ===== RUNNER =====
+
+async function importWorker(source, generation) {
+  // data: URL import works for the self-contained worker modules; the trailing
+  // comment makes each generation a distinct module instance (a fresh isolate)
+  const code = `${source}\n// isolate ${generation}\n`;
+  const module = await import('data:text/javascript;base64,' + Buffer.from(code).toString('base64'));
+  return module.default;
+}
+
+async function runStep(worker, step, env) {
+  const waitUntil = [];
+  const ctx = {
+    waitUntil: promise => waitUntil.push(promise),
+    passThroughOnException: () => {}
+  };
+
+  const start = performance.now();
+  const result = { handler: step.handler };
+  if (step.handler === 'scheduled') {
+    await worker.scheduled({ cron: step.cron || '* * * * *', scheduledTime: Date.now() }, env, ctx);
+  } else {
+    const request = new Request(step.url, {
+      method: step.method || 'GET',
+      headers: step.headers || {},
+      body: step.body
+    });
+    const response = await worker.fetch(request, env, ctx);
+    const body = await response.arrayBuffer();
+    result.url = step.url;
+    result.status = response.status;
+    result.response_bytes = body.byteLength;
+    result.response_headers = Object.fromEntries(response.headers);
+  }
+  result.handler_ms = Math.round((performance.now() - start) * 100) / 100;
+  await Promise.allSettled(waitUntil);
+  result.total_ms = Math.round((performance.now() - start) * 100) / 100;
+  return result;
+}
+
+async function main() {
+  const scenario = JSON.parse(readFileSync(0, 'utf8'));
+  const source = readFileSync(scenario.worker, 'utf8');
+  const latency = scenario.latency_ms || {};
+
+  const env = { ...(scenario.env || {}) };
+  const bindings = {};
+  for (const [name, entries] of Object.entries(scenario.kv || {})) {
+    bindings[name] = env[name] = new MemoryKV(name, entries, latency.kv || 0);
+  }
+  for (const [name, entries] of Object.entries(scenario.r2 || {})) {
+    bindings[name] = env[name] = new MemoryR2(name, entries, latency.r2 || 0);
+  }
+
+  const cache = bindings.CACHE = new MemoryCache(latency.cache || 0);
+  globalThis.caches = { default: cache, open: async () => cache };
+
+  installFetch(scenario.algolia_base);
+
+  // Worker logs go to stderr so stdout stays a clean JSON report
+  if (!scenario.verbose) {
+    console.log = console.info = console.warn = () => {};
+  } else {
+    console.log = console.info = console.warn = (...args) => process.stderr.write(args.join(' ') + '\n');
+  }
+  console.error = (...args) => process.stderr.write(args.join(' ') + '\n');
+
+  const runs = [];
+  let generation = 0;
+  let worker = await importWorker(source, generation);
+  for (const step of scenario.steps || []) {
+    await sleep(step.delay_ms || 0);
+    for (let i = 0; i < (step.repeat || 1); i++) {
+      if (scenario.fresh_isolate && runs.length > 0) {
+        worker = await importWorker(source, ++generation);
+      }
+      stats.reset();
+      const result = await runStep(worker, step, env);
+      result.bindings = stats.snapshot();
+      runs.push(result);
+    }
+  }
+
+  const state = {};
+  for (const [name, binding] of Object.entries(bindings)) {
+    state[name] = binding.dump();
+  }
+  process.stdout.write(JSON.stringify({ worker: scenario.worker, runs, state }) + '\n');
+}
+
+main().catch(error => {
+  process.stderr.write(`harness runtime failed: ${error.stack || error}\n`);
+  process.exit(1);
+});
@@ -0,0 +1,214 @@
+// Cloudflare Worker: homepage payload aggregator
+//
+// The homepage widgets each call the CMS public API from every visitor's browser:
+// headlines (headlines-grid-v2), trending (trending-carousel-v2), one articles call per
+// category (article-list-feed) and categories (CarolinaPanorama.fetchCategories). This
+// worker makes those calls once, keeps the combined JSON in the edge cache and serves
+// it as a single response:
+//
+//   GET /  ->  { "generated_at": "...", "responses": { "<path?query>": <CMS JSON>, ... } }
+//
+// Keys are the exact paths (with query) the widgets request, so the global JS answers
+// their fetchJSON() calls from the payload when CarolinaPanorama.HOMEPAGE_API_URL is set.
+//
+// A payload younger than FRESH_SECONDS is served as is. Up to STALE_SECONDS old it is
+// served stale while one refresh per isolate runs in the background
+// (stale-while-revalidate); older or missing, the request waits for the rebuild. A CMS
+// call that fails keeps its entry from the previous payload. The edge cache is the
+// Cache API (a no-op on workers.dev), backed by a per-isolate memory copy.
+//
+// Environment variables (all optional):
+// - CMS_BASE_URL: CMS origin (default https://cms.carolinapanorama.org)
+// - HOMEPAGE_CATEGORIES: comma-separated article-list-feed categories
+// - FRESH_SECONDS / STALE_SECONDS: cache windows (default 60 / 3600)
+
+const DEFAULT_CMS_BASE_URL = 'https://cms.carolinapanorama.org';
+// Must match CATEGORIES / ARTICLES_PER_CATEGORY in article-list-feed.html
+const DEFAULT_CATEGORIES = ['Local News', 'Business', 'Sports', 'Education', 'Culture'];
+const ARTICLES_PER_CATEGORY = 3;
+const DEFAULT_FRESH_SECONDS = 60;
+const DEFAULT_STALE_SECONDS = 3600;
+const CMS_TIMEOUT_MS = 8000;
+const CACHE_KEY_PATH = '/__homepage-payload/v1';
+const CLIENT_CACHE_CONTROL = 'public, max-age=60, stale-while-revalidate=600';
+
+// Per-isolate copy of the payload, and the refresh in flight (one per isolate)
+let memoryEntry = null;
+let refreshPromise = null;
+
+export default {
+  async fetch(request, env, ctx) {
+    const corsHeaders = {
+      'Access-Control-Allow-Origin': '*',
+      'Access-Control-Allow-Methods': 'GET, OPTIONS',
+      'Access-Control-Allow-Headers': 'Content-Type, If-None-Match',
+      'Access-Control-Expose-Headers': 'ETag, X-Cache',
+      'Content-Type': 'application/json'
+    };
+
+    if (request.method === 'OPTIONS') {
+      return new Response(null, { headers: corsHeaders });
+    }
+
+    const url = new URL(request.url);
+    if (request.method !== 'GET' || (url.pathname !== '/' && url.pathname !== '')) {
+      return new Response('Not Found', {
+        status: 404,
+        headers: { 'Content-Type': 'text/plain' }
+      });
+    }
+
+    try {
+      const { entry, state } = await getPayload(env, ctx, new URL(CACHE_KEY_PATH, url).toString());
+      const headers = { ...corsHeaders, 'Cache-Control': CLIENT_CACHE_CONTROL, 'ETag': entry.etag, 'X-Cache': state };
+
+      if (etagMatches(request.headers.get('If-None-Match'), entry.etag)) {
+        return new Response(null, { status: 304, headers });
+      }
+      return new Response(entry.body, { headers });
+    } catch (error) {
+      return new Response(JSON.stringify({ error: error.message }), {
+        status: 502,
+        headers: corsHeaders
+      });
+    }
+  }
+};
+
+// If-None-Match check. Cloudflare weakens the ETag (W/"...") when it compresses the
+// response, and the header may list several tags, so compare the opaque parts of each.
+function etagMatches(ifNoneMatch, etag) {
+  if (!ifNoneMatch || !etag) return false;
+  const opaque = tag => tag.trim().replace(/^W\//, '');
+  return ifNoneMatch.split(',').some(tag => tag.trim() === '*' || opaque(tag) === opaque(etag));
+}
+
+// CMS paths the homepage widgets request, spelled exactly as the widgets build them
+function homepagePaths(env) {
+  const categories = env.HOMEPAGE_CATEGORIES
+    ? env.HOMEPAGE_CATEGORIES.split(',').map(name => name.trim()).filter(Boolean)
+    : DEFAULT_CATEGORIES;
+  return [
+    '/api/public/headlines',
+    '/api/public/trending',
+    '/api/public/categories',
+    ...categories.map(category =>
+      `/api/public/articles?category=${encodeURIComponent(category)}&per_page=${ARTICLES_PER_CATEGORY}&page=1`)
+  ];
+}
+
+function windowMs(value, fallbackSeconds) {
+  const seconds = Number(value);
+  return (Number.isFinite(seconds) && seconds > 0 ? seconds : fallbackSeconds) * 1000;
+}
+
+// Return { entry, state } where state is HIT (fresh), STALE (refreshing in the
+// background) or MISS (rebuilt for this request)
+async function getPayload(env, ctx, cacheKey) {
+  const freshMs = windowMs(env.FRESH_SECONDS, DEFAULT_FRESH_SECONDS);
+  const staleMs = windowMs(env.STALE_SECONDS, DEFAULT_STALE_SECONDS);
+
+  let entry = memoryEntry;
+  if (!entry || Date.now() - entry.generatedAt > freshMs) {
+    const cached = await caches.default.match(cacheKey);
+    if (cached) {
+      const body = await cached.text();
+      const generatedAt = Number(cached.headers.get('X-Generated-At')) || 0;
+      if (!entry || generatedAt > entry.generatedAt) {
+        entry = { body, etag: cached.headers.get('ETag'), generatedAt, payload: JSON.parse(body) };
+        memoryEntry = entry;
+      }
+    }
+  }
+
+  const age = entry ? Date.now() - entry.generatedAt : Infinity;
+  if (age <= freshMs) {
+    return { entry, state: 'HIT' };
+  }
+  if (age <= staleMs) {
+    const refresh = refreshPayload(env, cacheKey, staleMs, entry)
+      .catch(error => console.error('Homepage payload refresh failed:', error));
+    if (ctx) ctx.waitUntil(refresh);
+    return { entry, state: 'STALE' };
+  }
+
+  try {
+    return { entry: await refreshPayload(env, cacheKey, staleMs, entry), state: 'MISS' };
+  } catch (error) {
+    // CMS down and the payload past its stale window: an old homepage beats none
+    if (entry) return { entry, state: 'STALE' };
+    throw error;
+  }
+}
+
+// Fetch every homepage path from the CMS and store the combined payload
+async function refreshPayload(env, cacheKey, staleMs, previous) {
+  if (refreshPromise) return refreshPromise;
+
+  refreshPromise = (async () => {
+    const base = (env.CMS_BASE_URL || DEFAULT_CMS_BASE_URL).replace(/\/+$/, '');
+    const paths = homepagePaths(env);
+    const results = await Promise.all(paths.map(path => fetchCmsJson(base + path)));
+
+    const responses = {};
+    const errors = [];
+    paths.forEach((path, i) => {
+      if (results[i] !== null) {
+        responses[path] = results[i];
+      } else {
+        errors.push(path);
+        if (previous && previous.payload.responses[path]) responses[path] = previous.payload.responses[path];
+      }
+    });
+    if (Object.keys(responses).length === 0) {
+      throw new Error('All homepage CMS requests failed');
+    }
+
+    // The ETag covers the content only, so an unchanged homepage revalidates with a 304
+    const digest = await crypto.subtle.digest('SHA-256', new TextEncoder().encode(JSON.stringify(responses)));
+    const etag = '"' + [...new Uint8Array(digest).slice(0, 16)].map(b => b.toString(16).padStart(2, '0')).join('') + '"';
+
+    const generatedAt = Date.now();
+    const payload = { generated_at: new Date(generatedAt).toISOString(), responses };
+    if (errors.length) payload.errors = errors;
+    const body = JSON.stringify(payload);
+
+    await caches.default.put(cacheKey, new Response(body, {
+      headers: {
+        'Content-Type': 'application/json',
+        'Cache-Control': `public, max-age=${Math.round(staleMs / 1000)}`,
+        'ETag': etag,
+        'X-Generated-At': String(generatedAt)
+      }
+    }));
+
+    memoryEntry = { body, etag, generatedAt, payload };
+    return memoryEntry;
+  })();
+
+  try {
+    return await refreshPromise;
+  } finally {
+    refreshPromise = null;
+  }
+}
+
+// Parsed CMS JSON, or null if the call failed or timed out
+async function fetchCmsJson(url) {
+  const controller = new AbortController();
+  const timer = setTimeout(() => controller.abort(), CMS_TIMEOUT_MS);
+  try {
+    const response = await fetch(url, { signal: controller.signal, headers: { 'Accept': 'application/json' } });
+    if (!response.ok) {
+      console.error(`CMS request failed: ${response.status} ${url}`);
+      return null;
+    }
+    const json = await response.json();
+    return json && json.success !== false ? json : null;
+  } catch (error) {
+    console.error(`CMS request failed: ${url}`, error);
+    return null;
+  } finally {
+    clearTimeout(timer);
+  }
+}
@@ -9,10 +9,33 @@
 // - RSS_FEED_URL: Your GHL RSS feed URL
 // - RSS_SYNC_KV: KV namespace binding for storing last-modified info and batch progress
 // - BATCH_SIZE: Number of articles to process per run (default: 50)
+// - METADATA_CONCURRENCY: Article pages scraped in parallel (default: 6)
+//
+// Processed GUIDs are stored per publish month ("processed-guids:2026-10") with a
+// small index ("processed-guids:index") mapping each month to a fingerprint of its
+// feed GUIDs once every one of them is processed. Fully processed months are never
+// loaded again, and months that drop out of the feed are deleted, so each run reads
+// and writes a bounded amount of KV however large the archive grows.
+//
+// The feed is parsed as a stream, one <item> at a time. Once a run finishes with
+// nothing left to process, the newest GUID is saved as "processed-guids:head" and
+// later runs stop reading the feed (and cancel the download) when they reach it.
 
 // Cron trigger: 0 */6 * * * (runs at 00:00, 06:00, 12:00, 18:00 UTC)
 
 const DEFAULT_BATCH_SIZE = 50;
+const LEGACY_GUIDS_KEY = 'processed-guids'; // pre-sharding single JSON array
+const GUID_SHARD_PREFIX = 'processed-guids:';
+const GUID_INDEX_KEY = 'processed-guids:index';
+const GUID_HEAD_KEY = 'processed-guids:head';
+
+// Article page scraping (author/tags)
+const DEFAULT_METADATA_CONCURRENCY = 6;
+const METADATA_TIMEOUT_MS = 8000;
+const METADATA_MAX_ATTEMPTS = 3;
+const METADATA_RETRY_BASE_MS = 500;
+const METADATA_CACHE_PREFIX = 'article-meta:';
+const METADATA_CACHE_TTL = 30 * 24 * 60 * 60; // seconds
 
 export default {
   async scheduled(event, env, ctx) {
@@ -26,13 +49,13 @@ export default {
       if (resetFlag === 'true') {
         console.log('Reset flag detected - clearing processed articles list');
         if (env.RSS_SYNC_KV) {
-          await env.RSS_SYNC_KV.delete('processed-guids');
+          await clearGuidStore(env.RSS_SYNC_KV);
           await env.RSS_SYNC_KV.delete('reset-flag'); // Clear the flag
         }
         console.log('Reset complete');
       }
       
-      // Fetch RSS feed (always fetch full feed to detect new articles)
+      // Fetch RSS feed (read until the last synced item, or in full while backfilling)
       const rssUrl = env.RSS_FEED_URL || 'YOUR_RSS_FEED_URL_HERE';
       
       const response = await fetch(rssUrl);
@@ -41,27 +64,40 @@ export default {
         throw new Error(`Failed to fetch RSS feed: ${response.status}`);
       }
       
-      const xmlText = await response.text();
+      const head = env.RSS_SYNC_KV ? await env.RSS_SYNC_KV.get(GUID_HEAD_KEY) : null;
       
-      // Parse RSS feed to get all article GUIDs
-      const allArticleGuids = await parseRSSGuids(xmlText);
-      console.log(`Found ${allArticleGuids.length} total articles in RSS feed`);
+      // Stream feed items (newest first), stopping at the newest item of the last complete sync
+      const feedItems = [];
+      let reachedHead = false;
+      for await (const item of streamRSSItems(response.body)) {
+        if (!item.guid) continue;
+        if (head && item.guid === head) {
+          reachedHead = true;
+          break;
+        }
+        feedItems.push(item);
+      }
+      console.log(reachedHead
+        ? `Found ${feedItems.length} articles newer than the last synced item`
+        : `Found ${feedItems.length} total articles in RSS feed`);
       
-      if (allArticleGuids.length === 0) {
-        console.log('No articles found in RSS feed');
+      if (feedItems.length === 0) {
+        console.log(reachedHead ? 'All articles already processed' : 'No articles found in RSS feed');
         return;
       }
       
-      // Get list of already-processed article GUIDs from KV
-      const processedGuidsJson = env.RSS_SYNC_KV ? await env.RSS_SYNC_KV.get('processed-guids') : null;
-      const processedGuids = processedGuidsJson ? JSON.parse(processedGuidsJson) : [];
+      // Load processed GUIDs - only for months that still have unprocessed items
+      const guidStore = await loadGuidStore(env.RSS_SYNC_KV, feedItems, { partial: reachedHead });
       
-      console.log(`Already processed ${processedGuids.length} articles`);
+      console.log(`Already processed ${guidStore.processed.size} articles (${guidStore.shards.size} month shard(s) loaded)`);
       
       // Find articles that haven't been processed yet
-      const unprocessedGuids = allArticleGuids.filter(guid => !processedGuids.includes(guid));
+      const unprocessedGuids = [...new Set(feedItems.map(item => item.guid))]
+        .filter(guid => !guidStore.processed.has(guid));
       
       if (unprocessedGuids.length === 0) {
+        await saveGuidStore(env.RSS_SYNC_KV, guidStore, []);
+        await saveFeedHead(env.RSS_SYNC_KV, feedItems[0].guid, head);
         console.log('All articles already processed');
         return;
       }
@@ -73,16 +109,16 @@ export default {
       console.log(`Processing batch of ${batchGuids.length} articles`);
       
       // Parse full article data for this batch
-      const articles = await parseRSSBatch(xmlText, batchGuids);
+      const articles = await parseRSSBatch(feedItems, batchGuids, env);
       console.log(`Parsed ${articles.length} articles with metadata`);
       
       // Push to Algolia
       await pushToAlgolia(articles, env);
       
       // Mark these articles as processed
-      const newProcessedGuids = [...processedGuids, ...batchGuids];
-      if (env.RSS_SYNC_KV) {
-        await env.RSS_SYNC_KV.put('processed-guids', JSON.stringify(newProcessedGuids));
+      await saveGuidStore(env.RSS_SYNC_KV, guidStore, batchGuids);
+      if (batchGuids.length === unprocessedGuids.length) {
+        await saveFeedHead(env.RSS_SYNC_KV, feedItems[0].guid, head);
       }
       
       console.log(`RSS sync completed. Processed ${batchGuids.length} articles. ${unprocessedGuids.length - batchGuids.length} remaining.`);
@@ -102,183 +138,398 @@ export default {
   }
 };
 
-// Quick parse to get just GUIDs from RSS feed
-async function parseRSSGuids(xmlText) {
-  const guids = [];
+// Stream <item> records out of the feed body, one at a time. Only the current
+// (partial) item is buffered; breaking out of the loop cancels the download.
+async function* streamRSSItems(body) {
+  const reader = body.pipeThrough(new TextDecoderStream()).getReader();
+  let buffer = '';
   
-  const itemRegex = /<item>([\s\S]*?)<\/item>/g;
-  const items = xmlText.matchAll(itemRegex);
+  try {
+    while (true) {
+      const { done, value } = await reader.read();
+      if (value) buffer += value;
+      
+      let start;
+      let end;
+      while ((start = buffer.indexOf('<item>')) !== -1 && (end = buffer.indexOf('</item>', start)) !== -1) {
+        yield parseItem(buffer.slice(start + 6, end));
+        buffer = buffer.slice(end + 7);
+      }
+      
+      if (done) break;
+      
+      // Keep only an unfinished item (or a possible partial "<item>" tag)
+      start = buffer.indexOf('<item>');
+      buffer = start === -1 ? buffer.slice(-5) : buffer.slice(start);
+    }
+  } finally {
+    reader.cancel().catch(() => {});
+  }
+}
+
+// Direct children of an <item>: <tag attrs/> or <tag attrs>content</tag>
+const ITEM_CHILD_RE = /<([A-Za-z][\w:.-]*)([^>]*?)(?:\/>|>([\s\S]*?)<\/\1\s*>)/g;
+
+// Parse one item's fields in a single pass over its child elements
+function parseItem(xml) {
+  const item = { guid: '', link: '', title: '', description: '', pubDate: '', categories: [], image: null };
+  const images = {};
   
-  for (const match of items) {
-    const itemContent = match[1];
-    const link = extractTag(itemContent, 'link');
-    const guid = extractTag(itemContent, 'guid') || link;
-    
-    if (guid) {
-      guids.push(guid);
+  for (const [, tag, attrs, content = ''] of xml.matchAll(ITEM_CHILD_RE)) {
+    const name = tag.toLowerCase();
+    const value = content.trim();
+    switch (name) {
+      case 'guid':
+      case 'link':
+      case 'title':
+      case 'description':
+        if (!item[name]) item[name] = value;
+        break;
+      case 'pubdate':
+        if (!item.pubDate) item.pubDate = value;
+        break;
+      case 'category':
+        item.categories.push(value);
+        break;
+      case 'media:thumbnail':
+      case 'media:content':
+      case 'enclosure': {
+        const url = attrs.match(/url=["']([^"']+)["']/i);
+        const isImage = name !== 'enclosure' || /type=["']image/i.test(attrs);
+        if (url && isImage && !images[name]) images[name] = url[1];
+        break;
+      }
     }
   }
   
-  return guids;
+  // Same precedence as before: media:thumbnail, media:content, image enclosure, first <img>
+  item.image = images['media:thumbnail'] || images['media:content'] || images.enclosure || null;
+  if (!item.image) {
+    const img = xml.match(/<img[^>]*src=["']([^"']+)["']/i);
+    if (img) item.image = img[1];
+  }
+  
+  item.guid = item.guid || item.link;
+  item.month = guidMonth(item.pubDate);
+  return item;
 }
 
-// Parse full article data for specific GUIDs
-async function parseRSSBatch(xmlText, guidsToProcess) {
-  const articles = [];
+// Shard key for an item: "YYYY-MM" of its publish date
+function guidMonth(pubDate) {
+  const date = pubDate ? new Date(pubDate) : null;
+  if (!date || isNaN(date.getTime())) {
+    return 'undated';
+  }
+  return date.toISOString().slice(0, 7);
+}
+
+// Hex SHA-256 of a string, truncated to `bytes` bytes
+async function sha256Hex(text, bytes = 32) {
+  const digest = await crypto.subtle.digest('SHA-256', new TextEncoder().encode(text));
+  return [...new Uint8Array(digest).slice(0, bytes)].map(b => b.toString(16).padStart(2, '0')).join('');
+}
+
+// Stable fingerprint of a month's feed GUIDs (order-independent)
+async function fingerprintGuids(guids) {
+  return sha256Hex([...guids].sort().join('\n'), 8);
+}
+
+// Load processed GUIDs for the months in the feed. Months whose feed GUIDs match
+// the fingerprint recorded when they were completed are skipped without a KV read.
+// With `partial` (feed read only up to the head item) every month seen is loaded,
+// since its feed GUIDs are incomplete and can't match a fingerprint.
+async function loadGuidStore(kv, feedItems, { partial = false } = {}) {
+  const byMonth = new Map();
+  for (const { guid, month } of feedItems) {
+    if (!byMonth.has(month)) byMonth.set(month, new Set());
+    byMonth.get(month).add(guid);
+  }
   
-  const itemRegex = /<item>([\s\S]*?)<\/item>/g;
-  const items = xmlText.matchAll(itemRegex);
+  const indexJson = kv ? await kv.get(GUID_INDEX_KEY) : null;
+  const index = indexJson ? JSON.parse(indexJson) : {};
   
-  for (const match of items) {
-    const itemContent = match[1];
-    
-    const link = extractTag(itemContent, 'link');
-    const guid = extractTag(itemContent, 'guid') || link;
+  // One-time migration from the old single-array key
+  const legacyJson = kv ? await kv.get(LEGACY_GUIDS_KEY) : null;
+  const legacy = legacyJson ? new Set(JSON.parse(legacyJson)) : null;
+  
+  const processed = new Set();
+  const shards = new Map();
+  
+  await Promise.all([...byMonth].map(async ([month, guids]) => {
+    if (!partial && !legacy && index[month] && index[month] === await fingerprintGuids(guids)) {
+      guids.forEach(guid => processed.add(guid));
+      return;
+    }
     
-    // Skip if not in this batch
-    if (!guidsToProcess.includes(guid)) {
+    const shardJson = kv ? await kv.get(GUID_SHARD_PREFIX + month) : null;
+    const shard = new Set(shardJson ? JSON.parse(shardJson) : []);
+    if (legacy) {
+      guids.forEach(guid => legacy.has(guid) && shard.add(guid));
+    }
+    shards.set(month, shard);
+    shard.forEach(guid => processed.add(guid));
+  }));
+  
+  return { byMonth, index, shards, processed, partial, migrated: Boolean(legacy) };
+}
+
+// Record newly processed GUIDs, writing only the month shards that changed.
+// After a full feed read, shards are trimmed to GUIDs still in the feed and months
+// that left the feed are deleted; a partial read only adds.
+async function saveGuidStore(kv, store, newGuids) {
+  if (!kv) return;
+  
+  const newSet = new Set(newGuids);
+  const index = store.partial ? { ...store.index } : {};
+  const writes = [];
+  
+  for (const [month, guids] of store.byMonth) {
+    const shard = store.shards.get(month);
+    if (!shard) {
+      index[month] = store.index[month]; // complete and unchanged
       continue;
     }
     
-    // Extract fields
-    const title = extractTag(itemContent, 'title');
-    const description = extractTag(itemContent, 'description');
-    const pubDate = extractTag(itemContent, 'pubDate');
-    
-    // Optional: Extract category/tags
-    const categories = extractAllTags(itemContent, 'category');
-    
-    // Extract image URL from various RSS image tags
-    const image = extractImageUrl(itemContent);
+    let changed = store.migrated;
+    for (const guid of newSet) {
+      if (guids.has(guid) && !shard.has(guid)) {
+        shard.add(guid);
+        changed = true;
+      }
+    }
+    if (!store.partial) {
+      for (const guid of shard) {
+        if (!guids.has(guid)) {
+          shard.delete(guid);
+          changed = true;
+        }
+      }
+    }
     
-    // Fetch author and tags from the article page
-    const articleData = await fetchArticleMetadata(link);
+    if (changed) {
+      writes.push(kv.put(GUID_SHARD_PREFIX + month, JSON.stringify([...shard])));
+    }
+    // Complete: every feed GUID of the month is in the shard (items past the head
+    // of a partial read were processed already). Fingerprint the shard, which then
+    // equals the month's feed GUIDs.
+    const complete = [...guids].every(guid => shard.has(guid));
+    index[month] = complete ? await fingerprintGuids(shard) : null;
+  }
+  
+  if (!store.partial) {
+    for (const month of Object.keys(store.index)) {
+      if (!store.byMonth.has(month)) {
+        writes.push(kv.delete(GUID_SHARD_PREFIX + month));
+      }
+    }
+  }
+  
+  const indexJson = JSON.stringify(index);
+  if (indexJson !== JSON.stringify(store.index)) {
+    writes.push(kv.put(GUID_INDEX_KEY, indexJson));
+  }
+  if (store.migrated) {
+    writes.push(kv.delete(LEGACY_GUIDS_KEY));
+  }
+  
+  await Promise.all(writes);
+}
+
+// Remember the newest feed item once everything up to it is processed
+async function saveFeedHead(kv, guid, previousHead) {
+  if (kv && guid !== previousHead) {
+    await kv.put(GUID_HEAD_KEY, guid);
+  }
+}
+
+// Delete the index, every month shard it references, the head marker and the legacy key
+async function clearGuidStore(kv) {
+  const indexJson = await kv.get(GUID_INDEX_KEY);
+  const months = indexJson ? Object.keys(JSON.parse(indexJson)) : [];
+  await Promise.all([
+    ...months.map(month => kv.delete(GUID_SHARD_PREFIX + month)),
+    kv.delete(GUID_INDEX_KEY),
+    kv.delete(GUID_HEAD_KEY),
+    kv.delete(LEGACY_GUIDS_KEY),
+  ]);
+}
+
+// Build Algolia records for the batch GUIDs from parsed feed items
+async function parseRSSBatch(feedItems, guidsToProcess, env = {}) {
+  const articles = [];
+  const batch = new Set(guidsToProcess);
+  const links = [];
+  
+  for (const item of feedItems) {
+    // Skip if not in this batch
+    if (!batch.has(item.guid)) {
+      continue;
+    }
+    batch.delete(item.guid); // first occurrence only
     
-    // Create Algolia record
+    // Create Algolia record (author and tags filled in from the article page below)
     articles.push({
-      objectID: guid, // Unique ID for Algolia
-      title: cleanHTML(title),
-      description: cleanHTML(description),
-      url: link,
-      image: image,
-      author: articleData.author,
-      tags: articleData.tags,
-      publishedAt: pubDate ? new Date(pubDate).getTime() : Date.now(),
-      categories: categories,
+      objectID: item.guid, // Unique ID for Algolia
+      title: cleanHTML(item.title),
+      description: cleanHTML(item.description),
+      url: item.link,
+      image: item.image,
+      author: null,
+      tags: [],
+      publishedAt: item.pubDate ? new Date(item.pubDate).getTime() : Date.now(),
+      categories: item.categories,
     });
+    links.push(item.link);
   }
   
+  // Fetch author and tags from the article pages, a few at a time
+  const concurrency = Number(env.METADATA_CONCURRENCY) || DEFAULT_METADATA_CONCURRENCY;
+  const metadata = await mapWithConcurrency(links, concurrency, link => fetchArticleMetadata(link, env.RSS_SYNC_KV));
+  metadata.forEach((articleData, index) => {
+    articles[index].author = articleData.author;
+    articles[index].tags = articleData.tags;
+  });
+  
   return articles;
 }
 
-// Extract content from XML tag
-function extractTag(xml, tagName) {
-  const regex = new RegExp(`<${tagName}[^>]*>([\\s\\S]*?)<\/${tagName}>`, 'i');
-  const match = xml.match(regex);
-  return match ? match[1].trim() : '';
-}
-
-// Extract all occurrences of a tag
-function extractAllTags(xml, tagName) {
-  const regex = new RegExp(`<${tagName}[^>]*>([\\s\\S]*?)<\/${tagName}>`, 'gi');
-  const matches = xml.matchAll(regex);
-  const results = [];
-  
-  for (const match of matches) {
-    results.push(match[1].trim());
+// Map items through an async function with at most `limit` calls in flight (order kept)
+async function mapWithConcurrency(items, limit, fn) {
+  const results = new Array(items.length);
+  let next = 0;
+  
+  async function worker() {
+    while (next < items.length) {
+      const index = next++;
+      results[index] = await fn(items[index], index);
+    }
   }
   
+  await Promise.all(Array.from({ length: Math.min(limit, items.length) }, worker));
   return results;
 }
 
-// Extract image URL from RSS feed (supports multiple formats)
-function extractImageUrl(xml) {
-  // Try media:thumbnail with url attribute
-  let match = xml.match(/<media:thumbnail[^>]*url=["']([^"']+)["']/i);
-  if (match) return match[1];
-  
-  // Try media:content with url attribute
-  match = xml.match(/<media:content[^>]*url=["']([^"']+)["']/i);
-  if (match) return match[1];
-  
-  // Try enclosure tag with image type
-  match = xml.match(/<enclosure[^>]*url=["']([^"']+)["'][^>]*type=["']image/i);
-  if (match) return match[1];
-  
-  // Try content:encoded or description for img tags
-  match = xml.match(/<img[^>]*src=["']([^"']+)["']/i);
-  if (match) return match[1];
-  
-  return null;
+// fetch() with a per-attempt timeout, retrying network errors, timeouts, 429 and 5xx
+// with exponential backoff (plus jitter). Resolves to { response, body }: a 2xx body is
+// read under the same timeout (a stalled body is retried too), otherwise body is null.
+async function fetchWithRetry(url, init = {}) {
+  for (let attempt = 1; ; attempt++) {
+    const controller = new AbortController();
+    const timer = setTimeout(() => controller.abort(), METADATA_TIMEOUT_MS);
+    try {
+      const response = await fetch(url, { ...init, signal: controller.signal });
+      const retryable = response.status === 429 || response.status >= 500;
+      if (!retryable || attempt >= METADATA_MAX_ATTEMPTS) {
+        return { response, body: response.ok ? await response.text() : null };
+      }
+      console.warn(`Retrying ${url} after HTTP ${response.status} (attempt ${attempt})`);
+    } catch (error) {
+      if (attempt >= METADATA_MAX_ATTEMPTS) {
+        throw error;
+      }
+      console.warn(`Retrying ${url} after ${error.name === 'AbortError' ? 'timeout' : error.message} (attempt ${attempt})`);
+    } finally {
+      clearTimeout(timer);
+    }
+    const delay = METADATA_RETRY_BASE_MS * 2 ** (attempt - 1);
+    await new Promise(resolve => setTimeout(resolve, delay + Math.random() * delay / 2));
+  }
 }
 
-// Fetch author and tags from article page
-async function fetchArticleMetadata(url) {
+// Fetch author and tags from article page. Results are cached in KV by URL along
+// with the page's ETag/Last-Modified, so unchanged pages are answered by a 304.
+async function fetchArticleMetadata(url, kv = null) {
+  const cacheKey = METADATA_CACHE_PREFIX + await sha256Hex(url, 16);
+  let cached = null;
+  
   try {
-    const response = await fetch(url);
-    if (!response.ok) {
-      return { author: null, tags: [] };
-    }
-    
-    const html = await response.text();
-    
-    // Extract author
-    let author = null;
+    cached = kv ? await kv.get(cacheKey, 'json') : null;
     
-    // Try blog-author-name class (GHL specific)
-    let match = html.match(/<p[^>]*class=["'][^"']*blog-author-name[^"']*["'][^>]*>([^<]+)<\/p>/i);
-    if (match) author = match[1];
-    
-    // Try various author meta tags
-    if (!author) {
-      match = html.match(/<meta[^>]*name=["']author["'][^>]*content=["']([^"']+)["']/i);
-      if (match) author = match[1];
-    }
+    const headers = {};
+    if (cached?.etag) headers['If-None-Match'] = cached.etag;
+    if (cached?.lastModified) headers['If-Modified-Since'] = cached.lastModified;
     
-    if (!author) {
-      match = html.match(/<meta[^>]*property=["']article:author["'][^>]*content=["']([^"']+)["']/i);
-      if (match) author = match[1];
+    const { response, body } = await fetchWithRetry(url, { headers });
+    if (response.status === 304 && cached) {
+      return { author: cached.author, tags: cached.tags };
     }
-    
-    // Try JSON-LD structured data
-    if (!author) {
-      const jsonLdMatch = html.match(/<script[^>]*type=["']application\/ld\+json["'][^>]*>(.*?)<\/script>/is);
-      if (jsonLdMatch) {
-        try {
-          const jsonLd = JSON.parse(jsonLdMatch[1]);
-          if (jsonLd.author?.name) {
-            author = jsonLd.author.name;
-          }
-        } catch (e) {
-          // Invalid JSON-LD, skip
-        }
-      }
+    if (!response.ok) {
+      return cached ? { author: cached.author, tags: cached.tags } : { author: null, tags: [] };
     }
     
-    // Extract tags/keywords
-    const tags = [];
+    const metadata = extractArticleMetadata(body);
     
-    // Try keywords meta tag
-    match = html.match(/<meta[^>]*name=["']keywords["'][^>]*content=["']([^"']+)["']/i);
-    if (match) {
-      tags.push(...match[1].split(',').map(t => t.trim()).filter(t => t));
+    if (kv) {
+      await kv.put(cacheKey, JSON.stringify({
+        url,
+        ...metadata,
+        etag: response.headers.get('ETag'),
+        lastModified: response.headers.get('Last-Modified'),
+      }), { expirationTtl: METADATA_CACHE_TTL });
     }
     
-    // Try article:tag meta tags (multiple)
-    const tagMatches = html.matchAll(/<meta[^>]*property=["']article:tag["'][^>]*content=["']([^"']+)["']/gi);
-    for (const tagMatch of tagMatches) {
-      tags.push(tagMatch[1].trim());
-    }
-    
-    return {
-      author: author ? cleanHTML(author) : null,
-      tags: [...new Set(tags)] // Remove duplicates
-    };
+    return metadata;
     
   } catch (error) {
     console.error(`Error fetching metadata from ${url}:`, error);
-    return { author: null, tags: [] };
+    return cached ? { author: cached.author, tags: cached.tags } : { author: null, tags: [] };
+  }
+}
+
+// Extract author and tags from an article page's HTML
+function extractArticleMetadata(html) {
+  // Extract author
+  let author = null;
+  
+  // Try blog-author-name class (GHL specific)
+  let match = html.match(/<p[^>]*class=["'][^"']*blog-author-name[^"']*["'][^>]*>([^<]+)<\/p>/i);
+  if (match) author = match[1];
+  
+  // Try various author meta tags
+  if (!author) {
+    match = html.match(/<meta[^>]*name=["']author["'][^>]*content=["']([^"']+)["']/i);
+    if (match) author = match[1];
   }
+  
+  if (!author) {
+    match = html.match(/<meta[^>]*property=["']article:author["'][^>]*content=["']([^"']+)["']/i);
+    if (match) author = match[1];
+  }
+  
+  // Try JSON-LD structured data
+  if (!author) {
+    const jsonLdMatch = html.match(/<script[^>]*type=["']application\/ld\+json["'][^>]*>(.*?)<\/script>/is);
+    if (jsonLdMatch) {
+      try {
+        const jsonLd = JSON.parse(jsonLdMatch[1]);
+        if (jsonLd.author?.name) {
+          author = jsonLd.author.name;
+        }
+      } catch (e) {
+        // Invalid JSON-LD, skip
+      }
+    }
+  }
+  
+  // Extract tags/keywords
+  const tags = [];
+  
+  // Try keywords meta tag
+  match = html.match(/<meta[^>]*name=["']keywords["'][^>]*content=["']([^"']+)["']/i);
+  if (match) {
+    tags.push(...match[1].split(',').map(t => t.trim()).filter(t => t));
+  }
+  
+  // Try article:tag meta tags (multiple)
+  const tagMatches = html.matchAll(/<meta[^>]*property=["']article:tag["'][^>]*content=["']([^"']+)["']/gi);
+  for (const tagMatch of tagMatches) {
+    tags.push(tagMatch[1].trim());
+  }
+  
+  return {
+    author: author ? cleanHTML(author) : null,
+    tags: [...new Set(tags)] // Remove duplicates
+  };
 }
 
 // Clean HTML entities and tags
@@ -0,0 +1,497 @@
+#!/usr/bin/env python3
+"""
+Offline harness for the Cloudflare workers in this directory.
+
+Runs a worker's fetch/scheduled handlers under node (harness_runtime.mjs) with
+in-memory KV/R2 bindings, and serves the upstreams the workers talk to from a local
+stub server: the Algolia REST API (*.algolia.net is rewritten to it), an RSS feed,
+article pages and the CMS public API (MOCK_CMS_API.py fixtures). Every binding call is counted, sized and timed per run, so performance
+changes to the workers can be measured, e.g. "KV reads per cron run with 10k listings".
+
+Usage:
+    python3 external-site-workers/worker_harness.py rss-sync [--items 2000] [--runs 5]
+    python3 external-site-workers/worker_harness.py classifieds-sweep [--listings 10000] [--due 25]
+    python3 external-site-workers/worker_harness.py classifieds-overdue [--overdue 10]
+    python3 external-site-workers/worker_harness.py classifieds-migration [--listings 2000]
+    python3 external-site-workers/worker_harness.py file-list [--files 3000] [--requests 20]
+    python3 external-site-workers/worker_harness.py homepage [--requests 20] [--fresh-isolate]
+
+Common options: --kv-latency-ms / --r2-latency-ms / --cache-latency-ms /
+--upstream-latency-ms to simulate
+round trips, --fresh-isolate to re-import the worker for every run, --output FILE to
+write the JSON report, --verbose to pass worker logs through to stderr.
+
+Requires node >= 18 on PATH.
+"""
+
+import argparse
+import json
+import re
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+HARNESS_DIR = Path(__file__).resolve().parent
+RUNTIME = HARNESS_DIR / "harness_runtime.mjs"
+ALLOWED_ORIGIN = "https://www.carolinapanorama.org"
+# Cloudflare's per-invocation limit on KV operations
+KV_OPS_PER_INVOCATION = 1000
+# EXPIRY_MIGRATION_PAGE_SIZE in classifieds-worker.js
+EXPIRY_MIGRATION_PAGE_SIZE = 100
+# Upper bound for a cron run once migrated: sweep state and a few day buckets, but
+# nothing per listing
+MIGRATED_RUN_MAX_KV_OPS = 20
+
+ALGOLIA_OBJECT_RE = re.compile(r"^/1/indexes/([^/]+)/([^/?]+)$")
+ARTICLE_RE = re.compile(r"^/articles/(\d+)$")
+
+
+class StubServer(ThreadingHTTPServer):
+    # Workers fan out parallel fetches; the default backlog (5) drops connections
+    request_queue_size = 64
+
+
+class StubUpstream:
+    """In-memory Algolia index, RSS feed, article pages and CMS API behind one HTTP server."""
+
+    def __init__(self, latency_ms=0):
+        self.latency_ms = latency_ms
+        self.indexes = {}
+        self.feed_xml = ""
+        self.cms = None  # MOCK_CMS_API.MockCMS, set by scenarios that call the CMS
+        self.requests = {}
+        self.lock = threading.Lock()
+        self.server = None
+
+    def count(self, name, nbytes=0):
+        with self.lock:
+            entry = self.requests.setdefault(name, {"count": 0, "bytes": 0})
+            entry["count"] += 1
+            entry["bytes"] += nbytes
+
+    def start(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def send_body(self, status, body, content_type="application/json", headers=None):
+                data = body.encode("utf-8") if isinstance(body, str) else body
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                if self.command != "HEAD":
+                    self.wfile.write(data)
+
+            def read_json(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+                return (json.loads(raw) if raw else {}), len(raw)
+
+            def handle_any(self):
+                if stub.latency_ms:
+                    time.sleep(stub.latency_ms / 1000)
+                path = self.path.split("?", 1)[0]
+
+                if path.startswith("/api/public/") and stub.cms:
+                    url = urlparse(self.path)
+                    endpoint, status, payload = stub.cms.respond(url.path, parse_qs(url.query))
+                    body = json.dumps(payload)
+                    stub.count(f"cms_{endpoint}", len(body))
+                    return self.send_body(status, body)
+
+                if path == "/feed.xml":
+                    stub.count("feed", len(stub.feed_xml))
+                    return self.send_body(200, stub.feed_xml, "application/rss+xml")
+
+                match = ARTICLE_RE.match(path)
+                if match:
+                    etag = f'"article-{match.group(1)}-v1"'
+                    if self.headers.get("If-None-Match") == etag:
+                        stub.count("article_not_modified")
+                        return self.send_body(304, b"", headers={"ETag": etag})
+                    html = (
+                        f'<html><head><meta name="author" content="Author {int(match.group(1)) % 7}">'
+                        f'<meta name="keywords" content="news, local, story {match.group(1)}"></head>'
+                        f"<body><p>Article {match.group(1)}</p></body></html>"
+                    )
+                    stub.count("article", len(html))
+                    return self.send_body(200, html, "text/html", {"ETag": etag})
+
+                if path.startswith("/1/indexes/"):
+                    return self.handle_algolia(path)
+
+                return self.send_body(404, '{"message":"not found"}')
+
+            def handle_algolia(self, path):
+                parts = path.split("/")
+                index = stub.indexes.setdefault(parts[3], {})
+
+                if parts[4:] == ["batch"] and self.command == "POST":
+                    payload, nbytes = self.read_json()
+                    for request in payload.get("requests", []):
+                        body = request.get("body", {})
+                        object_id = body.get("objectID")
+                        action = request.get("action")
+                        if action in ("addObject", "updateObject"):
+                            index[object_id] = body
+                        elif action == "partialUpdateObject" or (
+                            action == "partialUpdateObjectNoCreate" and object_id in index
+                        ):
+                            index.setdefault(object_id, {}).update(body)
+                        elif action == "deleteObject":
+                            index.pop(object_id, None)
+                    stub.count("algolia_batch", nbytes)
+                    return self.send_body(200, json.dumps({"taskID": 1, "objectIDs": []}))
+
+                match = ALGOLIA_OBJECT_RE.match(path)
+                if not match:
+                    return self.send_body(404, '{"message":"not found"}')
+                object_id = match.group(2)
+                if self.command == "GET":
+                    stub.count("algolia_get")
+                    if object_id not in index:
+                        return self.send_body(404, '{"message":"ObjectID does not exist"}')
+                    return self.send_body(200, json.dumps(index[object_id]))
+                if self.command == "PUT":
+                    body, nbytes = self.read_json()
+                    index[object_id] = body
+                    stub.count("algolia_put", nbytes)
+                    return self.send_body(200, json.dumps({"objectID": object_id, "taskID": 1}))
+                if self.command == "DELETE":
+                    index.pop(object_id, None)
+                    stub.count("algolia_delete")
+                    return self.send_body(200, json.dumps({"taskID": 1}))
+                return self.send_body(405, '{"message":"method not allowed"}')
+
+            do_GET = do_POST = do_PUT = do_DELETE = do_HEAD = handle_any
+
+        self.server = StubServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def stop(self):
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+
+
+def build_feed(base_url, count, start=None):
+    """RSS feed of `count` items, newest first, one every 12 hours."""
+    start = start or datetime(2026, 1, 1, tzinfo=timezone.utc)
+    items = []
+    for i in reversed(range(count)):
+        published = start + timedelta(hours=12 * i)
+        items.append(
+            "<item>"
+            f"<title><![CDATA[Story {i}]]></title>"
+            f"<link>{base_url}/articles/{i}</link>"
+            f'<guid isPermaLink="false">story-{i}</guid>'
+            f"<description><![CDATA[<p>Summary of story {i}.</p>]]></description>"
+            f"<category>Local News</category>"
+            f"<pubDate>{format_datetime(published)}</pubDate>"
+            f'<media:thumbnail url="{base_url}/images/{i}.jpg"/>'
+            "</item>"
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<rss version="2.0" xmlns:media="http://search.yahoo.com/mrss/"><channel>'
+        "<title>Carolina Panorama</title>" + "".join(items) + "</channel></rss>"
+    )
+
+
+def rss_sync_scenario(args, base_url, stub):
+    stub.feed_xml = build_feed(base_url, args.items)
+    return {
+        "worker": str(HARNESS_DIR / "rss-sync-worker.js"),
+        "env": {
+            "RSS_FEED_URL": f"{base_url}/feed.xml",
+            "ALGOLIA_APP_ID": "HARNESS",
+            "ALGOLIA_ADMIN_API_KEY": "harness-key",
+            "ALGOLIA_INDEX_NAME": "posts",
+            "BATCH_SIZE": str(args.batch_size),
+        },
+        "kv": {"RSS_SYNC_KV": []},
+        "steps": [{"handler": "scheduled", "repeat": args.runs}],
+    }
+
+
+CLASSIFIEDS_ENV = {
+    "ALGOLIA_APP_ID": "HARNESS",
+    "ALGOLIA_WRITE_API_KEY": "harness-key",
+    "ALGOLIA_CLASSIFIEDS_INDEX": "classifieds",
+    "GHL_WEBHOOK_SECRET": "harness-secret",
+}
+
+
+def classified_listings(args, now):
+    """(id, expires) pairs: live listings over the next 60 days, `due` that expired
+    earlier today and `overdue` that expired late yesterday, after its last cron run."""
+    today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    listings = [(f"live{i}", now + timedelta(days=1 + i % 60, minutes=i % 1440)) for i in range(args.listings)]
+    listings += [(f"due{i}", now - timedelta(seconds=1 + i)) for i in range(args.due)]
+    listings += [(f"overdue{i}", today - timedelta(minutes=1 + i % 30)) for i in range(args.overdue)]
+    return listings
+
+
+def seed_classifieds(stub, listings, legacy=False):
+    """KV entries and active Algolia records for `listings`. Legacy listings only have
+    their classified: key, as stored before the expiry-day index existed."""
+    index = stub.indexes.setdefault("classifieds", {})
+    entries = []
+    for listing_id, expires in listings:
+        expires_at = expires.isoformat().replace("+00:00", "Z")
+        metadata = {"id": listing_id, "expires_at": expires_at}
+        entries.append({"key": f"classified:{listing_id}", "value": json.dumps(metadata)})
+        if not legacy:
+            entries.append({"key": f"expires:{expires_at[:10]}:{listing_id}", "value": "", "metadata": metadata})
+        index[listing_id] = {"objectID": listing_id, "status": "active", "expires_at": expires_at}
+    return entries
+
+
+def classifieds_scenario(args, base_url, stub):
+    """Indexed listings (see classified_listings) with no sweep recorded yet, as right after deploy."""
+    now = datetime.now(timezone.utc)
+    entries = [{"key": "expiry-sweep:migrated", "value": now.isoformat()}]
+    entries += seed_classifieds(stub, classified_listings(args, now))
+    return {
+        "worker": str(HARNESS_DIR / "classifieds-worker.js"),
+        "env": CLASSIFIEDS_ENV,
+        "kv": {"CLASSIFIEDS_KV": entries},
+        "steps": [{"handler": "scheduled", "repeat": args.runs}],
+    }
+
+
+def classifieds_overdue_scenario(args, base_url, stub):
+    """Sweep state as left by yesterday's runs (done up to the day before), with
+    listings that fell due after yesterday's last run."""
+    now = datetime.now(timezone.utc)
+    entries = [
+        {"key": "expiry-sweep:migrated", "value": now.isoformat()},
+        {"key": "expiry-sweep:last-day", "value": (now - timedelta(days=2)).date().isoformat()},
+    ]
+    entries += seed_classifieds(stub, classified_listings(args, now))
+    return {
+        "worker": str(HARNESS_DIR / "classifieds-worker.js"),
+        "env": CLASSIFIEDS_ENV,
+        "kv": {"CLASSIFIEDS_KV": entries},
+        "steps": [{"handler": "scheduled", "repeat": args.runs}],
+    }
+
+
+def classifieds_migration_scenario(args, base_url, stub):
+    """Legacy listings only (no expiry index, no migrated flag): cron runs until the migration is done."""
+    listings = classified_listings(args, datetime.now(timezone.utc))
+    entries = seed_classifieds(stub, listings, legacy=True)
+
+    # One page per run plus a final run that should only check the flag and sweep
+    runs = max(args.runs, -(-len(listings) // EXPIRY_MIGRATION_PAGE_SIZE) + 1)
+    return {
+        "worker": str(HARNESS_DIR / "classifieds-worker.js"),
+        "env": CLASSIFIEDS_ENV,
+        "kv": {"CLASSIFIEDS_KV": entries},
+        "steps": [{"handler": "scheduled", "repeat": runs}],
+    }
+
+
+def check_classifieds(args, report, stub):
+    """Every cron run stays under the KV operation limit; due and overdue listings end
+    up expired in Algolia and live ones stay active."""
+    failures = []
+    kv_calls = [run["bindings"].get("CLASSIFIEDS_KV", {}).get("total_calls", 0) for run in report["runs"]]
+    for i, calls in enumerate(kv_calls):
+        if calls > KV_OPS_PER_INVOCATION:
+            failures.append(f"run {i}: {calls} KV operations (limit {KV_OPS_PER_INVOCATION})")
+
+    wrong = {}
+    for object_id, record in stub.indexes.get("classifieds", {}).items():
+        expected = "expired" if object_id.startswith(("due", "overdue")) else "active"
+        if record.get("status") != expected:
+            wrong.setdefault(expected, []).append(object_id)
+    for expected, ids in sorted(wrong.items()):
+        failures.append(f"{len(ids)} listing(s) not {expected} in Algolia, e.g. {', '.join(sorted(ids)[:5])}")
+    return failures
+
+
+def check_classifieds_migration(args, report, stub):
+    """check_classifieds, and the migration finishes: the final run does no per-listing work."""
+    failures = check_classifieds(args, report, stub)
+    final_calls = report["runs"][-1]["bindings"].get("CLASSIFIEDS_KV", {}).get("total_calls", 0)
+    if final_calls > MIGRATED_RUN_MAX_KV_OPS:
+        failures.append(f"final run: {final_calls} KV operations, migration did not finish")
+    return failures
+
+
+def file_list_scenario(args, base_url, stub):
+    start = datetime(2015, 1, 1)
+    objects = []
+    for i in range(args.files):
+        day = start + timedelta(days=7 * i)
+        objects.append({"key": f"edition-{day.month}-{day.day}-{day.year}.pdf", "value": "%PDF-1.4"})
+    last = start + timedelta(days=7 * (args.files - 1))
+    headers = {"Origin": ALLOWED_ORIGIN}
+    return {
+        "worker": str(HARNESS_DIR / "file-list-worker.js"),
+        "env": {},
+        "r2": {"MY_BUCKET": objects},
+        "steps": [
+            {"handler": "fetch", "url": "https://files.worker.dev/", "headers": headers, "repeat": args.requests},
+            {
+                "handler": "fetch",
+                "url": f"https://files.worker.dev/search?date={last.year}-{last.month:02d}-{last.day:02d}",
+                "headers": headers,
+                "repeat": args.requests,
+            },
+        ],
+    }
+
+
+def homepage_scenario(args, base_url, stub):
+    """Bursts of payload requests: cold, fresh, then again after the payload goes stale."""
+    sys.path.insert(0, str(HARNESS_DIR.parent))
+    from MOCK_CMS_API import MockCMS
+
+    stub.cms = MockCMS(seed=1)
+    url = "https://homepage.worker.dev/"
+    return {
+        "worker": str(HARNESS_DIR / "homepage-worker.js"),
+        "env": {"CMS_BASE_URL": base_url, "FRESH_SECONDS": "1", "STALE_SECONDS": "60"},
+        "steps": [
+            {"handler": "fetch", "url": url, "repeat": args.requests},
+            {"handler": "fetch", "url": url, "repeat": args.requests, "delay_ms": 1100},
+        ],
+    }
+
+
+SCENARIOS = {
+    "rss-sync": rss_sync_scenario,
+    "classifieds-sweep": classifieds_scenario,
+    "classifieds-overdue": classifieds_overdue_scenario,
+    "classifieds-migration": classifieds_migration_scenario,
+    "file-list": file_list_scenario,
+    "homepage": homepage_scenario,
+}
+
+
+# Scenario assertions: scenario name -> check(args, report, stub) returning failure messages
+CHECKS = {
+    "classifieds-sweep": check_classifieds,
+    "classifieds-overdue": check_classifieds,
+    "classifieds-migration": check_classifieds_migration,
+}
+
+
+def run_scenario(scenario, verbose=False):
+    """Run a scenario dict through the node runtime and return its report."""
+    scenario = dict(scenario, verbose=verbose)
+    result = subprocess.run(
+        ["node", str(RUNTIME)],
+        input=json.dumps(scenario),
+        capture_output=True,
+        text=True,
+        cwd=HARNESS_DIR.parent,
+    )
+    if verbose and result.stderr:
+        sys.stderr.write(result.stderr)
+    if result.returncode != 0:
+        raise RuntimeError(f"harness runtime failed:\n{result.stderr}")
+    return json.loads(result.stdout)
+
+
+def summarize(report):
+    """Per-binding totals across runs (calls by op, bytes, latency)."""
+    totals = {}
+    for run in report["runs"]:
+        for name, stats in run["bindings"].items():
+            total = totals.setdefault(name, {"calls": {}, "total_calls": 0, "bytes_in": 0, "bytes_out": 0, "latency_ms": 0})
+            for op, count in stats["calls"].items():
+                total["calls"][op] = total["calls"].get(op, 0) + count
+            for key in ("total_calls", "bytes_in", "bytes_out", "latency_ms"):
+                total[key] += stats[key]
+    for total in totals.values():
+        total["latency_ms"] = round(total["latency_ms"], 2)
+    return totals
+
+
+def print_report(report):
+    """Human-readable per-run table on stderr."""
+    names = sorted({name for run in report["runs"] for name in run["bindings"]})
+    header = f"{'run':>4} {'handler':<10} {'ms':>9} " + " ".join(f"{name + ' calls':>20}" for name in names)
+    print(header, file=sys.stderr)
+    for i, run in enumerate(report["runs"]):
+        cells = []
+        for name in names:
+            stats = run["bindings"].get(name)
+            cells.append(f"{stats['total_calls'] if stats else 0:>20}")
+        print(f"{i:>4} {run['handler']:<10} {run['total_ms']:>9.1f} " + " ".join(cells), file=sys.stderr)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run the Cloudflare workers offline with instrumented bindings.")
+    parser.add_argument("scenario", choices=sorted(SCENARIOS))
+    parser.add_argument("--items", type=int, default=500, help="rss-sync: feed items")
+    parser.add_argument("--batch-size", type=int, default=50, help="rss-sync: BATCH_SIZE")
+    parser.add_argument("--listings", type=int, default=10000, help="classifieds-*: live listings")
+    parser.add_argument("--due", type=int, default=25, help="classifieds-*: listings that expired earlier today")
+    parser.add_argument("--overdue", type=int, default=10, help="classifieds-*: listings that expired late yesterday")
+    parser.add_argument("--files", type=int, default=1500, help="file-list: PDFs in the bucket")
+    parser.add_argument("--requests", type=int, default=10, help="file-list / homepage: requests per step")
+    parser.add_argument("--runs", type=int, default=3, help="cron runs for scheduled scenarios")
+    parser.add_argument("--kv-latency-ms", type=float, default=0)
+    parser.add_argument("--r2-latency-ms", type=float, default=0)
+    parser.add_argument("--cache-latency-ms", type=float, default=0)
+    parser.add_argument("--upstream-latency-ms", type=float, default=0)
+    parser.add_argument("--fresh-isolate", action="store_true", help="re-import the worker for every run")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    parser.add_argument("--verbose", action="store_true", help="pass worker logs through to stderr")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    stub = StubUpstream(latency_ms=args.upstream_latency_ms)
+    base_url = stub.start()
+    try:
+        scenario = SCENARIOS[args.scenario](args, base_url, stub)
+        scenario["algolia_base"] = base_url
+        scenario["latency_ms"] = {"kv": args.kv_latency_ms, "r2": args.r2_latency_ms, "cache": args.cache_latency_ms}
+        scenario["fresh_isolate"] = args.fresh_isolate
+        report = run_scenario(scenario, verbose=args.verbose)
+    finally:
+        stub.stop()
+
+    report["scenario"] = args.scenario
+    report["totals"] = summarize(report)
+    report["upstream"] = stub.requests
+    for run in report["runs"]:
+        headers = run.pop("response_headers", None) or {}
+        if "x-cache" in headers:
+            run["cache"] = headers["x-cache"]
+
+    print_report(report)
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+        print(f"Wrote {args.output}", file=sys.stderr)
+    else:
+        print(output)
+
+    failures = CHECKS[args.scenario](args, report, stub) if args.scenario in CHECKS else []
+    for failure in failures:
+        print(f"CHECK FAILED: {failure}", file=sys.stderr)
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+  main()
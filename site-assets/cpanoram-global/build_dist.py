@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Build a minified dist/ tree of site-assets for CDN publishing.
+
+Every widget under site-assets/ is fetched raw through jsDelivr by the loaders that
+gen_widget_loader.py emits. This stage writes a mirror of site-assets/ into dist/
+with HTML, inline <style>/<script> blocks, and standalone .css/.js minified, plus a
+size report (raw / minified / gzip bytes per file) and one combined JSON bundle per
+page listed in BUNDLES (dist/bundles/<name>.json).
+
+The minifiers are deliberately conservative (no renaming, newlines kept in JS so
+automatic semicolon insertion is unaffected) - they only drop comments and
+redundant whitespace, so the output behaves exactly like the source.
+
+Usage:
+    python3 site-assets/cpanoram-global/build_dist.py [output_dir]
+
+Commit the resulting dist/ alongside the release tag so jsDelivr can serve it, then
+generate loaders with `gen_widget_loader.py --dist`.
+"""
+
+import gzip
+import json
+import re
+import shutil
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SOURCE_DIR = REPO_ROOT / "site-assets"
+DIST_DIR = REPO_ROOT / "dist"
+SIZE_REPORT = "size-report.json"
+BUNDLE_DIR = "bundles"
+
+# Page-level bundles: one JSON file per page holding every widget it renders,
+# fetched in a single request by gen_widget_loader.py --page <name>.
+# Entries may carry a ":custom_value_key" suffix (used by the loader, not the bundle).
+BUNDLES = {
+    "home": [
+        "site-home-widgets/headlines-grid-v2.html",
+        "site-home-widgets/trending-carousel-v2.html",
+        "site-home-widgets/article-list-feed.html",
+        "site-home-widgets/category-grid-widget.html",
+        "site-home-widgets/file-list-preview.html",
+    ],
+}
+
+# Files that are build tooling/docs rather than published assets
+SKIP_SUFFIXES = {".py", ".md"}
+
+# Keywords after which a "/" starts a regex literal rather than a division
+REGEX_PREFIX_KEYWORDS = {
+    "return", "typeof", "instanceof", "case", "do", "else", "in", "of",
+    "void", "delete", "throw", "new", "yield", "await",
+}
+REGEX_PREFIX_CHARS = set("(,=:[!&|?{};+-*%<>~^")
+
+CSS_TOKEN_RE = re.compile(r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')|(/\*.*?\*/)""", re.S)
+HTML_RAW_BLOCK_RE = re.compile(
+    r"(<(script|style|pre|textarea)\b([^>]*)>)(.*?)(</\2\s*>)", re.S | re.I
+)
+HTML_COMMENT_RE = re.compile(r"<!--(?!\[if).*?-->", re.S)
+SCRIPT_TYPE_RE = re.compile(r"""\btype\s*=\s*["']?([^"'\s>]+)""", re.I)
+JS_TYPES = {"", "text/javascript", "application/javascript", "module"}
+
+
+def minify_css(css):
+    """Drop comments and redundant whitespace from a stylesheet (strings left untouched)."""
+    # Pass 1: comments -> single space, so tokens on either side stay apart
+    css = CSS_TOKEN_RE.sub(lambda m: m.group(1) or " ", css)
+
+    def squeeze(segment):
+        segment = re.sub(r"\s+", " ", segment)
+        segment = re.sub(r"\s*([{};,>])\s*", r"\1", segment)
+        segment = re.sub(r":\s+", ":", segment)
+        return segment.replace(";}", "}")
+
+    # Pass 2: squeeze everything between string literals
+    out = []
+    pos = 0
+    for match in CSS_TOKEN_RE.finditer(css):
+        out.append(squeeze(css[pos:match.start()]))
+        out.append(match.group(0))
+        pos = match.end()
+    out.append(squeeze(css[pos:]))
+    return "".join(out).strip()
+
+
+def _regex_allowed(out):
+    """True if a "/" following the emitted code starts a regex literal."""
+    tail = "".join(out[-8:]).rstrip()
+    if not tail:
+        return True
+    if tail[-1] in REGEX_PREFIX_CHARS:
+        return True
+    word = re.search(r"[A-Za-z_$][\w$]*$", tail)
+    return bool(word) and word.group(0) in REGEX_PREFIX_KEYWORDS
+
+
+def minify_js(code):
+    """Strip comments, indentation and blank lines from JavaScript.
+
+    Strings, template literals (including nested ${...} expressions) and regex
+    literals are copied verbatim. Line breaks are preserved so ASI is unaffected.
+    """
+    out = []
+    stack = []  # "tpl" while inside template text, int brace depth inside ${ ... }
+    i = 0
+    n = len(code)
+    line_start = True
+
+    def emit_newline():
+        while out and out[-1] in (" ", "\t"):
+            out.pop()
+        if out and out[-1] != "\n":
+            out.append("\n")
+
+    while i < n:
+        c = code[i]
+
+        if stack and stack[-1] == "tpl":
+            if c == "\\":
+                out.append(code[i:i + 2])
+                i += 2
+            elif c == "`":
+                out.append(c)
+                stack.pop()
+                i += 1
+            elif code.startswith("${", i):
+                out.append("${")
+                stack.append(0)
+                i += 2
+            else:
+                out.append(c)
+                i += 1
+            line_start = False
+            continue
+
+        if c == "\n":
+            emit_newline()
+            line_start = True
+            i += 1
+            continue
+
+        if c in " \t\r\f\v":
+            if not line_start and out and out[-1] not in (" ", "\n"):
+                out.append(" ")
+            i += 1
+            continue
+
+        if code.startswith("//", i):
+            end = code.find("\n", i)
+            i = n if end == -1 else end
+            continue
+
+        if code.startswith("/*", i):
+            end = code.find("*/", i + 2)
+            end = n if end == -1 else end + 2
+            if "\n" in code[i:end]:
+                emit_newline()
+                line_start = True
+            elif out and out[-1] not in (" ", "\n"):
+                out.append(" ")
+            i = end
+            continue
+
+        line_start = False
+
+        if c in "'\"":
+            j = i + 1
+            while j < n and code[j] != c and code[j] != "\n":
+                j += 2 if code[j] == "\\" else 1
+            out.append(code[i:j + 1])
+            i = j + 1
+            continue
+
+        if c == "`":
+            out.append(c)
+            stack.append("tpl")
+            i += 1
+            continue
+
+        if c == "/" and _regex_allowed(out):
+            j = i + 1
+            in_class = False
+            while j < n and code[j] != "\n":
+                ch = code[j]
+                if ch == "\\":
+                    j += 2
+                    continue
+                if ch == "[":
+                    in_class = True
+                elif ch == "]":
+                    in_class = False
+                elif ch == "/" and not in_class:
+                    break
+                j += 1
+            out.append(code[i:j + 1])
+            i = j + 1
+            continue
+
+        if stack and c == "{":
+            stack[-1] += 1
+        elif stack and c == "}":
+            if stack[-1] == 0:
+                stack.pop()  # closes ${ ... }, back to template text
+            else:
+                stack[-1] -= 1
+
+        out.append(c)
+        i += 1
+
+    return "".join(out).strip()
+
+
+def minify_html(html):
+    """Minify widget HTML: comments/whitespace in markup, plus inline CSS and JS."""
+
+    def squeeze(markup):
+        markup = HTML_COMMENT_RE.sub("", markup)
+        markup = re.sub(r"[ \t]*\n\s*", "\n", markup)
+        return re.sub(r"[ \t]{2,}", " ", markup)
+
+    out = []
+    pos = 0
+    for match in HTML_RAW_BLOCK_RE.finditer(html):
+        out.append(squeeze(html[pos:match.start()]))
+        open_tag, tag, attrs, body, close_tag = match.groups()
+        tag = tag.lower()
+        if tag == "style":
+            body = minify_css(body)
+        elif tag == "script":
+            type_match = SCRIPT_TYPE_RE.search(attrs)
+            script_type = type_match.group(1).lower() if type_match else ""
+            if script_type in JS_TYPES and body.strip():
+                body = minify_js(body)
+        out.append(open_tag + body + close_tag)
+        pos = match.end()
+    out.append(squeeze(html[pos:]))
+    return "".join(out).strip() + "\n"
+
+
+MINIFIERS = {
+    ".html": minify_html,
+    ".css": minify_css,
+    ".js": minify_js,
+}
+
+
+def build_dist(source_dir=SOURCE_DIR, dist_dir=DIST_DIR):
+    """Write the minified dist tree and return the size report entries."""
+    source_dir = Path(source_dir)
+    dist_dir = Path(dist_dir)
+    report = []
+
+    for src in sorted(source_dir.rglob("*")):
+        if not src.is_file() or src.suffix in SKIP_SUFFIXES or "__pycache__" in src.parts:
+            continue
+        rel = src.relative_to(source_dir)
+        dest = dist_dir / rel
+        dest.parent.mkdir(parents=True, exist_ok=True)
+
+        minifier = MINIFIERS.get(src.suffix)
+        if minifier is None:
+            shutil.copyfile(src, dest)
+            continue
+
+        raw = src.read_text(encoding="utf-8")
+        minified = minifier(raw)
+        dest.write_text(minified, encoding="utf-8")
+
+        raw_bytes = raw.encode("utf-8")
+        min_bytes = minified.encode("utf-8")
+        report.append({
+            "file": rel.as_posix(),
+            "raw_bytes": len(raw_bytes),
+            "min_bytes": len(min_bytes),
+            "raw_gzip_bytes": len(gzip.compress(raw_bytes, mtime=0)),
+            "min_gzip_bytes": len(gzip.compress(min_bytes, mtime=0)),
+        })
+
+    with open(dist_dir / SIZE_REPORT, "w") as f:
+        json.dump({"files": report}, f, indent=2)
+        f.write("\n")
+    return report
+
+
+def build_bundle(name, widget_paths, source_dir=SOURCE_DIR, dist_dir=DIST_DIR):
+    """Write dist/bundles/<name>.json mapping each widget path to its minified HTML."""
+    source_dir = Path(source_dir)
+    bundle = {"widgets": {}}
+    for spec in widget_paths:
+        widget_path = spec.partition(":")[0]
+        html = (source_dir / widget_path).read_text(encoding="utf-8")
+        bundle["widgets"][widget_path] = minify_html(html)
+
+    bundle_path = Path(dist_dir) / BUNDLE_DIR / f"{name}.json"
+    bundle_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(bundle_path, "w") as f:
+        json.dump(bundle, f, separators=(",", ":"))
+    return bundle_path
+
+
+def print_size_report(report):
+    """Print a human-readable size table."""
+    print(f"{'file':<52} {'raw':>8} {'min':>8} {'saved':>6} {'gz raw':>8} {'gz min':>8}")
+    totals = [0, 0, 0, 0]
+    for entry in report:
+        saved = 1 - entry["min_bytes"] / entry["raw_bytes"] if entry["raw_bytes"] else 0
+        print(
+            f"{entry['file']:<52} {entry['raw_bytes']:>8} {entry['min_bytes']:>8} {saved:>6.0%} "
+            f"{entry['raw_gzip_bytes']:>8} {entry['min_gzip_bytes']:>8}"
+        )
+        totals[0] += entry["raw_bytes"]
+        totals[1] += entry["min_bytes"]
+        totals[2] += entry["raw_gzip_bytes"]
+        totals[3] += entry["min_gzip_bytes"]
+    saved = 1 - totals[1] / totals[0] if totals[0] else 0
+    print(f"{'TOTAL':<52} {totals[0]:>8} {totals[1]:>8} {saved:>6.0%} {totals[2]:>8} {totals[3]:>8}")
+
+
+if __name__ == "__main__":
+  dist_dir = Path(sys.argv[1]) if len(sys.argv) >= 2 else DIST_DIR
+
+  report = build_dist(SOURCE_DIR, dist_dir)
+  for name, widget_paths in BUNDLES.items():
+    build_bundle(name, widget_paths, SOURCE_DIR, dist_dir)
+  print_size_report(report)
+  print(f"\nWrote {dist_dir} (size report: {dist_dir / SIZE_REPORT})")
@@ -11,8 +11,27 @@
     window.CarolinaPanorama = window.CarolinaPanorama || {};
 
     // Base URL for Carolina Panorama CMS public API
-    // Can be overridden by setting window.CarolinaPanorama.API_BASE_URL before this script runs
-    window.CarolinaPanorama.API_BASE_URL = window.CarolinaPanorama.API_BASE_URL || 'https://cms.carolinapanorama.org';
+    // Can be overridden by setting window.CarolinaPanorama.API_BASE_URL before this script runs,
+    // or on WordPress via the cp_api_base_url option (passed in CarolinaPanoramaConfig.apiBaseUrl)
+    window.CarolinaPanorama.API_BASE_URL = window.CarolinaPanorama.API_BASE_URL
+        || (window.CarolinaPanoramaConfig && window.CarolinaPanoramaConfig.apiBaseUrl)
+        || 'https://cms.carolinapanorama.org';
+
+    // Homepage payload URL (external-site-workers/homepage-worker.js): when set, fetchJSON()
+    // answers CMS API requests from that one edge-cached response where it has them.
+    // Set window.CarolinaPanorama.HOMEPAGE_API_URL before this script runs, or on WordPress
+    // via the cp_homepage_api_url option (CarolinaPanoramaConfig.homepageApiUrl, front page only)
+    window.CarolinaPanorama.HOMEPAGE_API_URL = window.CarolinaPanorama.HOMEPAGE_API_URL
+        || (window.CarolinaPanoramaConfig && window.CarolinaPanoramaConfig.homepageApiUrl)
+        || '';
+
+    // Performance telemetry endpoint (TELEMETRY_COLLECTOR.py, or any service accepting the
+    // same beacon). Empty disables sending; perfStart()/timePhase() still leave marks for
+    // DevTools. Set window.CarolinaPanorama.TELEMETRY_URL before this script runs, or on
+    // WordPress via the cp_telemetry_url option (CarolinaPanoramaConfig.telemetryUrl)
+    window.CarolinaPanorama.TELEMETRY_URL = window.CarolinaPanorama.TELEMETRY_URL
+        || (window.CarolinaPanoramaConfig && window.CarolinaPanoramaConfig.telemetryUrl)
+        || '';
     
     window.CarolinaPanorama.formatDate = function(dateString) {
         if (!dateString) return '';
@@ -67,69 +86,275 @@
         return category.toLowerCase().replace(/\s+/g, '-');
     };
 
+    // ===== Shared stale-while-revalidate cache =====
+    // One cache layer for widget data: a small in-memory LRU in front of IndexedDB
+    // (localStorage where IndexedDB is unavailable). Fresh entries are served as is;
+    // stale ones are served immediately while a background refresh runs. Tabs share
+    // entries over a BroadcastChannel: a tab announces its refresh and posts the
+    // result, so the other tabs wait for it instead of fetching the same data.
+    const SWR_DB_NAME = 'carolina-panorama';
+    const SWR_ENTRIES = 'swr-entries';   // { key, data, timestamp }
+    const SWR_META = 'swr-meta';         // { key, size, lastAccess } - read for LRU eviction
+    const SWR_STORAGE_PREFIX = 'cp_swr:';
+    const SWR_MAX_BYTES = 4 * 1024 * 1024;  // persistent cache cap (JSON size), LRU-evicted
+    const SWR_MEMORY_ENTRIES = 50;
+    const SWR_CLAIM_MS = 10 * 1000;         // how long another tab's refresh holds off ours
+
+    const swrMemory = new Map();   // key -> { data, timestamp }; Map order = LRU order
+    const swrPending = new Map();  // key -> refresh in flight in this tab
+    const swrClaims = new Map();   // key -> time another tab's refresh claim expires
+    const swrWaiters = new Map();  // key -> resolvers waiting for another tab's result
+    const swrStats = { hits: 0, staleHits: 0, misses: 0, refreshes: 0, remoteUpdates: 0, evictions: 0 };
+
+    const swrChannel = 'BroadcastChannel' in window ? new BroadcastChannel('cp-swr-cache') : null;
+    if (swrChannel) {
+        swrChannel.onmessage = ({ data: message }) => {
+            if (message.type === 'claim') {
+                swrClaims.set(message.key, message.until);
+            } else if (message.type === 'update' || message.type === 'release') {
+                swrClaims.delete(message.key);
+                if (message.type === 'update') {
+                    swrStats.remoteUpdates++;
+                    swrMemorySet(message.key, message.entry);
+                }
+                const waiters = swrWaiters.get(message.key) || [];
+                swrWaiters.delete(message.key);
+                waiters.forEach(resolve => resolve(message.entry));
+            }
+        };
+    }
+
+    function swrMemorySet(key, entry) {
+        swrMemory.delete(key);
+        swrMemory.set(key, entry);
+        if (swrMemory.size > SWR_MEMORY_ENTRIES) {
+            swrMemory.delete(swrMemory.keys().next().value);
+        }
+    }
+
+    function idbRequest(request) {
+        return new Promise((resolve, reject) => {
+            request.onsuccess = () => resolve(request.result);
+            request.onerror = () => reject(request.error);
+        });
+    }
+
+    // Resolves to the database, or null where IndexedDB is unavailable (private modes, old browsers)
+    let swrDbPromise = null;
+    function swrDb() {
+        if (!swrDbPromise) {
+            swrDbPromise = new Promise(resolve => {
+                try {
+                    const request = indexedDB.open(SWR_DB_NAME, 1);
+                    request.onupgradeneeded = () => {
+                        request.result.createObjectStore(SWR_ENTRIES, { keyPath: 'key' });
+                        request.result.createObjectStore(SWR_META, { keyPath: 'key' });
+                    };
+                    request.onsuccess = () => resolve(request.result);
+                    request.onerror = request.onblocked = () => resolve(null);
+                } catch (e) {
+                    resolve(null);
+                }
+            });
+        }
+        return swrDbPromise;
+    }
+
+    async function swrRead(key) {
+        const db = await swrDb();
+        try {
+            if (!db) {
+                const raw = localStorage.getItem(SWR_STORAGE_PREFIX + key);
+                return raw ? JSON.parse(raw) : null;
+            }
+            const tx = db.transaction([SWR_ENTRIES, SWR_META], 'readwrite');
+            const entry = await idbRequest(tx.objectStore(SWR_ENTRIES).get(key));
+            if (entry) {
+                // Record the use for LRU eviction (once per page - later reads hit memory)
+                const meta = tx.objectStore(SWR_META);
+                const info = await idbRequest(meta.get(key));
+                if (info) meta.put({ ...info, lastAccess: Date.now() });
+            }
+            return entry ? { data: entry.data, timestamp: entry.timestamp } : null;
+        } catch (e) {
+            console.warn('[CarolinaPanorama] Failed to read cache entry:', e);
+            return null;
+        }
+    }
+
+    async function swrWrite(key, entry) {
+        const db = await swrDb();
+        try {
+            const serialized = JSON.stringify(entry);
+            if (!db) {
+                localStorage.setItem(SWR_STORAGE_PREFIX + key, serialized);
+                return;
+            }
+            const tx = db.transaction([SWR_ENTRIES, SWR_META], 'readwrite');
+            const meta = tx.objectStore(SWR_META);
+            tx.objectStore(SWR_ENTRIES).put({ key, ...entry });
+            meta.put({ key, size: serialized.length, lastAccess: Date.now() });
+
+            // Keep the store under SWR_MAX_BYTES by dropping the least recently used entries
+            const infos = await idbRequest(meta.getAll());
+            let total = infos.reduce((sum, info) => sum + info.size, 0);
+            infos.sort((a, b) => a.lastAccess - b.lastAccess);
+            for (const info of infos) {
+                if (total <= SWR_MAX_BYTES) break;
+                if (info.key === key) continue;
+                tx.objectStore(SWR_ENTRIES).delete(info.key);
+                meta.delete(info.key);
+                swrMemory.delete(info.key);
+                swrStats.evictions++;
+                total -= info.size;
+            }
+        } catch (e) {
+            console.warn('[CarolinaPanorama] Failed to write cache entry:', e);
+        }
+    }
+
+    async function swrFetch(key, fetcher) {
+        swrStats.refreshes++;
+        if (swrChannel) swrChannel.postMessage({ type: 'claim', key, until: Date.now() + SWR_CLAIM_MS });
+        let data;
+        try {
+            data = await fetcher();
+        } catch (error) {
+            if (swrChannel) swrChannel.postMessage({ type: 'release', key });
+            throw error;
+        }
+        const entry = { data, timestamp: Date.now() };
+        swrMemorySet(key, entry);
+        if (swrChannel) swrChannel.postMessage({ type: 'update', key, entry });
+        await swrWrite(key, entry);
+        return data;
+    }
+
+    // Refresh `key` once per tab. While another tab holds a claim, a background refresh is
+    // skipped (its update will arrive) and a blocking one waits for it, fetching itself
+    // only if the other tab's result doesn't arrive before the claim expires.
+    function swrRefresh(key, fetcher, { background = false } = {}) {
+        if (swrPending.has(key)) {
+            return swrPending.get(key);
+        }
+        const claimLeft = (swrClaims.get(key) || 0) - Date.now();
+        if (claimLeft > 0 && background) {
+            return Promise.resolve();
+        }
+
+        const promise = claimLeft > 0
+            ? new Promise(resolve => {
+                const waiters = swrWaiters.get(key) || [];
+                waiters.push(resolve);
+                swrWaiters.set(key, waiters);
+                setTimeout(() => resolve(undefined), claimLeft);
+            }).then(entry => (entry ? entry.data : swrFetch(key, fetcher)))
+            : swrFetch(key, fetcher);
+        const clear = () => swrPending.delete(key);
+        promise.then(clear, clear);
+        swrPending.set(key, promise);
+        return promise;
+    }
+
+    /**
+     * Fetch through the shared stale-while-revalidate cache.
+     * Resolves to the cached or fetched data (shared between callers - copy before mutating).
+     * @param {string} key - cache key, unique per data set
+     * @param {Function} fetcher - async () => JSON-serializable data; throw to leave the cache as is
+     * @param {Object} options - { maxAge } ms an entry is fresh; { staleAge } ms it may still be
+     *   served while refreshing in the background; { force } skip cached data
+     */
+    window.CarolinaPanorama.cachedFetch = async function(key, fetcher, {
+        maxAge = 5 * 60 * 1000,
+        staleAge = 24 * 60 * 60 * 1000,
+        force = false
+    } = {}) {
+        let entry = null;
+        if (!force) {
+            entry = swrMemory.get(key) || null;
+            if (entry) {
+                swrMemorySet(key, entry);
+            } else {
+                entry = await swrRead(key);
+                if (entry) swrMemorySet(key, entry);
+            }
+        }
+
+        const age = entry ? Date.now() - entry.timestamp : Infinity;
+        if (age < maxAge) {
+            swrStats.hits++;
+            return entry.data;
+        }
+        if (age < staleAge) {
+            swrStats.staleHits++;
+            swrRefresh(key, fetcher, { background: true }).catch(error => {
+                console.warn(`[CarolinaPanorama] Background refresh failed for ${key}:`, error);
+            });
+            return entry.data;
+        }
+        swrStats.misses++;
+        return swrRefresh(key, fetcher);
+    };
+
+    // Hit/miss counters for the shared cache (hits are fresh, staleHits served while refreshing)
+    window.CarolinaPanorama.cacheStats = function() {
+        return { ...swrStats, memoryEntries: swrMemory.size };
+    };
+
     // Category cache and utilities
     let categoriesCache = null;
     let categoriesFetchPromise = null;
-    const CACHE_KEY = 'cp_categories_cache';
+    const CACHE_KEY = 'categories';
     const CACHE_DURATION = 30 * 60 * 1000; // 30 minutes
 
-    // Fetch and cache categories from CMS with localStorage persistence
+    // Synchronous category lookup (normalized name -> { category, style, className }),
+    // rebuilt whenever the category list loads so card renderers can style every tag
+    // without awaiting fetchCategories() per card
+    const DEFAULT_CATEGORY_STYLE = 'background-color: #3b82f6 !important;';
+    let categoryLookup = new Map();
+
+    function normalizeCategoryName(name) {
+        return String(name || '').toLowerCase().trim();
+    }
+
+    function categorySlug(name) {
+        return normalizeCategoryName(name).replace(/[^a-z0-9\s-]/g, '').replace(/\s+/g, '-');
+    }
+
+    function setCategories(categories) {
+        categoriesCache = categories;
+        categoryLookup = new Map(categories.map(cat => [normalizeCategoryName(cat.name), {
+            category: cat,
+            style: cat.color_code ? `background-color: ${cat.color_code} !important;` : DEFAULT_CATEGORY_STYLE,
+            className: categorySlug(cat.name)
+        }]));
+    }
+
+    // Fetch categories from CMS through the shared cache (kept in memory once loaded)
     window.CarolinaPanorama.fetchCategories = async function(forceRefresh = false) {
-        // Check memory cache first
         if (categoriesCache && !forceRefresh) {
             return categoriesCache;
         }
-        
-        // Check localStorage cache
-        if (!forceRefresh) {
-            try {
-                const cached = localStorage.getItem(CACHE_KEY);
-                if (cached) {
-                    const { data, timestamp } = JSON.parse(cached);
-                    const age = Date.now() - timestamp;
-                    
-                    if (age < CACHE_DURATION) {
-                        categoriesCache = data;
-                        console.log('[CarolinaPanorama] Loaded', data.length, 'categories from localStorage cache');
-                        return categoriesCache;
-                    } else {
-                        localStorage.removeItem(CACHE_KEY);
-                    }
-                }
-            } catch (e) {
-                console.warn('[CarolinaPanorama] Failed to read localStorage cache:', e);
-            }
-        }
-        
+
         // If already fetching, return the existing promise
         if (categoriesFetchPromise) {
             return categoriesFetchPromise;
         }
-        
+
         categoriesFetchPromise = (async () => {
             try {
-                const apiBase = window.CarolinaPanorama.API_BASE_URL || 'https://cms.carolinapanorama.org';
-                const response = await fetch(`${apiBase}/api/public/categories`);
-                const data = await response.json();
-                
-                if (data.success && data.data) {
-                    categoriesCache = data.data;
-                    
-                    // Store in localStorage
-                    try {
-                        localStorage.setItem(CACHE_KEY, JSON.stringify({
-                            data: categoriesCache,
-                            timestamp: Date.now()
-                        }));
-                    } catch (e) {
-                        console.warn('[CarolinaPanorama] Failed to cache in localStorage:', e);
+                const categories = await window.CarolinaPanorama.cachedFetch(CACHE_KEY, async () => {
+                    const apiBase = window.CarolinaPanorama.API_BASE_URL || 'https://cms.carolinapanorama.org';
+                    const data = await window.CarolinaPanorama.fetchJSON(`${apiBase}/api/public/categories`);
+                    if (!data.success || !data.data) {
+                        throw new Error(data.error || 'No categories returned');
                     }
-                    
-                    console.log('[CarolinaPanorama] Fetched and cached', categoriesCache.length, 'categories');
-                    return categoriesCache;
-                }
-                
-                return [];
+                    return data.data;
+                }, { maxAge: CACHE_DURATION, force: forceRefresh });
+
+                setCategories(categories);
+                console.log('[CarolinaPanorama] Loaded', categoriesCache.length, 'categories');
+                return categoriesCache;
             } catch (error) {
                 console.error('[CarolinaPanorama] Failed to fetch categories:', error);
                 return [];
@@ -137,32 +362,58 @@
                 categoriesFetchPromise = null;
             }
         })();
-        
+
         return categoriesFetchPromise;
     };
 
     // Get category details by name
     window.CarolinaPanorama.getCategoryByName = async function(categoryName) {
         if (!categoryName) return null;
-        
-        const categories = await window.CarolinaPanorama.fetchCategories();
-        const normalized = categoryName.toLowerCase().trim();
-        
-        return categories.find(cat => 
-            cat.name.toLowerCase() === normalized
-        ) || null;
+        await window.CarolinaPanorama.fetchCategories();
+        const entry = categoryLookup.get(normalizeCategoryName(categoryName));
+        return entry ? entry.category : null;
     };
 
     // Get inline style for category tag with color from CMS
     window.CarolinaPanorama.getCategoryStyle = async function(categoryName) {
-        const category = await window.CarolinaPanorama.getCategoryByName(categoryName);
-        
-        if (category && category.color_code) {
-            return `background-color: ${category.color_code} !important;`;
+        await window.CarolinaPanorama.fetchCategories();
+        return window.CarolinaPanorama.getCategoryStyleSync(categoryName);
+    };
+
+    // Synchronous variants: use once categories have loaded (renderCards() waits for them).
+    // Unknown categories - or categories not loaded yet - get the default blue.
+    window.CarolinaPanorama.getCategoryStyleSync = function(categoryName) {
+        const entry = categoryLookup.get(normalizeCategoryName(categoryName));
+        return entry ? entry.style : DEFAULT_CATEGORY_STYLE;
+    };
+
+    // Category tag markup: <span class="cp-article-tag {slug}" style="{CMS color}">name</span>
+    window.CarolinaPanorama.categoryTagHtml = function(categoryName) {
+        const entry = categoryLookup.get(normalizeCategoryName(categoryName));
+        const className = entry ? entry.className : categorySlug(categoryName);
+        const style = entry ? entry.style : DEFAULT_CATEGORY_STYLE;
+        return `<span class="cp-article-tag ${className}" style="${style}">${categoryName}</span>`;
+    };
+
+    /**
+     * Render a list of cards in one pass: waits for categories once, builds every card
+     * synchronously with renderCard(item, index) (an HTML string), then parses and
+     * inserts them all through a single DocumentFragment.
+     * @param {Element} container
+     * @param {Array} items
+     * @param {Function} renderCard - (item, index) => HTML string
+     * @param {Object} options - { append } add after the existing content instead of replacing it
+     */
+    window.CarolinaPanorama.renderCards = async function(container, items, renderCard, { append = false } = {}) {
+        await window.CarolinaPanorama.fetchCategories();
+        const template = document.createElement('template');
+        template.innerHTML = items.map((item, index) => renderCard(item, index)).join('');
+        if (append) {
+            container.appendChild(template.content);
+        } else {
+            container.replaceChildren(template.content);
         }
-        
-        // Fallback to default blue
-        return 'background-color: #3b82f6 !important;';
+        return container;
     };
 
     // Extract keywords from text (simple implementation)
@@ -238,7 +489,7 @@
         document.querySelectorAll('img.cp-article-image').forEach(img => {
         img.addEventListener('error', handleImgError);
         // If already broken (cached 404), trigger error
-        if (!img.complete || img.naturalWidth === 0) {
+        if (img.complete && img.naturalWidth === 0) {
             handleImgError({ target: img });
         }
         });
@@ -254,6 +505,71 @@
         const safe = encodeURI(normalized);
         return 'https://images.leadconnectorhq.com/image/f_webp/q_80/r_' + width + '/u_' + safe;
     };
+
+    // Responsive images: widths requested from the LeadConnector resize proxy for srcset.
+    // Keep in sync with CP_SSR_IMAGE_WIDTHS in ssr-helpers.php (GENERATE_SHORTCODES.py --ssr).
+    window.CarolinaPanorama.IMAGE_WIDTHS = [320, 480, 640, 960, 1200];
+    window.CarolinaPanorama.PLACEHOLDER_IMAGE = 'https://storage.googleapis.com/msgsndr/9Iv8kFcMiUgScXzMPv23/media/697bd8644d56831c95c3248d.svg';
+
+    /**
+     * Attributes for a responsive <img>: src/srcset/sizes through the resize proxy
+     * (images it can't resize, e.g. SVGs or other hosts, keep a plain src), and
+     * loading hints. Only the LCP candidate should pass priority: true - it loads
+     * eagerly with fetchpriority="high"; everything else is lazy.
+     */
+    window.CarolinaPanorama.imageAttrs = function(url, { sizes = '100vw', priority = false, widths = window.CarolinaPanorama.IMAGE_WIDTHS } = {}) {
+        const src = url || window.CarolinaPanorama.PLACEHOLDER_IMAGE;
+        const attrs = priority
+            ? { src, loading: 'eager', fetchpriority: 'high', decoding: 'async' }
+            : { src, loading: 'lazy', decoding: 'async' };
+        if (/\.svg(?:[?#]|$)/i.test(src)) return attrs;
+
+        let candidates;
+        try {
+            candidates = widths.map(width => [window.CarolinaPanorama.proxiedLeadConnectorUrl(src, width), width]);
+        } catch (e) {
+            return attrs;  // relative or malformed URL: leave as is
+        }
+        if (candidates.some(([proxied]) => proxied === src)) return attrs;
+
+        attrs.src = candidates[candidates.length - 1][0];
+        attrs.srcset = candidates.map(([proxied, width]) => `${proxied} ${width}w`).join(', ');
+        attrs.sizes = sizes;
+        return attrs;
+    };
+
+    /**
+     * <img> markup for imageAttrs(url, options), plus alt and className.
+     */
+    window.CarolinaPanorama.imageHtml = function(url, { alt = '', className = '', ...options } = {}) {
+        const escape = value => String(value).replace(/&/g, '&amp;').replace(/"/g, '&quot;').replace(/</g, '&lt;');
+        const attrs = window.CarolinaPanorama.imageAttrs(url, options);
+        const parts = Object.entries(attrs).map(([name, value]) => `${name}="${escape(value)}"`);
+        parts.splice(1, 0, `alt="${escape(alt)}"`);
+        if (className) parts.push(`class="${escape(className)}"`);
+        return `<img ${parts.join(' ')}>`;
+    };
+
+    /**
+     * Apply imageAttrs(url, options) to an existing <img> (srcset/sizes before src,
+     * so the browser picks a candidate instead of fetching the full-size src first).
+     */
+    window.CarolinaPanorama.applyImage = function(img, url, options = {}) {
+        const attrs = window.CarolinaPanorama.imageAttrs(url, options);
+        img.loading = attrs.loading;
+        img.decoding = attrs.decoding;
+        if (attrs.fetchpriority) img.setAttribute('fetchpriority', attrs.fetchpriority);
+        else img.removeAttribute('fetchpriority');
+        if (attrs.srcset) {
+            img.sizes = attrs.sizes;
+            img.srcset = attrs.srcset;
+        } else {
+            img.removeAttribute('sizes');
+            img.removeAttribute('srcset');
+        }
+        img.src = attrs.src;
+        return img;
+    };
     
     /**
      * Fetch metadata for a single article URL by scraping meta tags and common selectors.
@@ -316,6 +632,255 @@
         }
     };
 
+    // Shared per-URL response cache: widgets on the same page requesting the same
+    // CMS URL share one fetch (in-flight requests included) until the TTL expires
+    const responseCache = new Map();
+    const RESPONSE_CACHE_TTL = 60 * 1000; // 1 minute
+    const RESPONSE_CACHE_MAX_ENTRIES = 100;
+
+    // Homepage payload: { responses: { "<path?query>": <CMS JSON> } }, fetched once per page.
+    // Resolves to the CMS JSON for `url`, or undefined when the payload doesn't have it.
+    let homepagePayloadPromise = null;
+    function homepageResponse(url) {
+        const payloadUrl = window.CarolinaPanorama.HOMEPAGE_API_URL;
+        const apiBase = window.CarolinaPanorama.API_BASE_URL;
+        if (!payloadUrl || !url.startsWith(apiBase + '/')) {
+            return Promise.resolve(undefined);
+        }
+        if (!homepagePayloadPromise) {
+            homepagePayloadPromise = fetch(payloadUrl)
+                .then(response => {
+                    if (!response.ok) throw new Error(`Fetch failed: ${response.status} ${payloadUrl}`);
+                    return response.json();
+                })
+                .then(payload => payload.responses || {})
+                .catch(error => {
+                    console.warn('[CarolinaPanorama] Homepage payload unavailable, using the CMS API:', error);
+                    return {};
+                });
+        }
+        return homepagePayloadPromise.then(responses => responses[url.slice(apiBase.length)]);
+    }
+
+    /**
+     * Fetch a URL as JSON through the shared cache.
+     * Resolves to the parsed body (shared between callers - copy before mutating).
+     * @param {string} url
+     * @param {Object} options - { ttl } cache lifetime in ms
+     */
+    window.CarolinaPanorama.fetchJSON = function(url, { ttl = RESPONSE_CACHE_TTL } = {}) {
+        const now = Date.now();
+        const entry = responseCache.get(url);
+        if (entry && entry.expires > now) {
+            return entry.promise;
+        }
+
+        const promise = homepageResponse(url).then(data => data !== undefined ? data : fetch(url).then(response => {
+            if (!response.ok) throw new Error(`Fetch failed: ${response.status} ${url}`);
+            return response.json();
+        }));
+        // Don't cache failures - the next caller retries
+        promise.catch(() => {
+            if (responseCache.get(url)?.promise === promise) {
+                responseCache.delete(url);
+            }
+        });
+
+        responseCache.delete(url);
+        responseCache.set(url, { promise, expires: now + ttl });
+        if (responseCache.size > RESPONSE_CACHE_MAX_ENTRIES) {
+            // Map keeps insertion order: drop the oldest entry
+            responseCache.delete(responseCache.keys().next().value);
+        }
+        return promise;
+    };
+
+    // Drop one URL (or everything) from the shared response cache
+    window.CarolinaPanorama.clearResponseCache = function(url) {
+        if (url) {
+            responseCache.delete(url);
+        } else {
+            responseCache.clear();
+            homepagePayloadPromise = null;
+        }
+    };
+
+    // YouTube API responses (/api/public/youtube) change a few times a day
+    const YOUTUBE_CACHE_TTL = 15 * 60 * 1000; // 15 minutes
+
+    /**
+     * Fetch a YouTube API URL (channel or playlist videos) through the shared cache,
+     * fresh for `ttl`. Failed responses aren't cached.
+     * @param {string} url - /api/public/youtube URL including the query string
+     * @param {Object} options - { ttl } freshness in ms
+     */
+    window.CarolinaPanorama.fetchYouTubeVideos = function(url, { ttl = YOUTUBE_CACHE_TTL } = {}) {
+        return window.CarolinaPanorama.cachedFetch(`youtube:${url}`, async () => {
+            const result = await window.CarolinaPanorama.fetchJSON(url, { ttl });
+            if (!result || !result.success) {
+                throw new Error((result && result.error) || 'Failed to load videos');
+            }
+            return result;
+        }, { maxAge: ttl });
+    };
+
+    /**
+     * Run `callback` once, when `element` comes within `rootMargin` of the viewport
+     * (straight away where IntersectionObserver isn't available).
+     */
+    window.CarolinaPanorama.whenVisible = function(element, callback, { rootMargin = '200px' } = {}) {
+        if (!element || !('IntersectionObserver' in window)) {
+            callback();
+            return;
+        }
+        const observer = new IntersectionObserver(entries => {
+            if (entries.some(entry => entry.isIntersecting)) {
+                observer.disconnect();
+                callback();
+            }
+        }, { rootMargin });
+        observer.observe(element);
+    };
+
+    // ===== Performance telemetry =====
+    // Widgets and the GHL loaders (gen_widget_loader.py) time their fetch, parse and render
+    // phases as User Timing measures named cp:<widget>:<phase>. Every such measure on the
+    // page is queued and sent in batches with navigator.sendBeacon to TELEMETRY_URL, tagged
+    // with the asset version so runs before and after a deploy can be compared.
+    const TELEMETRY_BATCH_SIZE = 20;
+    const TELEMETRY_FLUSH_MS = 10 * 1000;
+    const MEASURE_NAME = /^cp:([^:]+):([^:]+)$/;
+    const telemetryQueue = [];
+    let telemetryTimer = null;
+    let perfSequence = 0;
+
+    // This script's own util-ghl-assets@<version> (jsDelivr), when loaded from a versioned URL
+    const scriptVersionMatch = document.currentScript
+        && /util-ghl-assets@([^/]+)/.exec(document.currentScript.src || '');
+
+    // Deployed asset version: window.CP_ASSETS_VERSION on GHL (set by the gen_widget_loader.py
+    // loaders once resolved), CarolinaPanoramaConfig.assetVersion on WordPress (the global
+    // JS content hash), else the version in this script's URL
+    function assetVersion() {
+        return window.CP_ASSETS_VERSION
+            || (window.CarolinaPanoramaConfig && window.CarolinaPanoramaConfig.assetVersion)
+            || (scriptVersionMatch && scriptVersionMatch[1])
+            || 'unknown';
+    }
+
+    function flushTelemetry() {
+        clearTimeout(telemetryTimer);
+        telemetryTimer = null;
+        const url = window.CarolinaPanorama.TELEMETRY_URL;
+        if (!url || telemetryQueue.length === 0) return;
+
+        const body = JSON.stringify({ page: location.pathname, samples: telemetryQueue.splice(0) });
+        // text/plain keeps the beacon a simple request (no CORS preflight)
+        const blob = new Blob([body], { type: 'text/plain;charset=UTF-8' });
+        if (!(navigator.sendBeacon && navigator.sendBeacon(url, blob))) {
+            fetch(url, { method: 'POST', body: blob, keepalive: true, mode: 'no-cors' }).catch(() => {});
+        }
+    }
+
+    function recordMeasure(entry) {
+        const match = MEASURE_NAME.exec(entry.name);
+        if (!match || !window.CarolinaPanorama.TELEMETRY_URL) return;
+        const detail = entry.detail || {};
+        telemetryQueue.push({
+            widget: match[1],
+            phase: match[2],
+            duration_ms: Math.round(entry.duration * 10) / 10,
+            ok: detail.ok !== false,
+            version: detail.version || assetVersion()
+        });
+        if (telemetryQueue.length >= TELEMETRY_BATCH_SIZE) {
+            flushTelemetry();
+        } else if (!telemetryTimer) {
+            telemetryTimer = setTimeout(flushTelemetry, TELEMETRY_FLUSH_MS);
+        }
+    }
+
+    // Observe measures (the loaders' included, even those made before this script ran);
+    // without PerformanceObserver, perfStart() records its own measures directly
+    let measureObserver = null;
+    if (window.CarolinaPanorama.TELEMETRY_URL && typeof PerformanceObserver !== 'undefined'
+        && (PerformanceObserver.supportedEntryTypes || []).includes('measure')) {
+        measureObserver = new PerformanceObserver(list => list.getEntries().forEach(recordMeasure));
+        measureObserver.observe({ type: 'measure', buffered: true });
+    }
+    // Send what's queued while the page can still be unloaded safely
+    document.addEventListener('visibilitychange', () => {
+        if (document.visibilityState === 'hidden') flushTelemetry();
+    });
+    window.addEventListener('pagehide', flushTelemetry);
+
+    /**
+     * Start timing one phase of a widget. Returns end({ ok }), which records the
+     * measure cp:<widget>:<phase> (call it once; later calls are ignored).
+     * @param {string} widget - widget name (its file name without .html)
+     * @param {string} phase - fetch, parse or render
+     */
+    window.CarolinaPanorama.perfStart = function(widget, phase) {
+        const name = `cp:${widget}:${phase}`;
+        const started = performance.now();
+        const mark = `${name}:${++perfSequence}`;
+        try { performance.mark(mark); } catch (e) { /* User Timing unavailable */ }
+
+        let ended = false;
+        return function end({ ok = true } = {}) {
+            if (ended) return;
+            ended = true;
+            const detail = { ok, version: assetVersion() };
+            let entry = null;
+            try {
+                entry = performance.measure(name, { start: mark, detail });
+                performance.clearMarks(mark);
+            } catch (e) { /* Older browsers: no measure options */ }
+            if (!measureObserver) {
+                recordMeasure(entry || { name, duration: performance.now() - started, detail });
+            }
+        };
+    };
+
+    /**
+     * Time an async phase: resolves/rejects like `fn()`, recording the measure either way
+     * (ok: false when it throws).
+     */
+    window.CarolinaPanorama.timePhase = async function(widget, phase, fn) {
+        const end = window.CarolinaPanorama.perfStart(widget, phase);
+        try {
+            const result = await fn();
+            end();
+            return result;
+        } catch (error) {
+            end({ ok: false });
+            throw error;
+        }
+    };
+
+    // Send queued samples now (also runs on pagehide and when the tab is hidden)
+    window.CarolinaPanorama.flushTelemetry = flushTelemetry;
+
+    /**
+     * Map items through an async function with at most `limit` calls in flight.
+     * Results keep input order.
+     */
+    window.CarolinaPanorama.mapWithConcurrency = async function(items, limit, fn) {
+        const results = new Array(items.length);
+        let next = 0;
+
+        async function worker() {
+            while (next < items.length) {
+                const index = next++;
+                results[index] = await fn(items[index], index);
+            }
+        }
+
+        const workers = Array.from({ length: Math.min(limit, items.length) }, worker);
+        await Promise.all(workers);
+        return results;
+    };
+
     // proxiedLeadConnectorUrl already present as window.CarolinaPanorama.proxiedLeadConnectorUrl
     /**
      * Fetch articles from Carolina Panorama CMS public API and map to metadata objects.
@@ -349,9 +914,7 @@
 
         const url = `${apiBase}/api/public/articles?${params.toString()}`;
         try {
-            const response = await fetch(url);
-            if (!response.ok) throw new Error(`CMS fetch failed: ${response.status}`);
-            const json = await response.json();
+            const json = await window.CarolinaPanorama.fetchJSON(url);
             if (!json.success || !Array.isArray(json.data)) return [];
 
             return json.data.map(article => ({
@@ -1,50 +1,220 @@
 #!/usr/bin/env python3
 
-def generate_widget_loader(widget_path, widget_id, custom_value_key=None):
-    """
-    widget_path:    e.g. "site-home-widgets/headlines-grid-v2.html"
-    widget_id:      e.g. "GHL_TOP_ARTICLES" or "CP_ARTICLE_LIST_FEED_WIDGET"
-    custom_value_key (optional):
-                    e.g. "top_articles" (without 'custom_values.' prefix)
-    """
-    version_helper = """
-    function withAssetsVersion(callback, timeoutMs) {
-      var start = Date.now();
-
-      function readVersion() {
-        // Prefer explicit global if already set
-        if (window.CP_ASSETS_VERSION) {
-          return window.CP_ASSETS_VERSION;
-        }
+import json
+import os
+import re
+import subprocess
+
+# Shared, promise-based version resolver. Every loader on the page awaits the same
+# window.CP_ASSETS_VERSION_READY promise, which settles (without polling) when:
+#   - window.CP_ASSETS_VERSION is already set, or is assigned later, or
+#   - a script/link from util-ghl-assets@<version> is (or gets) added to the DOM, or
+#   - the window 'load' event fires or VERSION_TIMEOUT_MS passes, whichever comes
+#     first, with neither found -> falls back to "main". The timeout bounds the wait
+#     on pages whose load event is held up by slow images or third-party embeds.
+# The resolved version is then stored in window.CP_ASSETS_VERSION, where
+# carolina-panorama-global.js reads it to tag performance samples.
+VERSION_TIMEOUT_MS = 5000
+VERSION_HELPER = """
+    function withAssetsVersion(callback) {
+      if (!window.CP_ASSETS_VERSION_READY) {
+        window.CP_ASSETS_VERSION_READY = new Promise(function(resolve) {
+          var selector = 'script[src*="util-ghl-assets@"], link[href*="util-ghl-assets@"]';
+          var observer = null;
+          var timer = null;
+
+          function fromElement(el) {
+            var url = (el && (el.src || el.href)) || '';
+            var match = url.match(/util-ghl-assets@([^/]+)/);
+            return match && match[1] ? match[1] : null;
+          }
+
+          function done(version) {
+            if (observer) observer.disconnect();
+            clearTimeout(timer);
+            window.removeEventListener('load', onLoad);
+            // Replace the watching accessor below with the resolved value
+            Object.defineProperty(window, 'CP_ASSETS_VERSION', {
+              configurable: true,
+              enumerable: true,
+              writable: true,
+              value: version
+            });
+            resolve(version);
+          }
+
+          function onLoad() {
+            console.warn('Could not determine assets version; falling back to "main" for widget loader.');
+            done('main');
+          }
+
+          // Prefer explicit global if already set
+          var v = window.CP_ASSETS_VERSION || fromElement(document.querySelector(selector));
+          if (v) return done(v);
 
-        // Fallback: derive from any existing global JS/CSS URL that includes util-ghl-assets@
-        var selector = 'script[src*="util-ghl-assets@"], link[href*="util-ghl-assets@"]';
-        var el = document.querySelector(selector);
-        if (!el) return null;
+          // Resolve as soon as the global is assigned...
+          var current;
+          Object.defineProperty(window, 'CP_ASSETS_VERSION', {
+            configurable: true,
+            get: function() { return current; },
+            set: function(value) {
+              current = value;
+              if (value) done(value);
+            }
+          });
 
-        var url = el.src || el.href || '';
-        var match = url.match(/util-ghl-assets@([^/]+)/);
-        if (match && match[1]) {
-          return match[1];
+          // ...or a versioned global JS/CSS tag shows up in the DOM
+          if (window.MutationObserver) {
+            observer = new MutationObserver(function(mutations) {
+              for (var i = 0; i < mutations.length; i++) {
+                var nodes = mutations[i].addedNodes;
+                for (var j = 0; j < nodes.length; j++) {
+                  var node = nodes[j];
+                  if (node.nodeType !== 1) continue;
+                  var el = node.matches && node.matches(selector) ? node : node.querySelector && node.querySelector(selector);
+                  var found = fromElement(el);
+                  if (found) return done(found);
+                }
+              }
+            });
+            observer.observe(document.documentElement, { childList: true, subtree: true });
+          }
+
+          if (document.readyState === 'complete') return onLoad();
+          window.addEventListener('load', onLoad);
+          timer = setTimeout(onLoad, %d);
+        });
+      }
+      window.CP_ASSETS_VERSION_READY.then(callback);
+    }
+""".rstrip() % VERSION_TIMEOUT_MS
+
+# Pinned variant: the version is baked in at generation time, nothing to resolve
+# (still published in window.CP_ASSETS_VERSION unless the page already set one)
+PINNED_VERSION_HELPER = """
+    function withAssetsVersion(callback) {
+      if (!window.CP_ASSETS_VERSION) window.CP_ASSETS_VERSION = %s;
+      callback(%s);
+    }
+""".rstrip()
+
+
+# Runs the <script> tags of a freshly inserted widget. External scripts go through a
+# page-wide registry (window.CP_SCRIPT_REGISTRY: src -> load promise) so a library
+# shared by several widgets (e.g. InstantSearch) is downloaded and executed once;
+# new ones are fetched in parallel (async = false keeps their execution order), then
+# the widget's inline scripts run in document order.
+SCRIPT_RUNNER = """
+    function runWidgetScripts(container) {
+      var registry = window.CP_SCRIPT_REGISTRY = window.CP_SCRIPT_REGISTRY || {};
+      var scripts = Array.prototype.slice.call(container.querySelectorAll('script'));
+      var loads = [];
+      var inline = [];
+
+      function copyAttributes(from, to) {
+        for (var i = 0; i < from.attributes.length; i++) {
+          var attr = from.attributes[i];
+          if (attr.name !== 'src') to.setAttribute(attr.name, attr.value);
         }
+      }
 
-        return null;
+      function alreadyOnPage(src) {
+        var tags = document.querySelectorAll('script[src]');
+        for (var i = 0; i < tags.length; i++) {
+          if (tags[i].src === src && !container.contains(tags[i])) return true;
+        }
+        return false;
       }
 
-      (function check() {
-        var v = readVersion();
-        if (v) {
-          callback(v);
-        } else if (Date.now() - start < (timeoutMs || 5000)) {
-          setTimeout(check, 25);
-        } else {
-          console.warn('Could not determine assets version; falling back to "main" for widget loader.');
-          callback('main');
+      scripts.forEach(function(oldScript) {
+        if (!oldScript.src) {
+          inline.push(oldScript);
+          return;
         }
-      })();
+
+        var src = oldScript.src;
+        if (!registry[src]) {
+          registry[src] = alreadyOnPage(src) ? Promise.resolve() : new Promise(function(resolve, reject) {
+            var s = document.createElement('script');
+            copyAttributes(oldScript, s);
+            s.async = false;
+            s.onload = function() { resolve(); };
+            s.onerror = function() { reject(new Error('Failed to load ' + src)); };
+            s.src = src;
+            document.head.appendChild(s);
+          });
+        }
+        loads.push(registry[src].catch(function(err) { console.error(err); }));
+        oldScript.parentNode.removeChild(oldScript);
+      });
+
+      return Promise.all(loads).then(function() {
+        inline.forEach(function(oldScript) {
+          var s = document.createElement('script');
+          copyAttributes(oldScript, s);
+          s.textContent = oldScript.textContent;
+          oldScript.parentNode.replaceChild(s, oldScript);
+        });
+      });
     }
 """.rstrip()
 
+
+# User Timing for the loader's own phases: measures named cp:<widget>:loader-<phase>
+# (fetch = download, parse = innerHTML, render = running the widget's scripts), with the
+# assets version in their detail. carolina-panorama-global.js picks them up with a
+# buffered PerformanceObserver and sends them with the widgets' samples.
+PERF_HELPER = """
+    function perfStart(widget, phase, version) {
+      var name = 'cp:' + widget + ':loader-' + phase;
+      var mark = name + ':' + Math.random().toString(36).slice(2);
+      var ended = false;
+      try { performance.mark(mark); } catch (e) {}
+      return function end(ok) {
+        if (ended) return;
+        ended = true;
+        try {
+          performance.measure(name, { start: mark, detail: { ok: ok !== false, version: version } });
+          performance.clearMarks(mark);
+        } catch (e) {}
+      };
+    }
+""".rstrip()
+
+
+def version_helper(version=None):
+    """
+    JS defining withAssetsVersion(callback): pinned to `version` if given,
+    otherwise the shared event-driven resolver.
+    """
+    if version:
+        return PINNED_VERSION_HELPER % (json.dumps(version), json.dumps(version))
+    return VERSION_HELPER
+
+
+def current_git_version():
+    """Full commit hash of the checked-out repo, for pinning loaders to an immutable CDN path."""
+    repo_dir = os.path.dirname(os.path.abspath(__file__))
+    return subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=repo_dir, text=True).strip()
+
+
+def generate_widget_loader(widget_path, widget_id, custom_value_key=None, dist=False, version=None):
+    """
+    widget_path:    e.g. "site-home-widgets/headlines-grid-v2.html"
+    widget_id:      e.g. "GHL_TOP_ARTICLES" or "CP_ARTICLE_LIST_FEED_WIDGET"
+    custom_value_key (optional):
+                    e.g. "top_articles" (without 'custom_values.' prefix)
+    dist (optional):
+                    load the minified copy from dist/ (built by build_dist.py)
+                    instead of the raw file under site-assets/
+    version (optional):
+                    bake this assets version (tag or commit hash) into the snippet
+                    instead of resolving it at runtime
+    """
+    asset_root = "dist" if dist else "site-assets"
+    helper = version_helper(version)
+    widget_name = widget_name_for_path(widget_path)
+
     if custom_value_key:
         # Widget that uses a GHL custom_value
         custom_expr = f"{{{{custom_values.{custom_value_key}}}}}"
@@ -54,7 +224,9 @@ def generate_widget_loader(widget_path, widget_id, custom_value_key=None):
 </script>
 
 <script>
-{version_helper}
+{helper}
+{PERF_HELPER}
+{SCRIPT_RUNNER}
 
   (function () {{
     const id = '{widget_id}';
@@ -64,23 +236,23 @@ def generate_widget_loader(widget_path, widget_id, custom_value_key=None):
     withAssetsVersion(function(version) {{
       var url = 'https://cdn.jsdelivr.net/gh/Carolina-Panorama/util-ghl-assets@' +
                 version +
-                '/site-assets/{widget_path}';
+                '/{asset_root}/{widget_path}';
 
+      var endFetch = perfStart('{widget_name}', 'fetch', version);
       fetch(url)
         .then(function(r) {{ return r.text(); }})
         .then(function(html) {{
+          endFetch();
+          var endParse = perfStart('{widget_name}', 'parse', version);
           const container = document.createElement('div');
           anchor.parentNode.insertBefore(container, anchor.nextSibling);
           container.innerHTML = html;
-
-          container.querySelectorAll('script').forEach(function(oldScript) {{
-            const s = document.createElement('script');
-            if (oldScript.src) s.src = oldScript.src;
-            else s.textContent = oldScript.textContent;
-            oldScript.parentNode.replaceChild(s, oldScript);
-          }});
+          endParse();
+          var endRender = perfStart('{widget_name}', 'render', version);
+          return runWidgetScripts(container).then(function() {{ endRender(); }});
         }})
         .catch(function(err) {{
+          endFetch(false);
           console.error('Error loading widget ({widget_path}):', err);
         }});
     }});
@@ -93,28 +265,30 @@ def generate_widget_loader(widget_path, widget_id, custom_value_key=None):
     const anchor = document.getElementById('{widget_id}') || document.currentScript;
     if (!anchor) return;
 
-{version_helper}
+{helper}
+{PERF_HELPER}
+{SCRIPT_RUNNER}
 
     withAssetsVersion(function(version) {{
       var url = 'https://cdn.jsdelivr.net/gh/Carolina-Panorama/util-ghl-assets@' +
                 version +
-                '/site-assets/{widget_path}';
+                '/{asset_root}/{widget_path}';
 
+      var endFetch = perfStart('{widget_name}', 'fetch', version);
       fetch(url)
         .then(function(r) {{ return r.text(); }})
         .then(function(html) {{
+          endFetch();
+          var endParse = perfStart('{widget_name}', 'parse', version);
           const container = document.createElement('div');
           anchor.parentNode.insertBefore(container, anchor.nextSibling);
           container.innerHTML = html;
-
-          container.querySelectorAll('script').forEach(function(oldScript) {{
-            const s = document.createElement('script');
-            if (oldScript.src) s.src = oldScript.src;
-            else s.textContent = oldScript.textContent;
-            oldScript.parentNode.replaceChild(s, oldScript);
-          }});
+          endParse();
+          var endRender = perfStart('{widget_name}', 'render', version);
+          return runWidgetScripts(container).then(function() {{ endRender(); }});
         }})
         .catch(function(err) {{
+          endFetch(false);
           console.error('Error loading widget ({widget_path}):', err);
         }});
     }});
@@ -122,29 +296,167 @@ def generate_widget_loader(widget_path, widget_id, custom_value_key=None):
 </script>"""
 
 
+def widget_name_for_path(widget_path):
+    """
+    Widget name used in performance measures: the filename minus extension, as in the
+    widgets' own CarolinaPanorama.perfStart() calls.
+    Example: "site-home-widgets/article-list-feed.html" -> "article-list-feed"
+    """
+    stem, _ = os.path.splitext(os.path.basename(widget_path))
+    return stem
+
+
+def widget_id_for_path(widget_path):
+    """
+    Derive the anchor id from a widget filename (minus extension), formatted as CP_{FILENAME}
+    Example: "article-list-feed.html" -> "CP_ARTICLE_LIST_FEED"
+    """
+    basename = os.path.basename(widget_path)
+    stem, _ = os.path.splitext(basename)
+    # Replace any non-alphanumeric characters with underscore, then uppercase
+    formatted = re.sub(r"[^A-Za-z0-9]+", "_", stem).strip("_").upper()
+    return f"CP_{formatted}"
+
+
+def parse_widget_spec(spec):
+    """
+    Split "path[:custom_value_key]" into (widget_path, custom_value_key or None).
+    """
+    widget_path, _, custom_value_key = spec.partition(":")
+    return widget_path, (custom_value_key or None)
+
+
+def generate_page_loader(widget_specs, bundle_name, version=None):
+    """
+    One loader for every widget on a page.
+
+    widget_specs:   e.g. ["site-home-widgets/headlines-grid-v2.html",
+                          "site-home-widgets/trending-carousel-v2.html:editors_picks"]
+                    (optional ":custom_value_key" suffix, as for generate_widget_loader)
+    bundle_name:    e.g. "home" -> fetches dist/bundles/home.json (built by build_dist.py)
+    version:        optional pinned assets version (see generate_widget_loader)
+
+    Resolves the assets version once, fetches the combined bundle in a single request
+    and hydrates every widget anchor found on the page from it. The bundle download is
+    measured as widget "bundle-<bundle_name>"; parse/render per widget as usual.
+    """
+    anchors = []
+    widgets_js = []
+    for spec in widget_specs:
+        widget_path, custom_value_key = parse_widget_spec(spec)
+        widget_id = widget_id_for_path(widget_path)
+        if custom_value_key:
+            anchors.append(
+                f'<script id="{widget_id}" type="text/plain">\n'
+                f'  {{{{custom_values.{custom_value_key}}}}}\n'
+                f'</script>'
+            )
+        else:
+            anchors.append(f'<div id="{widget_id}"></div>')
+        widgets_js.append(
+            f"      {{ id: {json.dumps(widget_id)}, path: {json.dumps(widget_path)}, "
+            f"name: {json.dumps(widget_name_for_path(widget_path))} }}"
+        )
+
+    helper = version_helper(version)
+    anchors_html = "\n".join(anchors)
+    widgets_list = ",\n".join(widgets_js)
+
+    return f"""<!-- Widget anchors: place each one where that widget should render -->
+{anchors_html}
+
+<!-- Page loader (once per page) -->
+<script>
+  (function () {{
+    const widgets = [
+{widgets_list}
+    ];
+{helper}
+{PERF_HELPER}
+{SCRIPT_RUNNER}
+
+    withAssetsVersion(function(version) {{
+      var url = 'https://cdn.jsdelivr.net/gh/Carolina-Panorama/util-ghl-assets@' +
+                version +
+                '/dist/bundles/{bundle_name}.json';
+
+      var endFetch = perfStart('bundle-{bundle_name}', 'fetch', version);
+      fetch(url)
+        .then(function(r) {{ return r.json(); }})
+        .then(function(bundle) {{
+          endFetch();
+          return Promise.all(widgets.map(function(widget) {{
+            const anchor = document.getElementById(widget.id);
+            const html = bundle.widgets[widget.path];
+            if (!anchor || html == null) return;
+
+            var endParse = perfStart(widget.name, 'parse', version);
+            const container = document.createElement('div');
+            anchor.parentNode.insertBefore(container, anchor.nextSibling);
+            container.innerHTML = html;
+            endParse();
+            var endRender = perfStart(widget.name, 'render', version);
+            return runWidgetScripts(container).then(function() {{ endRender(); }});
+          }}));
+        }})
+        .catch(function(err) {{
+          endFetch(false);
+          console.error('Error loading widget bundle ({bundle_name}):', err);
+        }});
+    }});
+  }})();
+</script>"""
+
+
 if __name__ == "__main__":
-  import os
-  import re
   import sys
 
-  if len(sys.argv) < 2:
-    print("Usage: gen_widget_loader.py <widget_path_relative_to_site-assets> [custom_value_key]")
+  args = sys.argv[1:]
+  dist = "--dist" in args
+  version = None
+  if "--pin" in args:
+    version = current_git_version()
+  if "--version" in args:
+    i = args.index("--version")
+    version = args[i + 1]
+    del args[i:i + 2]
+  args = [a for a in args if a not in ("--dist", "--pin")]
+
+  if args and args[0] == "--page":
+    # Page mode: one loader + one combined bundle for several widgets
+    import build_dist
+
+    if len(args) < 2:
+      print("Usage: gen_widget_loader.py --page <bundle_name> [widget_path[:custom_value_key] ...]")
+      print(f"Known bundles: {', '.join(sorted(build_dist.BUNDLES))}")
+      sys.exit(1)
+
+    bundle_name = args[1]
+    widget_specs = args[2:] or build_dist.BUNDLES.get(bundle_name)
+    if not widget_specs:
+      print(f"Unknown bundle '{bundle_name}'; pass the widget paths explicitly.")
+      sys.exit(1)
+
+    bundle_path = build_dist.build_bundle(bundle_name, [parse_widget_spec(s)[0] for s in widget_specs])
+    print(f"<!-- Bundle written to {bundle_path}; commit it with the release. -->")
+    print(generate_page_loader(widget_specs, bundle_name, version=version))
+    sys.exit(0)
+
+  if len(args) < 1:
+    print("Usage: gen_widget_loader.py [--dist] [--pin | --version <ref>] <widget_path_relative_to_site-assets> [custom_value_key]")
+    print("       gen_widget_loader.py --page <bundle_name> [--pin | --version <ref>] [widget_path[:custom_value_key] ...]")
     print("Example (no custom value): gen_widget_loader.py site-home-widgets/article-list-feed.html")
     print("Example (with custom value): gen_widget_loader.py site-home-widgets/trending-carousel-v2.html editors_picks")
+    print("Example (minified build): gen_widget_loader.py --dist site-home-widgets/article-list-feed.html")
+    print("Example (pinned to current commit): gen_widget_loader.py --pin site-home-widgets/article-list-feed.html")
     sys.exit(1)
 
-  widget_path = sys.argv[1]
+  widget_path = args[0]
   custom_value_key = None
-  if len(sys.argv) >= 3:
-    custom_value_key = sys.argv[2]
-
-  # Derive widget_id from filename (minus extension), formatted as CP_{FILENAME}
-  # Example: "article-list-feed.html" -> "CP_ARTICLE_LIST_FEED"
-  basename = os.path.basename(widget_path)
-  stem, _ = os.path.splitext(basename)
-  # Replace any non-alphanumeric characters with underscore, then uppercase
-  formatted = re.sub(r"[^A-Za-z0-9]+", "_", stem).strip("_").upper()
-  widget_id = f"CP_{formatted}"
-
-  snippet = generate_widget_loader(widget_path=widget_path, widget_id=widget_id, custom_value_key=custom_value_key)
+  if len(args) >= 2:
+    custom_value_key = args[1]
+
+  widget_id = widget_id_for_path(widget_path)
+
+  snippet = generate_widget_loader(widget_path=widget_path, widget_id=widget_id, custom_value_key=custom_value_key, dist=dist, version=version)
   print(snippet)
\ No newline at end of file
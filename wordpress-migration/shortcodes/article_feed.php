@@ -2,13 +2,15 @@
 /**
  * Shortcode: cp_article_feed
  * Widget: Article Feed
- * Auto-generated from WORDPRESS_MIGRATION_MANIFEST.json
+ * Source: site-assets/site-feed-widgets/article-feed-widget.html
+ * Auto-generated from WORDPRESS_MIGRATION_MANIFEST.json by GENERATE_SHORTCODES.py
  */
 
 function cp_shortcode_article_feed( $atts = [], $content = null, $tag = '' ) {
     // Enqueue dependencies
-    wp_enqueue_script( 'carolina_panorama_global' );
-    wp_enqueue_style( 'shared_article_card_styles' );
+    wp_enqueue_script( 'cp-global-js' );
+    wp_enqueue_style( 'cp-article-card-styles' );
+    wp_enqueue_style( 'cp-widget-article-feed' );
 
     
     // Shortcode attributes with defaults
@@ -18,17 +20,6 @@ function cp_shortcode_article_feed( $atts = [], $content = null, $tag = '' ) {
         'page' => 1,
     ];
     $atts = shortcode_atts( $defaults, $atts, 'cp_article_feed' );
-    
-    // Check for query parameters from redirects (category, tag, author)
-    if ( empty( $atts['category'] ) && ! empty( $_GET['category'] ) ) {
-        $atts['category'] = sanitize_text_field( $_GET['category'] );
-    }
-    if ( empty( $atts['category'] ) && ! empty( $_GET['tag'] ) ) {
-        $atts['category'] = sanitize_text_field( $_GET['tag'] );
-    }
-    if ( empty( $atts['category'] ) && ! empty( $_GET['author'] ) ) {
-        $atts['category'] = sanitize_text_field( $_GET['author'] );
-    }
 
     // Pass attributes to JavaScript via data attributes
     $data_attrs = '';
@@ -45,22 +36,381 @@ function cp_shortcode_article_feed( $atts = [], $content = null, $tag = '' ) {
     // Return the widget HTML
     ob_start();
     ?>
-    <div class="cp-widget-wrapper cp-widget-article_feed"{ $data_attrs }>
-        <div id="cp-article_feed-container">
-            <p style="color: #999;">Loading Article Feed...</p>
-        </div>
+<div class="cp-widget-wrapper cp-widget-article_feed"<?php echo $data_attrs; ?>>
+<!-- Article Feed Widget with Pagination and Filtering -->
+<!-- Include shared-article-card-styles.css in your page -->
+
+<div class="article-list-feed-wrapper">
+    <div id="category-header-container">
+        <h1 id="category-title"></h1>
+    </div>
+    <div class="article-list-container" id="article-feed-container">
+        <!-- Articles will be rendered here -->
+    </div>
+    <div class="article-feed-pagination" id="article-feed-pagination">
+        <!-- Pagination buttons will be rendered here -->
     </div>
-    <script>
-        // TODO: Initialize widget with $atts data
-        // Example: fetch from API using window.CarolinaPanorama utilities
-        (function() {
-            var container = document.getElementById('cp-article_feed-container');
-            if (!container) return;
+</div>
+
+<script>
+// Wait for CarolinaPanorama global before running widget logic
+function waitForCarolinaPanorama(callback, timeout = 5000) {
+    const start = Date.now();
+    (function check() {
+        if (window.CarolinaPanorama) {
+            callback();
+        } else if (Date.now() - start < timeout) {
+            setTimeout(check, 30);
+        } else {
+            console.error('CarolinaPanorama global not found.');
+        }
+    })();
+}
+
+waitForCarolinaPanorama(function() {
+    const container = document.getElementById('article-feed-container');
+    const pagination = document.getElementById('article-feed-pagination');
+    const categoryLabelDiv = document.getElementById('category-title');
+    const ARTICLES_PER_PAGE = 10;
+    const PERF_WIDGET = 'article-feed-widget';
+    let currentPage = 1;
+    let totalCount = 0;
+    let currentFilter = {};
+
+    const apiBase = window.CarolinaPanorama.API_BASE_URL || 'https://cms.carolinapanorama.org';
+
+    // Simple slug helper to match names coming from API
+    function slugify(str) {
+        return String(str || '')
+            .toLowerCase()
+            .trim()
+            .replace(/[^a-z0-9\s-]/g, '')
+            .replace(/\s+/g, '-');
+    }
+
+    let categoriesCache = null;
+    let authorsCache = null;
+
+    async function ensureCategories() {
+        if (categoriesCache) return categoriesCache;
+        try {
+            const res = await fetch(`${apiBase}/api/public/categories`);
+            const json = await res.json();
+            if (json.success && Array.isArray(json.data)) {
+                categoriesCache = json.data;
+            } else {
+                categoriesCache = [];
+            }
+        } catch (e) {
+            console.error('Failed to load categories from CMS:', e);
+            categoriesCache = [];
+        }
+        return categoriesCache;
+    }
+
+    async function ensureAuthors() {
+        if (authorsCache) return authorsCache;
+        try {
+            const res = await fetch(`${apiBase}/api/public/authors`);
+            const json = await res.json();
+            if (json.success && Array.isArray(json.data)) {
+                authorsCache = json.data;
+            } else {
+                authorsCache = [];
+            }
+        } catch (e) {
+            console.error('Failed to load authors from CMS:', e);
+            authorsCache = [];
+        }
+        return authorsCache;
+    }
+
+    // Utility to get filter from URL (category or tag)
+    function getFilterFromUrl() {
+        const path = window.location.pathname;
+        const matchCategory = path.match(/\/category\/([^\/]+)/);
+        const matchTag = path.match(/\/tag\/([^\/]+)/);
+        const matchAuthor = path.match(/\/author\/([^\/]+)/);
+        if (matchCategory) {
+            return { categoryUrlSlug: decodeURIComponent(matchCategory[1].replace(/\+/g, ' ')) };
+        } else if (matchTag) {
+            // Tags may have spaces encoded as %20 or +
+            return { tag: decodeURIComponent(matchTag[1].replace(/\+/g, ' ')) };
+        } else if (matchAuthor) {
+            return { author: decodeURIComponent(matchAuthor[1].replace(/\+/g, ' ')) };
+        }
+        return {};
+    }
+
+    // Fetch articles for current page and filter from CMS public API
+    async function fetchArticles(page = 1) {
+        currentFilter = getFilterFromUrl();
+        const params = new URLSearchParams();
+        params.set('page', String(page));
+        params.set('per_page', String(ARTICLES_PER_PAGE));
+
+        let categoryDetails = null;
+        let authorDetails = null;
+
+        if (currentFilter.categoryUrlSlug) {
+            const slug = currentFilter.categoryUrlSlug;
+            const cats = await ensureCategories();
+            const match = cats.find(c => slugify(c.name) === slug);
+            if (match) {
+                params.set('category', match.name);
+                // Include description for SEO
+                categoryDetails = { 
+                    label: match.name,
+                    description: match.description || ''
+                };
+            }
+        }
+
+        if (currentFilter.tag) {
+            // Interpret slug-ish tag from URL as tag name
+            const tagName = decodeURIComponent(currentFilter.tag).replace(/-/g, ' ');
+            params.set('tag', tagName);
+        }
+
+        if (currentFilter.author) {
+            const slug = currentFilter.author;
+            const authors = await ensureAuthors();
+            const match = authors.find(a => slugify(a.name) === slug);
+            if (match) {
+                params.set('author_id', String(match.id));
+                // Include bio for SEO
+                authorDetails = { 
+                    name: match.name,
+                    bio: match.bio || ''
+                };
+            }
+        }
+
+        const url = `${apiBase}/api/public/articles?${params.toString()}`;
+        const data = await window.CarolinaPanorama.timePhase(PERF_WIDGET, 'fetch',
+            () => fetch(url).then(response => response.json()));
+        const endParse = window.CarolinaPanorama.perfStart(PERF_WIDGET, 'parse');
+        if (!data.success || !Array.isArray(data.data)) {
+            endParse({ ok: false });
+            totalCount = 0;
+            return { articles: [], categoryDetails, authorDetails };
+        }
+        const paginationInfo = data.pagination || {};
+        totalCount = paginationInfo.total || data.data.length || 0;
+
+        const articles = data.data.map(article => ({
+            url: article.slug ? `/article#${encodeURIComponent(article.slug)}` : '',
+            title: article.title,
+            description: article.excerpt || '',
+            image: article.featured_image || "https://storage.googleapis.com/msgsndr/9Iv8kFcMiUgScXzMPv23/media/697bd8644d56831c95c3248d.svg",
+            author: article.author && article.author.name ? article.author.name : '',
+            date: article.publish_date,
+            categories: Array.isArray(article.categories) && article.categories.length > 0
+                ? article.categories.map(cat => cat.name)
+                : ['News']
+        }));
+        endParse();
+
+        return { articles, categoryDetails, authorDetails };
+    }
+
+    // Render articles
+    async function renderArticles(articles) {
+        if (!articles || articles.length === 0) {
+            container.innerHTML = '<p style="text-align: center; color: #666;">No articles found.</p>';
+            return;
+        }
+        await window.CarolinaPanorama.timePhase(PERF_WIDGET, 'render',
+            () => window.CarolinaPanorama.renderCards(container, articles, createArticleCard));
+    }
+
+    // Render pagination
+    function renderPagination(page, total) {
+        const prevDisabled = page === 1;
+        const nextDisabled = total <= page * ARTICLES_PER_PAGE;
+        const totalPages = Math.max(1, Math.ceil(total / ARTICLES_PER_PAGE));
+        pagination.innerHTML = `
+            <button id="feed-prev" ${prevDisabled ? 'disabled' : ''} aria-label="Previous Page">&laquo;</button>
+            <span class="page-count">${page} / ${totalPages}</span>
+            <button id="feed-next" ${nextDisabled ? 'disabled' : ''} aria-label="Next Page">&raquo;</button>
+        `;
+        
+        // Debounce pagination clicks to prevent double-clicks
+        const debouncedChangePage = window.CarolinaPanorama.debounce(changePage, 300);
+        
+        document.getElementById('feed-prev').onclick = function() {
+            if (!prevDisabled) debouncedChangePage(page - 1);
+        };
+        document.getElementById('feed-next').onclick = function() {
+            if (!nextDisabled) debouncedChangePage(page + 1);
+        };
+    }
+
+    // Create article card HTML (synchronous - renderCards() has loaded the categories)
+    function createArticleCard(data, index) {
+        const categoryTagsHTML = data.categories.slice(0, 2).map(window.CarolinaPanorama.categoryTagHtml);
+        
+        // Only the first card's image is an LCP candidate; the rest lazy-load
+        const image = window.CarolinaPanorama.imageHtml(data.image, {
+            alt: data.title,
+            className: 'cp-article-image',
+            sizes: '(max-width: 768px) 100vw, 280px',
+            priority: index === 0
+        });
+        
+        return `
+            <div class="article-list-item">
+                <article class="cp-article-card">
+                    <a href="${data.url}" class="cp-article-card-link">
+                        ${image}
+                        <div class="cp-article-content">
+                            <h2 class="cp-article-title">${data.title}</h2>
+                            <div class="cp-article-meta">
+                                <span class="cp-article-author">${data.author}</span>
+                                <span class="cp-article-date">${formatDate(data.date)}</span>
+                            </div>
+                            <p class="cp-article-description">${data.description}</p>
+                            <div class="cp-article-tags">
+                                ${categoryTagsHTML.join('')}
+                            </div>
+                            <span class="cp-article-read-more">Read More</span>
+                        </div>
+                    </a>
+                </article>
+            </div>
+        `;
+    }
+
+    function formatDate(date) {
+        const options = { month: 'numeric', day: 'numeric', year: 'numeric' };
+        return 'Published on: ' + new Date(date).toLocaleDateString('en-US', options);
+    }
+
+    // Change page
+    async function changePage(page) {
+        currentPage = page;
+        const { articles, categoryDetails, authorDetails } = await fetchArticles(page);
+        await renderArticles(articles);
+        renderPagination(page, totalCount);
+        
+        // Update header with stylized states
+        const headerContainer = document.getElementById('category-header-container');
+        const headerTitle = document.getElementById('category-title');
+        const filter = getFilterFromUrl();
+        
+        // Reset classes and inline styles
+        headerContainer.className = '';
+        headerContainer.removeAttribute('style');
+        
+        // SEO Meta injection based on page type
+        if (categoryDetails && categoryDetails.label) {
+            // Category state - use API color_code for background
+            const categoryClass = categoryDetails.label.toLowerCase().replace(/\s+/g, '-');
+            headerContainer.className = 'cp-article-tag ' + categoryClass;
+            
+            // Apply API color_code as inline style for header background
+            const categoryStyle = window.CarolinaPanorama.getCategoryStyleSync(categoryDetails.label);
+            if (categoryStyle) {
+                headerContainer.setAttribute('style', categoryStyle);
+            }
             
-            // Replace this with actual widget initialization logic
-            console.log('Widget article_feed initialized with:', {});
-        })();
-    </script>
+            headerTitle.innerHTML = `<span class="header-title">${categoryDetails.label}</span>`;
+            
+            // Set SEO meta for category pages with description and extracted keywords
+            const categoryName = categoryDetails.label;
+            const description = categoryDetails.description || `Browse the latest ${categoryName} articles from Carolina Panorama`;
+            
+            // Build contextual keywords
+            const baseKeywords = [categoryName];
+            
+            // Add Black-focused variations for relevant categories
+            const blackFocusedCategories = ['Business', 'Finance', 'Politics', 'Health', 'Education', 'Culture', 'Community'];
+            if (blackFocusedCategories.includes(categoryName)) {
+                baseKeywords.push(`Black ${categoryName}`);
+                baseKeywords.push(`African American ${categoryName}`);
+            }
+            
+            // Add geographic variations
+            const geoVariations = ['South Carolina', 'Columbia', 'Orangeburg', 'Lexington'];
+            geoVariations.forEach(location => {
+                baseKeywords.push(`${location} ${categoryName}`);
+            });
+            
+            // Extract keywords from description if available
+            if (categoryDetails.description && window.CarolinaPanorama.extractKeywords) {
+                const extractedKeywords = window.CarolinaPanorama.extractKeywords(categoryDetails.description, 3);
+                if (extractedKeywords) {
+                    baseKeywords.push(extractedKeywords);
+                }
+            }
+            
+            // Add standard context
+            baseKeywords.push('Carolina Panorama', 'news', 'articles');
+            
+            const keywords = baseKeywords.join(', ');
+            
+            window.CarolinaPanorama.setPageMeta({
+                title: `${categoryName} Articles | Carolina Panorama`,
+                description: description,
+                keywords: keywords,
+                url: window.location.href,
+                type: 'website'
+            });
+        } else if (filter.tag) {
+            // Tag state - Carolina Navy Blue box with label
+            headerContainer.className = 'tag-header';
+            headerTitle.innerHTML = `<span class="header-label">Tagged Entity</span><span class="header-title">${filter.tag}</span>`;
+            
+            // Set SEO meta for tag pages
+            window.CarolinaPanorama.setPageMeta({
+                title: `Articles tagged: ${filter.tag} | Carolina Panorama`,
+                description: `Explore articles about ${filter.tag} from Carolina Panorama`,
+                keywords: `${filter.tag}, Carolina Panorama, tags, topics`,
+                url: window.location.href,
+                type: 'website'
+            });
+        } else if (filter.author) {
+            // Author state - Carolina Navy Blue box with label
+            let authorName = 'Unknown Author';
+            let authorBio = '';
+            if (authorDetails && authorDetails.name) {
+                authorName = authorDetails.name;
+                authorBio = authorDetails.bio || '';
+            }
+            headerContainer.className = 'author-header';
+            headerTitle.innerHTML = `<span class="header-label">Written by:</span><span class="header-title">${authorName}</span>`;
+            
+            // Set SEO meta for author pages
+            window.CarolinaPanorama.setPageMeta({
+                title: `Articles by ${authorName} | Carolina Panorama`,
+                description: authorBio || `Read articles written by ${authorName} at Carolina Panorama`,
+                keywords: `${authorName}, author, Carolina Panorama, articles`,
+                url: window.location.href,
+                type: 'profile'
+            });
+        } else {
+            // Latest Articles - keep original style
+            headerContainer.className = 'latest-header';
+            headerTitle.textContent = 'Latest Articles';
+            
+            // Set SEO meta for homepage/latest
+            window.CarolinaPanorama.setPageMeta({
+                title: 'Latest Articles | Carolina Panorama',
+                description: 'Browse the latest news and articles from Carolina Panorama',
+                keywords: 'Carolina Panorama, latest news, articles, updates',
+                url: window.location.href,
+                type: 'website'
+            });
+        }
+        
+        headerContainer.style.display = '';
+    }
+
+    // Initial load
+    changePage(1);
+});
+</script>
+</div>
     <?php
     return ob_get_clean();
 }
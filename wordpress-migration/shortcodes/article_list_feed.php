@@ -2,53 +2,253 @@
 /**
  * Shortcode: cp_article_list_feed
  * Widget: Article List Feed
- * Auto-generated from WORDPRESS_MIGRATION_MANIFEST.json
+ * Source: site-assets/site-home-widgets/article-list-feed.html
+ * Auto-generated from WORDPRESS_MIGRATION_MANIFEST.json by GENERATE_SHORTCODES.py
  */
 
 function cp_shortcode_article_list_feed( $atts = [], $content = null, $tag = '' ) {
     // Enqueue dependencies
-    wp_enqueue_script( 'carolina_panorama_global' );
-    wp_enqueue_style( 'shared_article_card_styles' );
+    wp_enqueue_script( 'cp-global-js' );
+    wp_enqueue_style( 'cp-widget-article-list-feed' );
 
     
-    $defaults = [
-        'category' => '',
-        'per_page' => 10,
-        'page' => 1,
-    ];
-    $atts = shortcode_atts( $defaults, $atts, 'cp_article_list_feed' );
-
-    // Pass attributes to JavaScript via data attributes
     $data_attrs = '';
-    if ( ! empty( $atts['category'] ) ) {
-        $data_attrs .= ' data-category="' . esc_attr( $atts['category'] ) . '"';
-    }
-    if ( ! empty( $atts['per_page'] ) ) {
-        $data_attrs .= ' data-per_page="' . esc_attr( $atts['per_page'] ) . '"';
-    }
-    if ( ! empty( $atts['page'] ) ) {
-        $data_attrs .= ' data-page="' . esc_attr( $atts['page'] ) . '"';
-    }
 
     // Return the widget HTML
     ob_start();
     ?>
-    <div class="cp-widget-wrapper cp-widget-article_list_feed" <?php echo $data_attrs; ?>>
-        <div id="cp-article_list_feed-container">
-            <p style="color: #999;">Loading Article List Feed...</p>
+<div class="cp-widget-wrapper cp-widget-article_list_feed"<?php echo $data_attrs; ?>>
+<!-- Article List Feed Widget -->
+<!-- Include shared-article-card-styles.css in your page -->
+<!-- This widget displays articles in a vertical list layout matching the screenshot -->
+
+<div class="article-list-feed-wrapper">
+    <div class="article-list-container" id="article-list-container">
+        <!-- Loading state -->
+        <div class="featured-article-item">
+            <article class="featured-article-card">
+                <div class="featured-image-container" style="background: #f7fafc; display: flex; align-items: center; justify-content: center; color: #9ca3af;">
+                    Loading...
+                </div>
+                <div class="featured-content">
+                    <div class="featured-article-tags">
+                        <span class="featured-article-tag">Loading</span>
+                    </div>
+                    <h2 class="featured-article-title">Loading featured article...</h2>
+                    <div class="featured-article-meta">
+                        <span>Carolina Panorama</span>
+                        <span>Today</span>
+                    </div>
+                    <p class="featured-article-description">Please wait while we load the latest content...</p>
+                </div>
+            </article>
         </div>
     </div>
-    <script>
-        // TODO: Initialize widget with article list
-        // Example: fetch from API using window.CarolinaPanorama utilities
-        (function() {
-            var container = document.getElementById('cp-article_list_feed-container');
-            if (!container) return;
+</div>
+
+<script>
+// Wait for CarolinaPanorama global before running widget logic
+function waitForCarolinaPanorama(callback, timeout = 5000) {
+    const start = Date.now();
+    (function check() {
+        if (window.CarolinaPanorama) {
+            callback();
+        } else if (Date.now() - start < timeout) {
+            setTimeout(check, 30);
+        } else {
+            console.error('CarolinaPanorama global not found.');
+        }
+    })();
+}
+
+waitForCarolinaPanorama(function() {
+    const container = document.getElementById('article-list-container');
+    const CATEGORIES = ['Local News', 'Business', 'Sports', 'Education', 'Culture'];
+    const ARTICLES_PER_CATEGORY = 3;
+    const FEATURED_ARTICLES = 1;
+    const CONDENSED_ARTICLES = 2;
+    const CACHE_KEY = 'article-list-feed';
+    const CACHE_DURATION = 5 * 60 * 1000; // 5 minutes
+    const FETCH_CONCURRENCY = 3; // category requests in flight at once
+    const PERF_WIDGET = 'article-list-feed';
+
+    // Use global CarolinaPanorama helpers
+    const apiBase = window.CarolinaPanorama.API_BASE_URL || 'https://cms.carolinapanorama.org';
+    
+    function formatDate(date) {
+        const options = { month: 'numeric', day: 'numeric', year: 'numeric' };
+        return 'Published on: ' + new Date(date).toLocaleDateString('en-US', options);
+    }
+
+    // Create featured article card HTML with category header
+    async function createFeaturedArticleCard(data, categoryName) {
+        const image = window.CarolinaPanorama.imageHtml(data.image, {
+            alt: data.title,
+            sizes: '(max-width: 768px) 100vw, 450px'
+        });
+        
+        return `
+            <div>
+                <h3 class="featured-section-header">${categoryName}</h3>
+                <div class="featured-article-item">
+                    <a href="${data.url}" class="featured-article-link">
+                        <article class="featured-article-card">
+                            <div class="featured-image-container">
+                                ${image}
+                            </div>
+                            <div class="featured-content">
+                                <h2 class="featured-article-title">${data.title}</h2>
+                                <div class="featured-article-meta">
+                                    <span>${data.author}</span>
+                                    <span>${formatDate(data.date)}</span>
+                                </div>
+                                <p class="featured-article-description">${data.description}</p>
+                            </div>
+                        </article>
+                    </a>
+                </div>
+            </div>
+        `;
+    }
+
+    // Create condensed article card HTML
+    async function createCondensedArticleCard(data, index) {
+        return `
+            <div class="article-list-item">
+                <article class="cp-article-card">
+                    <a href="${data.url}" class="cp-article-card-link">
+                        <div class="article-number">${index + 1}.</div>
+                        <div class="cp-article-content">
+                            <h2 class="cp-article-title" title="${data.title}">${data.title}</h2>
+                            <div class="cp-article-meta">
+                                <span class="cp-article-author">${data.author}</span>
+                                <span class="cp-article-date">${formatDate(data.date)}</span>
+                            </div>
+                        </div>
+                    </a>
+                </article>
+            </div>
+        `;
+    }
+
+    // Fetch articles by category with caching
+    async function fetchCategoryArticles(category) {
+        const url = `${apiBase}/api/public/articles?category=${encodeURIComponent(category)}&per_page=${ARTICLES_PER_CATEGORY}&page=1`;
+        
+        const json = await window.CarolinaPanorama.fetchJSON(url);
+        
+        if (!json.success || !Array.isArray(json.data)) {
+            return [];
+        }
+        
+        const endParse = window.CarolinaPanorama.perfStart(PERF_WIDGET, 'parse');
+        const articles = json.data.map(article => ({
+            url: article.url || (article.slug ? `/article#${encodeURIComponent(article.slug)}` : ''),
+            title: article.title,
+            description: article.excerpt || '',
+            image: article.featured_image,
+            author: article.author && article.author.name ? article.author.name : '',
+            date: article.publish_date,
+            categories: Array.isArray(article.categories) && article.categories.length > 0
+                ? article.categories.map(cat => cat.name)
+                : [category]
+        }));
+        
+        // Filter out articles without valid dates
+        const validArticles = articles.filter(article => article.date);
+        
+        // Sort by most recent publish date
+        validArticles.sort((a, b) => new Date(b.date) - new Date(a.date));
+        endParse();
+        
+        return validArticles;
+    }
+
+    // Fetch all articles through the shared stale-while-revalidate cache
+    async function fetchAllArticles() {
+        const endFetch = window.CarolinaPanorama.perfStart(PERF_WIDGET, 'fetch');
+        try {
+            const feed = await window.CarolinaPanorama.cachedFetch(CACHE_KEY, async () => {
+                console.log('[Article List Feed] Fetching fresh data from API...');
+                const allArticles = {};
+
+                // Fetch categories concurrently (capped) - latency is the slowest request, not the sum
+                const results = await window.CarolinaPanorama.mapWithConcurrency(CATEGORIES, FETCH_CONCURRENCY, async category => {
+                    try {
+                        return await fetchCategoryArticles(category);
+                    } catch (e) {
+                        console.error(`[Article List Feed] Failed to load ${category}:`, e);
+                        return [];
+                    }
+                });
+                CATEGORIES.forEach((category, index) => {
+                    if (results[index].length > 0) {
+                        allArticles[category] = results[index];
+                    }
+                });
+
+                // Nothing loaded: keep whatever is cached rather than caching an empty feed
+                if (Object.keys(allArticles).length === 0) {
+                    throw new Error('No articles loaded');
+                }
+                return allArticles;
+            }, { maxAge: CACHE_DURATION });
+            endFetch();
+            return feed;
+        } catch (e) {
+            endFetch({ ok: false });
+            console.error('[Article List Feed] Failed to load articles:', e);
+            return {};
+        }
+    }
+
+    // Initialize feed
+    async function initializeFeed() {
+        const allArticles = await fetchAllArticles();
+        const endRender = window.CarolinaPanorama.perfStart(PERF_WIDGET, 'render');
+        let html = '';
+        
+        // Build sections from cached or fresh data
+        for (const category of CATEGORIES) {
+            const categoryArticles = allArticles[category];
+            if (!categoryArticles || categoryArticles.length === 0) continue;
+            
+            // Find article with image for featured card
+            const featuredArticle = categoryArticles.find(article => article.image);
+            const condensedArticles = categoryArticles.filter(article => article !== featuredArticle).slice(0, CONDENSED_ARTICLES);
             
-            // Replace this with actual widget initialization logic
-            console.log('Widget article_list_feed initialized');
-        })();
-    </script>
+            // Build section if we have at least the featured article
+            if (featuredArticle) {
+                html += `<div style="margin-bottom: 32px;">`;
+                html += await createFeaturedArticleCard(featuredArticle, category);
+                
+                if (condensedArticles.length > 0) {
+                    html += '<div class="condensed-list-section" style="margin-top: 20px;">';
+                    const condensedCardsHTML = await Promise.all(
+                        condensedArticles.map((data, index) => createCondensedArticleCard(data, index))
+                    );
+                    html += condensedCardsHTML.join('');
+                    html += '</div>';
+                }
+                html += '</div>';
+            }
+        }
+
+        if (!html) {
+            container.innerHTML = '<p style="text-align: center; color: #666;">No articles found.</p>';
+            endRender({ ok: false });
+            return;
+        }
+
+        container.innerHTML = html;
+        endRender();
+    }
+
+    // Initialize on page load
+    initializeFeed();
+});
+</script>
+</div>
     <?php
     return ob_get_clean();
 }
@@ -2,33 +2,93 @@
 /**
  * Shortcode: cp_category_grid
  * Widget: Category Grid
- * Auto-generated from WORDPRESS_MIGRATION_MANIFEST.json
+ * Source: site-assets/site-home-widgets/category-grid-widget.html
+ * Auto-generated from WORDPRESS_MIGRATION_MANIFEST.json by GENERATE_SHORTCODES.py
  */
 
 function cp_shortcode_category_grid( $atts = [], $content = null, $tag = '' ) {
     // Enqueue dependencies
-    wp_enqueue_script( 'carolina_panorama_global' );
+    wp_enqueue_script( 'cp-global-js' );
+    wp_enqueue_style( 'cp-widget-category-grid' );
 
     
+    $data_attrs = '';
+
     // Return the widget HTML
     ob_start();
     ?>
-    <div class="cp-widget-wrapper cp-widget-category_grid">
-        <div id="cp-category_grid-container">
-            <p style="color: #999;">Loading Category Grid...</p>
-        </div>
-    </div>
-    <script>
-        // TODO: Initialize widget with $atts data
-        // Example: fetch from API using window.CarolinaPanorama utilities
-        (function() {
-            var container = document.getElementById('cp-category_grid-container');
-            if (!container) return;
-            
-            // Replace this with actual widget initialization logic
-            console.log('Widget category_grid initialized with:', {});
-        })();
-    </script>
+<div class="cp-widget-wrapper cp-widget-category_grid"<?php echo $data_attrs; ?>>
+<!-- Category Grid Widget -->
+
+<div class="category-grid-widget">
+  <div class="category-grid" id="category-grid-list">
+    <!-- Categories will be loaded here -->
+  </div>
+</div>
+<script>
+function waitForLibrariesAndInitCategoryGrid(callback, timeout = 10000) {
+  const start = Date.now();
+  (function poll() {
+    // Example: wait for window.CarolinaPanorama or any other global
+    if (window.CarolinaPanorama) {
+      callback();
+    } else if (Date.now() - start < timeout) {
+      setTimeout(poll, 30);
+    } else {
+      console.error('Required libraries not found for category grid widget.');
+    }
+  })();
+}
+
+const CATEGORY_GRID_PERF_WIDGET = 'category-grid-widget';
+
+async function fetchCategories() {
+  const apiBase = window.CarolinaPanorama.API_BASE_URL || 'https://cms.carolinapanorama.org';
+  const apiUrl = `${apiBase}/api/public/categories`;
+  try {
+    const response = await window.CarolinaPanorama.timePhase(CATEGORY_GRID_PERF_WIDGET, 'fetch',
+      () => window.CarolinaPanorama.fetchJSON(apiUrl));
+    const endParse = window.CarolinaPanorama.perfStart(CATEGORY_GRID_PERF_WIDGET, 'parse');
+    if (!response.success) {
+      endParse({ ok: false });
+      console.error('Failed to fetch categories:', response.error);
+      return [];
+    }
+    // Map to the format expected by renderCategoryGrid
+    const categories = response.data.map(cat => ({
+      urlSlug: cat.name.toLowerCase().replace(/\s+/g, '-').replace(/[^a-z0-9-]/g, ''),
+      label: cat.name
+    }));
+    endParse();
+    return categories;
+  } catch (e) {
+    console.error('Failed to fetch categories:', e);
+    return [];
+  }
+}
+
+function renderCategoryGrid(categories) {
+  const grid = document.getElementById('category-grid-list');
+  if (!grid) return;
+  const endRender = window.CarolinaPanorama.perfStart(CATEGORY_GRID_PERF_WIDGET, 'render');
+  grid.innerHTML = '';
+  categories.forEach(cat => {
+    const a = document.createElement('a');
+    a.className = 'category-grid-item';
+    a.href = `https://carolinapanorama.com/article-feed/category/${cat.urlSlug}`;
+    a.textContent = cat.label;
+    a.setAttribute('tabindex', '0');
+    grid.appendChild(a);
+  });
+  endRender();
+}
+
+waitForLibrariesAndInitCategoryGrid(async function() {
+  const categories = await fetchCategories();
+  renderCategoryGrid(categories);
+});
+</script>
+</div>
     <?php
     return ob_get_clean();
 }
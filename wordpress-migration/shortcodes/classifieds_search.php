@@ -2,34 +2,185 @@
 /**
  * Shortcode: cp_classifieds_search
  * Widget: Classifieds Search
- * Auto-generated from WORDPRESS_MIGRATION_MANIFEST.json
+ * Source: site-assets/search-assets/classifieds-search.html
+ * Auto-generated from WORDPRESS_MIGRATION_MANIFEST.json by GENERATE_SHORTCODES.py
  */
 
 function cp_shortcode_classifieds_search( $atts = [], $content = null, $tag = '' ) {
     // Enqueue dependencies
-    wp_enqueue_script( 'instantsearch' );
-    wp_enqueue_style( 'instantsearch' );
+    wp_enqueue_style( 'cp-widget-classifieds-search' );
 
     
+    $data_attrs = '';
+
     // Return the widget HTML
     ob_start();
     ?>
-    <div class="cp-widget-wrapper cp-widget-classifieds_search">
-        <div id="cp-classifieds_search-container">
-            <p style="color: #999;">Loading Classifieds Search...</p>
+<div class="cp-widget-wrapper cp-widget-classifieds_search"<?php echo $data_attrs; ?>>
+<meta name="viewport" content="width=device-width, initial-scale=1.0, user-scalable=yes">
+<?php wp_print_styles( 'algolia-instantsearch-css' ); ?>
+<link rel="preconnect" href="https://fonts.googleapis.com">
+<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+<link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap" rel="stylesheet">
+
+<div class="classifieds-search-widget">
+<div class="search-container">
+    <div class="search-header">
+        <p>Find what you're looking for in our local classified ads</p>
+    </div>
+
+    <div id="searchbox" class="search-box"></div>
+
+    <div class="search-filters">
+        <aside class="search-sidebar">
+            <h3>Filter by Category</h3>
+            <div id="category-filter"></div>
+        </aside>
+
+        <div class="search-results">
+            <div id="stats"></div>
+            <div id="hits"></div>
+            <div id="pagination"></div>
         </div>
     </div>
-    <script>
-        // TODO: Initialize widget with classifieds search
-        // Example: fetch from API using window.CarolinaPanorama utilities
-        (function() {
-            var container = document.getElementById('cp-classifieds_search-container');
-            if (!container) return;
-            
-            // Replace this with actual widget initialization logic
-            console.log('Widget classifieds_search initialized');
-        })();
-    </script>
+</div>
+</div>
+
+<?php wp_print_scripts( 'algoliasearch-lite-js' ); ?>
+<?php wp_print_scripts( 'instantsearch-js' ); ?>
+
+<script>
+(function() {
+    'use strict';
+    
+    // Wait for both DOM and scripts to load
+    function initializeSearch() {
+        if (typeof algoliasearch === 'undefined' || typeof instantsearch === 'undefined') {
+            console.log('Waiting for Algolia libraries to load...');
+            setTimeout(initializeSearch, 100);
+            return;
+        }
+        
+        console.log('Initializing classifieds search...');
+        
+        // Use public Algolia Index and Search API Key - update with your classifieds index
+        const searchClient = algoliasearch('L5HJO2NLX1', '303488aa839f0fc1c6c0467ae84a0354');
+
+    // Check URL for query parameter
+    const urlParams = new URLSearchParams(window.location.search);
+    const queryParam = urlParams.get('q') || urlParams.get('query') || '';
+
+    const search = instantsearch({
+        indexName: 'prod_CarolinaPanorama_Classifieds', // Update with your classifieds index name
+        searchClient,
+        routing: true,
+        initialUiState: {
+            prod_CarolinaPanorama_Classifieds: {
+                query: queryParam,
+            },
+        },
+    });
+
+    // Search box
+    search.addWidgets([
+        instantsearch.widgets.searchBox({
+            container: '#searchbox',
+            placeholder: 'Search classifieds...',
+            showSubmit: false,
+            showReset: true,
+        })
+    ]);
+
+    // Stats
+    search.addWidgets([
+        instantsearch.widgets.stats({
+            container: '#stats',
+            templates: {
+                text(data, { html }) {
+                    let resultText = '';
+                    if (data.nbHits === 0) {
+                        resultText = 'No results';
+                    } else if (data.nbHits === 1) {
+                        resultText = '1 result';
+                    } else {
+                        resultText = `${data.nbHits.toLocaleString()} results`;
+                    }
+                    return html`<span>${resultText} found in ${data.processingTimeMS}ms</span>`;
+                }
+            }
+        })
+    ]);
+
+    // Category filter
+    search.addWidgets([
+        instantsearch.widgets.refinementList({
+            container: '#category-filter',
+            attribute: 'category',
+            limit: 10,
+            showMore: true,
+        })
+    ]);
+
+    // Results with priority-based sorting
+    search.addWidgets([
+        instantsearch.widgets.hits({
+            container: '#hits',
+            templates: {
+                item: (hit, { html, components }) => {
+                    return html`
+                        <div class="search-result-card">
+                            <div class="search-result-content">
+                                <h2 class="search-result-title">
+                                    ${components.Highlight({ attribute: 'title', hit })}
+                                </h2>
+                                <div class="search-result-meta">
+                                    ${hit.category ? html`<span>${hit.category}</span>` : ''}
+                                </div>
+                                <p class="search-result-excerpt">
+                                    ${components.Highlight({ attribute: 'description', hit })}
+                                </p>
+                            </div>
+                        </div>
+                    `;
+                },
+                empty: 'No classifieds found for <q>{{query}}</q>'
+            },
+            transformItems(items) {
+                // Sort by priority (higher priority first)
+                return items.sort((a, b) => {
+                    const priorityA = a.priority || 0;
+                    const priorityB = b.priority || 0;
+                    return priorityB - priorityA;
+                });
+            }
+        })
+    ]);
+
+    // Pagination
+    search.addWidgets([
+        instantsearch.widgets.pagination({
+            container: '#pagination',
+            padding: 2,
+        })
+    ]);
+
+    // Time from start() to the first rendered results (Algolia request included), reported
+    // through carolina-panorama-global.js telemetry when the global script is on the page
+    const perfStart = (window.CarolinaPanorama && window.CarolinaPanorama.perfStart) || (() => () => {});
+    const endFirstRender = perfStart('classifieds-search', 'render');
+    search.once('render', () => endFirstRender());
+    search.start();
+    }
+    
+    // Start initialization when DOM is ready
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', initializeSearch);
+    } else {
+        initializeSearch();
+    }
+})();
+</script>
+</div>
     <?php
     return ob_get_clean();
 }
@@ -2,34 +2,112 @@
 /**
  * Shortcode: cp_classifieds_sidebar
  * Widget: Classifieds Search Sidebar
- * Auto-generated from WORDPRESS_MIGRATION_MANIFEST.json
+ * Source: site-assets/search-assets/classifieds-sidebar-widget.html
+ * Auto-generated from WORDPRESS_MIGRATION_MANIFEST.json by GENERATE_SHORTCODES.py
  */
 
 function cp_shortcode_classifieds_sidebar( $atts = [], $content = null, $tag = '' ) {
     // Enqueue dependencies
-    wp_enqueue_script( 'instantsearch' );
-    wp_enqueue_style( 'instantsearch' );
+    wp_enqueue_style( 'cp-widget-classifieds-sidebar' );
 
     
+    $data_attrs = '';
+
     // Return the widget HTML
     ob_start();
     ?>
-    <div class="cp-widget-wrapper cp-widget-classifieds_sidebar">
-        <div id="cp-classifieds_sidebar-container">
-            <p style="color: #999;">Loading Classifieds Sidebar...</p>
-        </div>
-    </div>
-    <script>
-        // TODO: Initialize widget with classifieds sidebar
-        // Example: fetch from API using window.CarolinaPanorama utilities
-        (function() {
-            var container = document.getElementById('cp-classifieds_sidebar-container');
-            if (!container) return;
+<div class="cp-widget-wrapper cp-widget-classifieds_sidebar"<?php echo $data_attrs; ?>>
+<meta name="viewport" content="width=device-width, initial-scale=1.0, user-scalable=yes">
+<?php wp_print_styles( 'algolia-instantsearch-css' ); ?>
+
+<div class="classifieds-sidebar-widget">
+    <div class="sidebar-header">Top Classifieds</div>
+    <div id="sidebar-items" class="sidebar-items"></div>
+</div>
+
+<?php wp_print_scripts( 'algoliasearch-lite-js' ); ?>
+
+<script>
+(function() {
+    'use strict';
+    
+    function initializeSidebar() {
+        if (typeof algoliasearch === 'undefined') {
+            console.log('Waiting for Algolia library to load...');
+            setTimeout(initializeSidebar, 100);
+            return;
+        }
+        
+        console.log('Initializing classifieds sidebar...');
+        
+        const searchClient = algoliasearch('L5HJO2NLX1', '303488aa839f0fc1c6c0467ae84a0354');
+        
+        const client = searchClient;
+        const indexName = 'prod_CarolinaPanorama_Classifieds';
+        
+        // Phase timing through carolina-panorama-global.js telemetry, when the global script is on the page
+        const perfStart = (window.CarolinaPanorama && window.CarolinaPanorama.perfStart) || (() => () => {});
+        const endFetch = perfStart('classifieds-sidebar-widget', 'fetch');
+        
+        // Search for all classifieds, limited to top results
+        client.search([
+            {
+                indexName: indexName,
+                query: '',
+                params: {
+                    hitsPerPage: 8,
+                    distinct: true,
+                    attributesToRetrieve: ['title', 'category', 'priority'],
+                }
+            }
+        ]).then(({ results }) => {
+            endFetch();
+            const endRender = perfStart('classifieds-sidebar-widget', 'render');
+            const hits = results[0].hits;
+            const container = document.getElementById('sidebar-items');
+            
+            // Sort by priority (highest first)
+            const sorted = hits.sort((a, b) => {
+                const priorityA = a.priority || 0;
+                const priorityB = b.priority || 0;
+                return priorityB - priorityA;
+            });
             
-            // Replace this with actual widget initialization logic
-            console.log('Widget classifieds_sidebar initialized');
-        })();
-    </script>
+            if (sorted.length === 0) {
+                container.innerHTML = '<div class="sidebar-empty">No classifieds available</div>';
+                endRender();
+                return;
+            }
+            
+            // Display top results
+            container.innerHTML = sorted.map(hit => `
+                <div class="sidebar-item">
+                    <div class="sidebar-item-title">
+                        ${hit.title || 'Untitled'}
+                        ${hit.priority ? `<span class="priority-badge">P${hit.priority}</span>` : ''}
+                    </div>
+                    <div class="sidebar-item-category">
+                        ${hit.category || 'Uncategorized'}
+                    </div>
+                </div>
+            `).join('');
+            endRender();
+        }).catch(err => {
+            endFetch({ ok: false });
+            console.error('Error fetching classifieds:', err);
+            document.getElementById('sidebar-items').innerHTML = '<div class="sidebar-empty">Unable to load classifieds</div>';
+        });
+    }
+    
+    // Start initialization when DOM is ready
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', initializeSidebar);
+    } else {
+        initializeSidebar();
+    }
+})();
+</script>
+</div>
     <?php
     return ob_get_clean();
 }
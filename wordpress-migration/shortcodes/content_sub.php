@@ -0,0 +1,86 @@
+<?php
+/**
+ * Shortcode: cp_content_sub
+ * Widget: Content Subscription Form (Quill Editor)
+ * Source: site-assets/form-widgets/content-sub.html
+ * Auto-generated from WORDPRESS_MIGRATION_MANIFEST.json by GENERATE_SHORTCODES.py
+ */
+
+function cp_shortcode_content_sub( $atts = [], $content = null, $tag = '' ) {
+    // Enqueue dependencies
+    wp_enqueue_style( 'cp-widget-content-sub' );
+
+    
+    $data_attrs = '';
+
+    // Return the widget HTML
+    ob_start();
+    ?>
+<div class="cp-widget-wrapper cp-widget-content_sub"<?php echo $data_attrs; ?>>
+<div id="widget-container">
+    <div id="editor"></div>
+</div>
+
+<?php wp_print_styles( 'quill-snow-css' ); ?>
+<?php wp_print_scripts( 'quill-js' ); ?>
+
+<script>
+    const MAX_IMAGES = 3; // Set the maximum number of images
+    let imageCount = 0; // This will track the current number of images
+
+    const quill = new Quill('#editor', {
+        theme: 'snow',
+        modules: {
+            toolbar: [
+                ['bold', 'italic', 'underline'], 
+                ['link', 'image']
+            ]
+        }
+    });
+
+    // Intercept image uploads
+    quill.getModule('toolbar').addHandler('image', function() {
+        if (imageCount >= MAX_IMAGES) {
+            alert('You can only insert a maximum of ' + MAX_IMAGES + ' images.');
+            return; // Stop execution if max images have been reached
+        }
+        
+        const range = quill.getSelection();
+        const fileInput = document.createElement('input');
+        fileInput.setAttribute('type', 'file');
+        fileInput.setAttribute('accept', 'image/*');
+        
+        fileInput.onchange = function() {
+            const file = fileInput.files[0];
+            if (file && file.size <= 2 * 1024 * 1024) { // 2 MB limit
+                const reader = new FileReader();
+                reader.onload = function(e) {
+                    const img = e.target.result;
+                    quill.insertEmbed(range.index, 'image', img);
+                    imageCount++; // Increment the image counter
+                };
+                reader.readAsDataURL(file);
+            } else {
+                alert('Image size exceeds 2 MB limit.');
+            }
+        };
+        fileInput.click();
+    });
+
+    const destinationElement = document.querySelector('textarea[data-q="submission-content"]');
+    
+    // Add an event listener for the input event
+    quill.on('text-change', function() {
+        // Copy value from source to destination
+        console.log("tpying content to hidden input");
+        const letterContent = quill.root.innerHTML;
+        destinationElement.value = letterContent;
+    });
+</script>
+</div>
+    <?php
+    return ob_get_clean();
+}
+
+// Register shortcode
+add_shortcode( 'cp_content_sub', 'cp_shortcode_content_sub' );
@@ -4,6 +4,19 @@
  * Auto-generated enqueue code for global assets and shortcodes
  */
 
+// Content hash of the global JS (telemetry version tag), recomputed only when the file changes
+function cp_global_js_version() {
+    $path   = get_template_directory() . '/js/carolina-panorama-global.js';
+    $mtime  = (int) @filemtime( $path );
+    $cached = get_transient( 'cp_global_js_version' );
+    if ( is_array( $cached ) && $cached['mtime'] === $mtime ) {
+        return $cached['hash'];
+    }
+    $hash = $mtime ? substr( md5_file( $path ), 0, 12 ) : '';
+    set_transient( 'cp_global_js_version', [ 'mtime' => $mtime, 'hash' => $hash ] );
+    return $hash;
+}
+
 // Enqueue global assets
 function cp_enqueue_global_assets() {
     // Global CSS
@@ -26,6 +39,9 @@ function cp_enqueue_global_assets() {
     // Optional: Set global API base URL (can override in child theme or settings)
     wp_localize_script( 'cp-global-js', 'CarolinaPanoramaConfig', [
         'apiBaseUrl' => get_option( 'cp_api_base_url', 'https://cms.carolinapanorama.org' ),
+        'homepageApiUrl' => is_front_page() ? get_option( 'cp_homepage_api_url', '' ) : '',
+        'telemetryUrl' => get_option( 'cp_telemetry_url', '' ),
+        'assetVersion' => cp_global_js_version(),
         'siteUrl' => site_url(),
     ]);
 }
@@ -41,44 +57,82 @@ function cp_enqueue_article_card_styles() {
     );
 }
 
-// External libraries (Algolia, YouTube, etc.)
-function cp_enqueue_external_libs() {
-    // Algolia InstantSearch CSS
-    wp_enqueue_style(
-        'algolia-instantsearch-css',
-        'https://cdn.jsdelivr.net/npm/instantsearch.css@7.4.5/themes/satellite-min.css',
-        [],
-        '7.4.5'
-    );
+// External libraries (Algolia, Quill): registered everywhere, loaded only by the shortcodes using them
+function cp_register_external_libs() {
+    wp_register_style( 'algolia-instantsearch-css', 'https://cdn.jsdelivr.net/npm/instantsearch.css@7.4.5/themes/satellite-min.css', [], '7.4.5' );
+    wp_register_script( 'algoliasearch-lite-js', 'https://cdn.jsdelivr.net/npm/algoliasearch@4.14.2/dist/algoliasearch-lite.umd.js', [], '4.14.2', [ 'in_footer' => true, 'strategy' => 'defer' ] );
+    wp_register_script( 'instantsearch-js', 'https://cdn.jsdelivr.net/npm/instantsearch.js@4.49.1/dist/instantsearch.production.min.js', [ 'algoliasearch-lite-js' ], '4.49.1', [ 'in_footer' => true, 'strategy' => 'defer' ] );
+    wp_register_style( 'quill-snow-css', 'https://cdn.quilljs.com/1.3.6/quill.snow.css', [], '1.3.6' );
+    wp_register_script( 'quill-js', 'https://cdn.quilljs.com/1.3.6/quill.min.js', [], '1.3.6', [ 'in_footer' => true ] );
+}
+add_action( 'wp_enqueue_scripts', 'cp_register_external_libs', 5 );
 
-    // Algolia InstantSearch JS
-    wp_enqueue_script(
-        'instantsearch-js',
-        'https://cdn.jsdelivr.net/npm/instantsearch.js@4.33.0/umd/index.umd.production.min.js',
-        [],
-        '4.33.0',
-        true
-    );
+// Widget stylesheets extracted from site-assets by GENERATE_SHORTCODES.py
+function cp_register_widget_styles() {
+    $theme_uri = get_template_directory_uri();
+    wp_register_style( 'cp-widgets-shared', $theme_uri . '/css/cp-widgets-shared.css', [], 'b99ba89ca6f1' );
+    wp_register_style( 'cp-widget-article-detail', $theme_uri . '/css/widgets/article_detail.css', [], 'd59f811ea62d' );
+    wp_register_style( 'cp-widget-article-feed', $theme_uri . '/css/widgets/article_feed.css', [ 'cp-widgets-shared' ], '2291352cc3ca' );
+    wp_register_style( 'cp-widget-headlines-grid', $theme_uri . '/css/widgets/headlines_grid.css', [], '45efe5b419c7' );
+    wp_register_style( 'cp-widget-category-grid', $theme_uri . '/css/widgets/category_grid.css', [], '0b0b0b745786' );
+    wp_register_style( 'cp-widget-trending-carousel', $theme_uri . '/css/widgets/trending_carousel.css', [], '43bf4ca10107' );
+    wp_register_style( 'cp-widget-article-list-feed', $theme_uri . '/css/widgets/article_list_feed.css', [ 'cp-widgets-shared' ], 'a1170c287f7f' );
+    wp_register_style( 'cp-widget-file-list-preview', $theme_uri . '/css/widgets/file_list_preview.css', [], 'be162a47de4f' );
+    wp_register_style( 'cp-widget-classifieds-sidebar', $theme_uri . '/css/widgets/classifieds_sidebar.css', [], '0cf5a2fe1d2b' );
+    wp_register_style( 'cp-widget-classifieds-search', $theme_uri . '/css/widgets/classifieds_search.css', [ 'cp-widgets-shared' ], '1eb74bb72e9c' );
+    wp_register_style( 'cp-widget-nav-search', $theme_uri . '/css/widgets/nav_search.css', [], '3ebab984979a' );
+    wp_register_style( 'cp-widget-youtube-channel', $theme_uri . '/css/widgets/youtube_channel.css', [], '2d3d6bf59ef6' );
+    wp_register_style( 'cp-widget-youtube-playlist-carousel', $theme_uri . '/css/widgets/youtube_playlist_carousel.css', [], '4568194b8517' );
+    wp_register_style( 'cp-widget-content-sub', $theme_uri . '/css/widgets/content_sub.css', [], 'b7581bb8402f' );
+}
+add_action( 'wp_enqueue_scripts', 'cp_register_widget_styles', 5 );
 
-    // Quill Rich Text Editor (for forms)
-    wp_enqueue_style(
-        'quill-snow-css',
-        'https://cdn.quilljs.com/1.3.6/quill.snow.css',
-        [],
-        '1.3.6'
-    );
+// Enqueue widget styles in <head> when the current post uses their shortcode
+function cp_enqueue_shortcode_styles() {
+    $post = get_post();
+    if ( ! is_singular() || ! $post ) {
+        return;
+    }
 
-    wp_enqueue_script(
-        'quill-js',
-        'https://cdn.quilljs.com/1.3.6/quill.min.js',
-        [],
-        '1.3.6',
-        true
-    );
+    $shortcode_styles = [
+        'cp_article_detail' => [ 'cp-widget-article-detail' ],
+        'cp_article_feed' => [ 'cp-widget-article-feed' ],
+        'cp_headlines_grid' => [ 'cp-widget-headlines-grid' ],
+        'cp_category_grid' => [ 'cp-widget-category-grid' ],
+        'cp_trending_carousel' => [ 'cp-widget-trending-carousel' ],
+        'cp_article_list_feed' => [ 'cp-widget-article-list-feed' ],
+        'cp_file_list_preview' => [ 'cp-widget-file-list-preview' ],
+        'cp_search' => [ 'cp-widgets-shared', 'algolia-instantsearch-css' ],
+        'cp_article_search' => [ 'cp-widgets-shared', 'algolia-instantsearch-css' ],
+        'cp_classifieds_sidebar' => [ 'cp-widget-classifieds-sidebar', 'algolia-instantsearch-css' ],
+        'cp_classifieds_search' => [ 'cp-widget-classifieds-search', 'algolia-instantsearch-css' ],
+        'cp_nav_search' => [ 'cp-widget-nav-search' ],
+        'cp_youtube_channel' => [ 'cp-widget-youtube-channel' ],
+        'cp_youtube_playlist_carousel' => [ 'cp-widget-youtube-playlist-carousel' ],
+        'cp_content_sub' => [ 'cp-widget-content-sub', 'quill-snow-css' ],
+    ];
+    foreach ( $shortcode_styles as $shortcode => $handles ) {
+        if ( has_shortcode( $post->post_content, $shortcode ) ) {
+            array_map( 'wp_enqueue_style', $handles );
+        }
+    }
 }
-add_action( 'wp_enqueue_scripts', 'cp_enqueue_external_libs' );
+add_action( 'wp_enqueue_scripts', 'cp_enqueue_shortcode_styles', 20 );
 
-// TODO: Include shortcode handlers
-// require_once get_template_directory() . '/inc/shortcodes/article-detail.php';
-// require_once get_template_directory() . '/inc/shortcodes/article-feed.php';
-// ... (add all shortcodes)
+// Include shortcode handlers
+require_once get_template_directory() . '/inc/shortcodes/article_detail.php';
+require_once get_template_directory() . '/inc/shortcodes/article_feed.php';
+require_once get_template_directory() . '/inc/shortcodes/headlines_grid.php';
+require_once get_template_directory() . '/inc/shortcodes/category_grid.php';
+require_once get_template_directory() . '/inc/shortcodes/trending_carousel.php';
+require_once get_template_directory() . '/inc/shortcodes/article_list_feed.php';
+require_once get_template_directory() . '/inc/shortcodes/file_list_preview.php';
+require_once get_template_directory() . '/inc/shortcodes/search.php';
+require_once get_template_directory() . '/inc/shortcodes/article_search.php';
+require_once get_template_directory() . '/inc/shortcodes/classifieds_sidebar.php';
+require_once get_template_directory() . '/inc/shortcodes/classifieds_search.php';
+require_once get_template_directory() . '/inc/shortcodes/nav_search.php';
+require_once get_template_directory() . '/inc/shortcodes/youtube_channel.php';
+require_once get_template_directory() . '/inc/shortcodes/youtube_playlist_carousel.php';
+require_once get_template_directory() . '/inc/shortcodes/newsletter_category.php';
+require_once get_template_directory() . '/inc/shortcodes/content_sub.php';
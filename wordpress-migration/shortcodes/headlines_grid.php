@@ -2,34 +2,274 @@
 /**
  * Shortcode: cp_headlines_grid
  * Widget: Headlines Grid
- * Auto-generated from WORDPRESS_MIGRATION_MANIFEST.json
+ * Source: site-assets/site-home-widgets/headlines-grid-v2.html
+ * Auto-generated from WORDPRESS_MIGRATION_MANIFEST.json by GENERATE_SHORTCODES.py
  */
 
 function cp_shortcode_headlines_grid( $atts = [], $content = null, $tag = '' ) {
     // Enqueue dependencies
-    wp_enqueue_script( 'carolina_panorama_global' );
-    wp_enqueue_style( 'shared_article_card_styles' );
+    wp_enqueue_script( 'cp-global-js' );
+    wp_enqueue_style( 'cp-article-card-styles' );
+    wp_enqueue_style( 'cp-widget-headlines-grid' );
 
     
+    $data_attrs = '';
+
     // Return the widget HTML
     ob_start();
     ?>
-    <div class="cp-widget-wrapper cp-widget-headlines_grid">
-        <div id="cp-headlines_grid-container">
-            <p style="color: #999;">Loading Headlines Grid...</p>
+<div class="cp-widget-wrapper cp-widget-headlines_grid"<?php echo $data_attrs; ?>>
+<!-- Headlines Grid Widget - Displays 5 articles with featured layout -->
+<!-- Include shared-article-card-styles.css in your page -->
+
+<div class="headlines-section-wrapper">
+    <div class="headlines-section-header">
+        <h2 class="headlines-section-title">Top Headlines</h2>
+    </div>
+
+    <div class="headlines-grid">
+        <!-- Featured article (center) - index 0 -->
+        <div class="headlines-center">
+            <span class="featured-badge">Featured</span>
+            <article class="cp-article-card cp-article-card-featured">
+                <a href="#" class="cp-article-card-link" data-article-index="0">
+                    <img src="https://storage.googleapis.com/msgsndr/9Iv8kFcMiUgScXzMPv23/media/697bd8644d56831c95c3248d.svg" alt="Article" class="cp-article-image" fetchpriority="high" loading="eager">
+                    <div class="cp-article-content">
+                        <div class="cp-article-tags">
+                            <span class="cp-article-tag">Loading</span>
+                        </div>
+                        <h2 class="cp-article-title">Loading article...</h2>
+                        <div class="cp-article-meta">
+                            <span class="cp-article-author">Carolina Panorama</span>
+                            <span class="cp-article-date">Today</span>
+                        </div>
+                        <p class="cp-article-description">Please wait while we load the content...</p>
+                    </div>
+                </a>
+            </article>
+        </div>
+
+        <!-- Side articles - indices 1-4 -->
+        <div class="headlines-left-top">
+            <article class="cp-article-card cp-article-card-small">
+                <a href="#" class="cp-article-card-link" data-article-index="1">
+                    <img src="https://storage.googleapis.com/msgsndr/9Iv8kFcMiUgScXzMPv23/media/697bd8644d56831c95c3248d.svg" alt="Article" class="cp-article-image" loading="lazy">
+                    <div class="cp-article-content">
+                        <div class="cp-article-tags">
+                            <span class="cp-article-tag">Loading</span>
+                        </div>
+                        <h3 class="cp-article-title">Loading...</h3>
+                        <div class="cp-article-meta">
+                            <span class="cp-article-author">Carolina Panorama</span>
+                            <span class="cp-article-date">Today</span>
+                        </div>
+                    </div>
+                </a>
+            </article>
+        </div>
+
+        <div class="headlines-left-bottom">
+            <article class="cp-article-card cp-article-card-small">
+                <a href="#" class="cp-article-card-link" data-article-index="2">
+                    <img src="https://storage.googleapis.com/msgsndr/9Iv8kFcMiUgScXzMPv23/media/697bd8644d56831c95c3248d.svg" alt="Article" class="cp-article-image" loading="lazy">
+                    <div class="cp-article-content">
+                        <div class="cp-article-tags">
+                            <span class="cp-article-tag">Loading</span>
+                        </div>
+                        <h3 class="cp-article-title">Loading...</h3>
+                        <div class="cp-article-meta">
+                            <span class="cp-article-author">Carolina Panorama</span>
+                            <span class="cp-article-date">Today</span>
+                        </div>
+                    </div>
+                </a>
+            </article>
+        </div>
+
+        <div class="headlines-right-top">
+            <article class="cp-article-card cp-article-card-small">
+                <a href="#" class="cp-article-card-link" data-article-index="3">
+                    <img src="https://storage.googleapis.com/msgsndr/9Iv8kFcMiUgScXzMPv23/media/697bd8644d56831c95c3248d.svg" alt="Article" class="cp-article-image" loading="lazy">
+                    <div class="cp-article-content">
+                        <div class="cp-article-tags">
+                            <span class="cp-article-tag">Loading</span>
+                        </div>
+                        <h3 class="cp-article-title">Loading...</h3>
+                        <div class="cp-article-meta">
+                            <span class="cp-article-author">Carolina Panorama</span>
+                            <span class="cp-article-date">Today</span>
+                        </div>
+                    </div>
+                </a>
+            </article>
+        </div>
+
+        <div class="headlines-right-bottom">
+            <article class="cp-article-card cp-article-card-small">
+                <a href="#" class="cp-article-card-link" data-article-index="4">
+                    <img src="https://storage.googleapis.com/msgsndr/9Iv8kFcMiUgScXzMPv23/media/697bd8644d56831c95c3248d.svg" alt="Article" class="cp-article-image" loading="lazy">
+                    <div class="cp-article-content">
+                        <div class="cp-article-tags">
+                            <span class="cp-article-tag">Loading</span>
+                        </div>
+                        <h3 class="cp-article-title">Loading...</h3>
+                        <div class="cp-article-meta">
+                            <span class="cp-article-author">Carolina Panorama</span>
+                            <span class="cp-article-date">Today</span>
+                        </div>
+                    </div>
+                </a>
+            </article>
         </div>
     </div>
+</div>
+
     <script>
-        // TODO: Initialize widget with $atts data
-        // Example: fetch from API using window.CarolinaPanorama utilities
-        (function() {
-            var container = document.getElementById('cp-headlines_grid-container');
-            if (!container) return;
-            
-            // Replace this with actual widget initialization logic
-            console.log('Widget headlines_grid initialized with:', {});
+    // Wait for CarolinaPanorama global before running widget logic
+    function waitForCarolinaPanorama(callback, timeout = 5000) {
+        const start = Date.now();
+        (function check() {
+            if (window.CarolinaPanorama) {
+                callback();
+            } else if (Date.now() - start < timeout) {
+                setTimeout(check, 30);
+            } else {
+                console.error('CarolinaPanorama global not found.');
+            }
         })();
-    </script>
+    }
+
+    waitForCarolinaPanorama(function() {
+        const apiBase = window.CarolinaPanorama.API_BASE_URL || 'https://cms.carolinapanorama.org';
+        const PERF_WIDGET = 'headlines-grid-v2';
+
+        // Rendered image widths per breakpoint (see the grid media queries above)
+        const FEATURED_IMAGE_SIZES = '(max-width: 1024px) 100vw, 700px';
+        const SMALL_IMAGE_SIZES = '(max-width: 640px) 100vw, (max-width: 1024px) 50vw, 350px';
+        
+        function formatDate(dateStr) {
+            if (!dateStr) return '';
+            try {
+                const options = { month: 'short', day: 'numeric', year: 'numeric' };
+                return new Date(dateStr).toLocaleDateString('en-US', options);
+            } catch (e) {
+                return dateStr;
+            }
+        }
+
+        // Update a single article card
+        function updateArticleCard(linkElement, article) {
+            linkElement.href = article.url;
+
+            // The global error-handler may have replaced <img class="cp-article-image">
+            // with a <div class="img-placeholder"> before this code runs.
+            // Recover by swapping the placeholder back for a fresh <img>.
+            let image = linkElement.querySelector('.cp-article-image');
+            if (!image) {
+                const placeholder = linkElement.querySelector('.img-placeholder');
+                if (placeholder) {
+                    image = document.createElement('img');
+                    image.className = 'cp-article-image';
+                    placeholder.replaceWith(image);
+                }
+            }
+
+            // Responsive image; the featured card (index 0) is the LCP candidate
+            const featured = linkElement.dataset.articleIndex === '0';
+
+            if (image) {
+                image.classList.add('is-loading');
+                image.addEventListener('load', () => {
+                    image.classList.remove('is-loading');
+                }, { once: true });
+                image.alt = article.featured_image_alt || article.title;
+                window.CarolinaPanorama.applyImage(image, article.featured_image, {
+                    sizes: featured ? FEATURED_IMAGE_SIZES : SMALL_IMAGE_SIZES,
+                    priority: featured
+                });
+            }
+            
+            const tagsContainer = linkElement.querySelector('.cp-article-tags');
+            if (article.categories && article.categories.length) {
+                tagsContainer.innerHTML = article.categories.slice(0, 2)
+                    .map(cat => window.CarolinaPanorama.categoryTagHtml(cat.name || cat))
+                    .join('');
+            }
+            
+            const title = linkElement.querySelector('.cp-article-title');
+            title.textContent = article.title;
+            
+            const meta = linkElement.querySelector('.cp-article-meta');
+            let authorSpan = meta.querySelector('.cp-article-author');
+            const dateSpan = meta.querySelector('.cp-article-date');
+            
+            if (!authorSpan && dateSpan) {
+                authorSpan = document.createElement('span');
+                authorSpan.className = 'cp-article-author';
+                meta.insertBefore(authorSpan, dateSpan);
+            }
+            if (authorSpan) {
+                const authorName = article.author?.name || 'Carolina Panorama';
+                authorSpan.textContent = authorName;
+            }
+            if (dateSpan) {
+                dateSpan.textContent = formatDate(article.publish_date);
+            }
+            
+            const description = linkElement.querySelector('.cp-article-description');
+            if (description && article.excerpt) {
+                description.textContent = article.excerpt;
+            }
+        }
+
+        // Fetch and initialize all articles from new headlines API
+        async function initializeGrid() {
+            // Cards already rendered server-side (WordPress SSR shortcode) - nothing to fetch
+            const grid = document.querySelector('.headlines-grid');
+            if (grid && grid.closest('[data-cp-ssr]')) {
+                console.log('[Headlines Grid] Using server-rendered articles');
+                return;
+            }
+
+            try {
+                const url = `${apiBase}/api/public/headlines`;
+                console.log('[Headlines Grid] Fetching from:', url);
+                
+                // Categories load alongside the articles, so every card's tags render synchronously
+                const [json] = await window.CarolinaPanorama.timePhase(PERF_WIDGET, 'fetch', () => Promise.all([
+                    window.CarolinaPanorama.fetchJSON(url),
+                    window.CarolinaPanorama.fetchCategories()
+                ]));
+                
+                const endParse = window.CarolinaPanorama.perfStart(PERF_WIDGET, 'parse');
+                if (!json.success || !json.data || json.data.length === 0) {
+                    endParse({ ok: false });
+                    console.error('[Headlines Grid] No articles returned from API');
+                    return;
+                }
+                
+                const articles = json.data;
+                const edition = json.edition;
+                endParse();
+                console.log(`[Headlines Grid] Loaded ${articles.length} articles from edition: ${edition || 'N/A'}`);
+                
+                const endRender = window.CarolinaPanorama.perfStart(PERF_WIDGET, 'render');
+                const articleLinks = document.querySelectorAll('.cp-article-card-link');
+                for (let index = 0; index < articleLinks.length; index++) {
+                    if (articles[index]) {
+                        updateArticleCard(articleLinks[index], articles[index]);
+                    }
+                }
+                endRender();
+            } catch (e) {
+                console.error('[Headlines Grid] Failed to load articles:', e);
+            }
+        }
+
+        initializeGrid();
+    });
+</script>
+</div>
     <?php
     return ob_get_clean();
 }
@@ -2,34 +2,38 @@
 /**
  * Shortcode: cp_nav_search
  * Widget: Nav Search
- * Auto-generated from WORDPRESS_MIGRATION_MANIFEST.json
+ * Source: site-assets/search-assets/nav-search.html
+ * Auto-generated from WORDPRESS_MIGRATION_MANIFEST.json by GENERATE_SHORTCODES.py
  */
 
 function cp_shortcode_nav_search( $atts = [], $content = null, $tag = '' ) {
     // Enqueue dependencies
-    wp_enqueue_script( 'instantsearch' );
-    wp_enqueue_style( 'instantsearch' );
+    wp_enqueue_style( 'cp-widget-nav-search' );
 
     
+    $data_attrs = '';
+
     // Return the widget HTML
     ob_start();
     ?>
-    <div class="cp-widget-wrapper cp-widget-nav_search">
-        <div id="cp-nav_search-container">
-            <p style="color: #999;">Loading Nav Search...</p>
-        </div>
-    </div>
-    <script>
-        // TODO: Initialize widget with nav search
-        // Example: fetch from API using window.CarolinaPanorama utilities
-        (function() {
-            var container = document.getElementById('cp-nav_search-container');
-            if (!container) return;
-            
-            // Replace this with actual widget initialization logic
-            console.log('Widget nav_search initialized');
-        })();
-    </script>
+<div class="cp-widget-wrapper cp-widget-nav_search"<?php echo $data_attrs; ?>>
+<form action="/query" method="get" class="nav-search-form">
+    <input 
+        type="search" 
+        name="q" 
+        class="nav-search-input" 
+        placeholder="Search articles..."
+        autocomplete="off"
+        aria-label="Search articles">
+    <button type="submit" class="nav-search-button" aria-label="Submit search">
+        <svg class="nav-search-icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
+            <circle cx="11" cy="11" r="8"></circle>
+            <path d="m21 21-4.35-4.35"></path>
+        </svg>
+        <span>Search</span>
+    </button>
+</form>
+</div>
     <?php
     return ob_get_clean();
 }
@@ -2,34 +2,344 @@
 /**
  * Shortcode: cp_search
  * Widget: Search Widget
- * Auto-generated from WORDPRESS_MIGRATION_MANIFEST.json
+ * Source: site-assets/search-assets/search-widget.html
+ * Auto-generated from WORDPRESS_MIGRATION_MANIFEST.json by GENERATE_SHORTCODES.py
  */
 
 function cp_shortcode_search( $atts = [], $content = null, $tag = '' ) {
     // Enqueue dependencies
-    wp_enqueue_script( 'instantsearch' );
-    wp_enqueue_style( 'instantsearch' );
+    wp_enqueue_style( 'cp-widgets-shared' );
 
     
+    $data_attrs = '';
+
     // Return the widget HTML
     ob_start();
     ?>
-    <div class="cp-widget-wrapper cp-widget-search">
-        <div id="cp-search-container">
-            <p style="color: #999;">Loading Search Widget...</p>
+<div class="cp-widget-wrapper cp-widget-search"<?php echo $data_attrs; ?>>
+<?php wp_print_styles( 'algolia-instantsearch-css' ); ?>
+
+<div class="search-container">
+    <div class="search-header">
+        <h1>Search Articles</h1>
+    </div>
+
+    <div id="searchbox" class="search-box"></div>
+
+    <div class="search-filters">
+        <aside class="search-sidebar">
+            <h3>Filter by Category</h3>
+            <div id="category-filter"></div>
+
+            <h3 style="margin-top: 30px;">Filter by Author</h3>
+            <div id="author-filter"></div>
+
+            <h3 style="margin-top: 30px;">Filter by Tags</h3>
+            <div id="tags-filter"></div>
+
+            <h3 style="margin-top: 30px;">Filter by Date</h3>
+            <div id="date-filter"></div>
+        </aside>
+
+        <div class="search-results">
+            <div id="stats"></div>
+            <div id="hits"></div>
+            <div id="pagination"></div>
         </div>
     </div>
-    <script>
-        // TODO: Initialize widget with $atts data
-        // Example: fetch from API using window.CarolinaPanorama utilities
-        (function() {
-            var container = document.getElementById('cp-search-container');
-            if (!container) return;
-            
-            // Replace this with actual widget initialization logic
-            console.log('Widget search initialized with:', {});
-        })();
-    </script>
+</div>
+
+<?php wp_print_scripts( 'algoliasearch-lite-js' ); ?>
+<?php wp_print_scripts( 'instantsearch-js' ); ?>
+
+<script defer>
+    // Wait for scripts to load before initializing
+    window.addEventListener('DOMContentLoaded', function() {
+    // Use public Algolia Index and Search API Key - (read-only and safe to use on frontend)
+    const searchClient = algoliasearch('L5HJO2NLX1', '303488aa839f0fc1c6c0467ae84a0354');
+
+    // Check URL for query parameter
+    const urlParams = new URLSearchParams(window.location.search);
+    const queryParam = urlParams.get('q') || urlParams.get('query') || '';
+
+    const search = instantsearch({
+        indexName: 'prod_CarolinaPanorama', // Must match your ALGOLIA_INDEX_NAME
+        searchClient,
+        routing: true, // Updates URL with search params
+        initialUiState: {
+            prod_CarolinaPanorama: {
+                query: queryParam,
+            },
+        },
+    });
+
+    // Search box
+    search.addWidgets([
+        instantsearch.widgets.searchBox({
+            container: '#searchbox',
+            placeholder: 'Search articles...',
+            showSubmit: false,
+            showReset: true,
+        })
+    ]);
+
+    // Stats
+    search.addWidgets([
+        instantsearch.widgets.stats({
+            container: '#stats',
+            templates: {
+                text(data, { html }) {
+                    let resultText = '';
+                    if (data.nbHits === 0) {
+                        resultText = 'No results';
+                    } else if (data.nbHits === 1) {
+                        resultText = '1 result';
+                    } else {
+                        resultText = `${data.nbHits.toLocaleString()} results`;
+                    }
+                    return html`<span>${resultText} found in ${data.processingTimeMS}ms</span>`;
+                }
+            }
+        })
+    ]);
+
+    // Category filter
+    search.addWidgets([
+        instantsearch.widgets.refinementList({
+            container: '#category-filter',
+            attribute: 'categories',
+            limit: 10,
+            showMore: true,
+        })
+    ]);
+
+    // Custom multi-select dropdown for Author
+    const authorDropdown = instantsearch.connectors.connectRefinementList(
+        (renderOptions, isFirstRender) => {
+            const { items, refine } = renderOptions;
+            const container = document.querySelector('#author-filter');
+            
+            if (isFirstRender) {
+                const html = `
+                    <div class="custom-dropdown">
+                        <input type="text" 
+                               class="custom-dropdown-input" 
+                               placeholder="Search authors..."
+                               id="author-search"
+                               autocomplete="off">
+                        <div class="custom-dropdown-list" id="author-list"></div>
+                    </div>
+                `;
+                container.innerHTML = html;
+                
+                const input = container.querySelector('#author-search');
+                const list = container.querySelector('#author-list');
+                
+                input.addEventListener('focus', () => {
+                    list.classList.add('active');
+                });
+                
+                // Close on click outside
+                document.addEventListener('click', (e) => {
+                    if (!container.contains(e.target)) {
+                        list.classList.remove('active');
+                    }
+                });
+            }
+            
+            const input = container.querySelector('#author-search');
+            const list = container.querySelector('#author-list');
+            const searchValue = input.value.toLowerCase();
+            
+            // Client-side filtering
+            const filteredItems = items.filter(item => 
+                item.label.toLowerCase().includes(searchValue)
+            );
+            
+            list.innerHTML = filteredItems.map(item => `
+                <div class="custom-dropdown-item">
+                    <input type="checkbox" 
+                           id="author-${item.value.replace(/\s+/g, '-')}" 
+                           ${item.isRefined ? 'checked' : ''}
+                           data-value="${item.value}">
+                    <label for="author-${item.value.replace(/\s+/g, '-')}">
+                        <span>${item.label}</span>
+                        <span class="custom-dropdown-count">${item.count}</span>
+                    </label>
+                </div>
+            `).join('') || '<div style="padding: 12px; color: #718096;">No authors found</div>';
+            
+            list.querySelectorAll('input[type="checkbox"]').forEach(checkbox => {
+                checkbox.addEventListener('change', (e) => {
+                    refine(e.target.dataset.value);
+                });
+            });
+        }
+    );
+
+    search.addWidgets([
+        authorDropdown({
+            attribute: 'author',
+            limit: 100,
+        })
+    ]);
+
+    // Custom multi-select dropdown for Tags
+    const tagsDropdown = instantsearch.connectors.connectRefinementList(
+        (renderOptions, isFirstRender) => {
+            const { items, refine } = renderOptions;
+            const container = document.querySelector('#tags-filter');
+            
+            if (isFirstRender) {
+                const html = `
+                    <div class="custom-dropdown">
+                        <input type="text" 
+                               class="custom-dropdown-input" 
+                               placeholder="Search tags..."
+                               id="tags-search"
+                               autocomplete="off">
+                        <div class="custom-dropdown-list" id="tags-list"></div>
+                    </div>
+                `;
+                container.innerHTML = html;
+                
+                const input = container.querySelector('#tags-search');
+                const list = container.querySelector('#tags-list');
+                
+                input.addEventListener('focus', () => {
+                    list.classList.add('active');
+                });
+                
+                // Close on click outside
+                document.addEventListener('click', (e) => {
+                    if (!container.contains(e.target)) {
+                        list.classList.remove('active');
+                    }
+                });
+            }
+            
+            const input = container.querySelector('#tags-search');
+            const list = container.querySelector('#tags-list');
+            const searchValue = input.value.toLowerCase();
+            
+            // Client-side filtering
+            const filteredItems = items.filter(item => 
+                item.label.toLowerCase().includes(searchValue)
+            );
+            
+            list.innerHTML = filteredItems.map(item => `
+                <div class="custom-dropdown-item">
+                    <input type="checkbox" 
+                           id="tag-${item.value.replace(/\s+/g, '-')}" 
+                           ${item.isRefined ? 'checked' : ''}
+                           data-value="${item.value}">
+                    <label for="tag-${item.value.replace(/\s+/g, '-')}">
+                        <span>${item.label.toLowerCase()}</span>
+                        <span class="custom-dropdown-count">${item.count}</span>
+                    </label>
+                </div>
+            `).join('') || '<div style="padding: 12px; color: #718096;">No tags found</div>';
+            
+            list.querySelectorAll('input[type="checkbox"]').forEach(checkbox => {
+                checkbox.addEventListener('change', (e) => {
+                    refine(e.target.dataset.value);
+                });
+            });
+        }
+    );
+
+    search.addWidgets([
+        tagsDropdown({
+            attribute: 'tags',
+            limit: 100,
+            searchable: true,
+        })
+    ]);
+
+    // Date filter - predefined ranges
+    const now = Date.now();
+    const dayMs = 24 * 60 * 60 * 1000;
+    
+    search.addWidgets([
+        instantsearch.widgets.numericMenu({
+            container: '#date-filter',
+            attribute: 'publishedAt',
+            items: [
+                { label: 'All time' },
+                { label: 'Last 7 days', start: now - (7 * dayMs) },
+                { label: 'Last 30 days', start: now - (30 * dayMs) },
+                { label: 'Last 6 months', start: now - (180 * dayMs) },
+                { label: 'Last year', start: now - (365 * dayMs) },
+            ],
+        })
+    ]);
+
+    // Results
+    search.addWidgets([
+        instantsearch.widgets.hits({
+            container: '#hits',
+            templates: {
+                item(hit, { html, components }) {
+                    return html`
+                        <div class="search-result-card">
+                            ${hit.image ? html`
+                                <div class="search-result-image">
+                                    <img src="${hit.image}" alt="${hit.title}" />
+                                </div>
+                            ` : ''}
+                            <div class="search-result-content">
+                                <h2 class="search-result-title">
+                                    <a href="${hit.url}">
+                                        ${components.Highlight({ attribute: 'title', hit })}
+                                    </a>
+                                </h2>
+                                <div class="search-result-meta">
+                                    ${hit.author ? html`<span>${hit.author} • </span>` : ''}
+                                    ${hit.formattedDate}
+                                    ${hit.categories && hit.categories.length > 0 ? html`
+                                        <span> • ${hit.categories.join(', ')}</span>
+                                    ` : ''}
+                                </div>
+                                <p class="search-result-excerpt">
+                                    ${components.Highlight({ attribute: 'description', hit })}
+                                </p>
+                            </div>
+                        </div>
+                    `;
+                },
+                empty: 'No results found for <q>{{query}}</q>'
+            },
+            transformItems(items) {
+                return items.map(item => ({
+                    ...item,
+                    // Format date
+                    formattedDate: new Date(item.publishedAt).toLocaleDateString('en-US', {
+                        year: 'numeric',
+                        month: 'long',
+                        day: 'numeric'
+                    })
+                }));
+            }
+        })
+    ]);
+
+    // Pagination
+    search.addWidgets([
+        instantsearch.widgets.pagination({
+            container: '#pagination',
+            padding: 2,
+        })
+    ]);
+
+    // Time from start() to the first rendered results (Algolia request included), reported
+    // through carolina-panorama-global.js telemetry when the global script is on the page
+    const perfStart = (window.CarolinaPanorama && window.CarolinaPanorama.perfStart) || (() => () => {});
+    const endFirstRender = perfStart('search-widget', 'render');
+    search.once('render', () => endFirstRender());
+    search.start();
+    }); // End DOMContentLoaded
+</script>
+</div>
     <?php
     return ob_get_clean();
 }
@@ -1,35 +1,143 @@
 <?php
 /**
  * Shortcode: cp_trending_carousel
- * Widget: Trending Carousel
- * Auto-generated from WORDPRESS_MIGRATION_MANIFEST.json
+ * Widget: Trending Carousel Widget v2
+ * Source: site-assets/site-home-widgets/trending-carousel-v2.html
+ * Auto-generated from WORDPRESS_MIGRATION_MANIFEST.json by GENERATE_SHORTCODES.py
  */
 
 function cp_shortcode_trending_carousel( $atts = [], $content = null, $tag = '' ) {
     // Enqueue dependencies
-    wp_enqueue_script( 'carolina_panorama_global' );
-    wp_enqueue_style( 'shared_article_card_styles' );
+    wp_enqueue_script( 'cp-global-js' );
+    wp_enqueue_style( 'cp-article-card-styles' );
+    wp_enqueue_style( 'cp-widget-trending-carousel' );
 
     
+    $data_attrs = '';
+
     // Return the widget HTML
     ob_start();
     ?>
-    <div class="cp-widget-wrapper cp-widget-trending_carousel">
-        <div id="cp-trending_carousel-container">
-            <p style="color: #999;">Loading Trending Carousel...</p>
+<div class="cp-widget-wrapper cp-widget-trending_carousel"<?php echo $data_attrs; ?>>
+<!-- Trending/Editor's Picks Carousel Widget -->
+<!-- Include shared-article-card-styles.css in your page -->
+<!-- Define window.TRENDING_ARTICLES in head tracking code with article URLs -->
+
+<div class="trending-section-wrapper">
+    <div class="trending-carousel-container">
+        <div class="trending-carousel-track" id="trending-track">
+            <!-- Articles will be inserted here -->
         </div>
     </div>
+</div>
+
     <script>
-        // TODO: Initialize widget with trending articles
-        // Example: fetch from API using window.CarolinaPanorama utilities
-        (function() {
-            var container = document.getElementById('cp-trending_carousel-container');
-            if (!container) return;
-            
-            // Replace this with actual widget initialization logic
-            console.log('Widget trending_carousel initialized');
+    // Wait for CarolinaPanorama global before running widget logic
+    function waitForCarolinaPanorama(callback, timeout = 5000) {
+        const start = Date.now();
+        (function check() {
+            if (window.CarolinaPanorama) {
+                callback();
+            } else if (Date.now() - start < timeout) {
+                setTimeout(check, 30);
+            } else {
+                console.error('CarolinaPanorama global not found.');
+            }
         })();
+    }
+
+    waitForCarolinaPanorama(function() {
+        const track = document.getElementById('trending-track');
+        const apiBase = window.CarolinaPanorama.API_BASE_URL || 'https://cms.carolinapanorama.org';
+        const PERF_WIDGET = 'trending-carousel-v2';
+
+        function formatDate(dateStr) {
+            if (!dateStr) return '';
+            try {
+                const options = { month: 'short', day: 'numeric', year: 'numeric' };
+                return new Date(dateStr).toLocaleDateString('en-US', options);
+            } catch (e) {
+                return dateStr;
+            }
+        }
+
+        // Create article card HTML (synchronous - renderCards() has loaded the categories)
+        function createArticleCard(article) {
+            const categoryTag = article.categories?.[0]?.name || 'News';
+            const image = window.CarolinaPanorama.imageHtml(article.featured_image, {
+                alt: article.featured_image_alt || article.title,
+                className: 'cp-article-image',
+                sizes: '(max-width: 768px) 280px, 320px'  // carousel item width
+            });
+            const authorName = article.author?.name || 'Carolina Panorama';
+            
+            return `
+                <div class="trending-carousel-item">
+                    <article class="cp-article-card cp-article-card-medium">
+                        <a href="${article.url}" class="cp-article-card-link">
+                            ${image}
+                            <div class="cp-article-content">
+                                <div class="cp-article-tags">
+                                    ${window.CarolinaPanorama.categoryTagHtml(categoryTag)}
+                                </div>
+                                <h3 class="cp-article-title">${article.title}</h3>
+                                <div class="cp-article-meta">
+                                    <span class="cp-article-author">${authorName}</span>
+                                    <span class="cp-article-date">${formatDate(article.publish_date)}</span>
+                                </div>
+                            </div>
+                        </a>
+                    </article>
+                </div>
+            `;
+        }
+
+        // Initialize carousel from new trending API
+        async function initializeCarousel() {
+            // Cards already rendered server-side (WordPress SSR shortcode) - nothing to fetch
+            if (track.closest('[data-cp-ssr]')) {
+                console.log('[Trending Carousel] Using server-rendered articles');
+                return;
+            }
+
+            try {
+                const url = `${apiBase}/api/public/trending`;
+                console.log('[Trending Carousel] Fetching from:', url);
+                
+                // Category colors load alongside the articles
+                window.CarolinaPanorama.fetchCategories();
+                const json = await window.CarolinaPanorama.timePhase(PERF_WIDGET, 'fetch',
+                    () => window.CarolinaPanorama.fetchJSON(url));
+                
+                const endParse = window.CarolinaPanorama.perfStart(PERF_WIDGET, 'parse');
+                if (!json.success || !json.data || json.data.length === 0) {
+                    endParse({ ok: false });
+                    console.error('[Trending Carousel] No articles returned from API');
+                    return;
+                }
+                
+                // Copy: the response object is shared through the global cache
+                const articles = json.data.slice();
+                const source = json.source;
+                
+                // Sort by most recent publish date
+                articles.sort((a, b) => new Date(b.publish_date) - new Date(a.publish_date));
+                endParse();
+                
+                console.log(`[Trending Carousel] Loaded ${articles.length} articles (source: ${source}, sorted by date)`);
+                
+                await window.CarolinaPanorama.timePhase(PERF_WIDGET, 'render',
+                    () => window.CarolinaPanorama.renderCards(track, articles, createArticleCard));
+            } catch (e) {
+                console.error('[Trending Carousel] Failed to load articles:', e);
+            }
+        }
+
+        initializeCarousel();
+    });
     </script>
+</script>
+</div>
     <?php
     return ob_get_clean();
 }
@@ -0,0 +1,201 @@
+<?php
+/**
+ * Shortcode: cp_youtube_channel
+ * Widget: YouTube Channel Widget
+ * Source: site-assets/site-feed-widgets/youtube-channel-widget.html
+ * Auto-generated from WORDPRESS_MIGRATION_MANIFEST.json by GENERATE_SHORTCODES.py
+ */
+
+function cp_shortcode_youtube_channel( $atts = [], $content = null, $tag = '' ) {
+    // Enqueue dependencies
+    wp_enqueue_script( 'cp-global-js' );
+    wp_enqueue_style( 'cp-widget-youtube-channel' );
+
+    
+    $data_attrs = '';
+
+    // Return the widget HTML
+    ob_start();
+    ?>
+<div class="cp-widget-wrapper cp-widget-youtube_channel"<?php echo $data_attrs; ?>>
+<!-- YouTube Channel Widget (Grid Layout) -->
+
+<div class="yt-channel-widget">
+  <!-- Header with channel info -->
+  <div class="yt-channel-header">
+    <!-- Optional: Brand logo (uncomment and set src to display) -->
+    <!-- <img class="yt-channel-logo" src="your-logo-url.png" alt="Brand Logo"> -->
+    
+    <img class="yt-channel-avatar" id="yt-channel-avatar" src="https://storage.googleapis.com/msgsndr/9Iv8kFcMiUgScXzMPv23/media/6984b3c50a7fd15b1977747c.png" alt="Channel Avatar">
+    <div class="yt-channel-info">
+      <h2 id="yt-channel-name">Loading...</h2>
+      <p id="yt-channel-subscribers">Youtube</p>
+    </div>
+    <a class="yt-channel-subscribe" id="yt-subscribe-btn" href="#" target="_blank">
+      <svg width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
+        <path d="M12 5v14M5 12h14"/>
+      </svg>
+      Subscribe
+    </a>
+  </div>
+
+  <!-- Videos grid -->
+  <div class="yt-videos-grid" id="yt-videos-grid">
+    <div class="yt-loading">Loading videos...</div>
+  </div>
+</div>
+
+<script>
+// Configuration - UPDATE THESE WITH YOUR VALUES
+const YT_CHANNEL_CONFIG = {
+  channelId: 'UCW9z3OOspfU0IFxlcVySy6w',      // Change to your channel ID
+  apiBaseUrl: 'https://cms.carolinapanorama.org/api/public/youtube'
+};
+
+const YT_CHANNEL_PERF_WIDGET = 'youtube-channel-widget';
+let videoData = [];
+
+function waitForCarolinaPanorama(callback, timeout = 5000) {
+  const start = Date.now();
+  (function check() {
+    if (window.CarolinaPanorama) {
+      callback();
+    } else if (Date.now() - start < timeout) {
+      setTimeout(check, 30);
+    } else {
+      console.error('CarolinaPanorama global not found for YouTube channel widget.');
+    }
+  })();
+}
+
+function formatViewCount(count) {
+  if (count >= 1000000) {
+    return (count / 1000000).toFixed(1) + 'M';
+  } else if (count >= 1000) {
+    return (count / 1000).toFixed(1) + 'K';
+  }
+  return count.toString();
+}
+
+async function fetchChannelInfo() {
+  try {
+    // Fetch channel metadata from YouTube
+    // Note: This requires the YouTube API key and might need additional setup
+    // For now, we'll use the public data from the video fetch
+    
+    const params = new URLSearchParams({
+      channel_id: YT_CHANNEL_CONFIG.channelId,
+      max_results: 8, // Limit to 8 videos for the grid
+      include_stats: 'true'  // Request view counts for this widget
+    });
+
+    const result = await window.CarolinaPanorama.timePhase(YT_CHANNEL_PERF_WIDGET, 'fetch',
+      () => window.CarolinaPanorama.fetchYouTubeVideos(`${YT_CHANNEL_CONFIG.apiBaseUrl}?${params}`));
+
+    if (result.success) {
+      videoData = result.data;
+      const endRender = window.CarolinaPanorama.perfStart(YT_CHANNEL_PERF_WIDGET, 'render');
+      renderChannelHeader(result.name);
+      renderVideosGrid();
+      endRender();
+    } else {
+      showError(result.error || 'Failed to load videos');
+    }
+  } catch (error) {
+    console.error('Error fetching videos:', error);
+    showError('Error loading videos. Please try again later.');
+  }
+}
+
+function renderChannelHeader(channelNameText) {
+  const channelName = document.getElementById('yt-channel-name');
+  const subscribBtn = document.getElementById('yt-subscribe-btn');
+  
+  // Set channel link
+  subscribBtn.href = `https://www.youtube.com/channel/${YT_CHANNEL_CONFIG.channelId}?sub_confirmation=1`;
+  
+  // Make channel name a clickable link
+  channelName.innerHTML = `<a href="https://www.youtube.com/channel/${YT_CHANNEL_CONFIG.channelId}" target="_blank" style="color: inherit; text-decoration: none;">${channelNameText}</a>`;
+  channelName.style.cursor = 'pointer';
+}
+
+function renderVideosGrid() {
+  const grid = document.getElementById('yt-videos-grid');
+  grid.innerHTML = '';
+
+  if (videoData.length === 0) {
+    grid.innerHTML = '<div class="yt-error">No videos found.</div>';
+    return;
+  }
+
+  videoData.forEach((video) => {
+    const card = document.createElement('a');
+    card.className = 'yt-video-card';
+    card.href = video.url;
+    card.target = '_blank';
+    card.rel = 'noopener noreferrer';
+    
+    // Parse published date for relative time
+    const pubDate = new Date(video.published_at);
+    const now = new Date();
+    const diffDays = Math.floor((now - pubDate) / (1000 * 60 * 60 * 24));
+    let timeAgo = '';
+    
+    if (diffDays === 0) {
+      timeAgo = 'Today';
+    } else if (diffDays === 1) {
+      timeAgo = 'Yesterday';
+    } else if (diffDays < 7) {
+      timeAgo = `${diffDays} days ago`;
+    } else if (diffDays < 30) {
+      const weeks = Math.floor(diffDays / 7);
+      timeAgo = `${weeks} ${weeks === 1 ? 'week' : 'weeks'} ago`;
+    } else if (diffDays < 365) {
+      const months = Math.floor(diffDays / 30);
+      timeAgo = `${months} ${months === 1 ? 'month' : 'months'} ago`;
+    } else {
+      const years = Math.floor(diffDays / 365);
+      timeAgo = `${years} ${years === 1 ? 'year' : 'years'} ago`;
+    }
+    
+    card.innerHTML = `
+      <div class="yt-video-thumbnail">
+        <img src="${video.thumbnail}" alt="${video.title}" loading="lazy">
+        <div class="yt-video-duration">•••</div>
+      </div>
+      <div class="yt-video-info">
+        <h3 class="yt-video-title">${video.title}</h3>
+        <div class="yt-video-meta">
+          <span class="yt-video-views">
+            <svg width="14" height="14" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
+              <path d="M12 5C6 5 2 12 2 12s4 7 10 7 10-7 10-7-4-7-10-7z"/>
+              <circle cx="12" cy="12" r="3"/>
+            </svg>
+            ${formatViewCount(video.view_count)}
+          </span>
+          <span>${timeAgo}</span>
+        </div>
+      </div>
+    `;
+    
+    grid.appendChild(card);
+  });
+}
+
+function showError(message) {
+  const grid = document.getElementById('yt-videos-grid');
+  grid.innerHTML = `<div class="yt-error">${message}</div>`;
+}
+
+// Fetch data once the widget is near the viewport
+waitForCarolinaPanorama(() => {
+  window.CarolinaPanorama.whenVisible(document.querySelector('.yt-channel-widget'), fetchChannelInfo);
+});
+</script>
+</div>
+    <?php
+    return ob_get_clean();
+}
+
+// Register shortcode
+add_shortcode( 'cp_youtube_channel', 'cp_shortcode_youtube_channel' );
@@ -0,0 +1,174 @@
+<?php
+/**
+ * Shortcode: cp_youtube_playlist_carousel
+ * Widget: YouTube Playlist Carousel
+ * Source: site-assets/site-feed-widgets/youtube-playlist-carousel.html
+ * Auto-generated from WORDPRESS_MIGRATION_MANIFEST.json by GENERATE_SHORTCODES.py
+ */
+
+function cp_shortcode_youtube_playlist_carousel( $atts = [], $content = null, $tag = '' ) {
+    // Enqueue dependencies
+    wp_enqueue_script( 'cp-global-js' );
+    wp_enqueue_style( 'cp-widget-youtube-playlist-carousel' );
+
+    
+    $data_attrs = '';
+
+    // Return the widget HTML
+    ob_start();
+    ?>
+<div class="cp-widget-wrapper cp-widget-youtube_playlist_carousel"<?php echo $data_attrs; ?>>
+<!-- Featured Player + Episode List (Uses Carolina Panorama YouTube API) -->
+
+<div class="yt-featured-wrapper">
+  <div class="yt-featured-player" id="yt-featured-player">
+    <!-- Featured player and title will be injected here -->
+  </div>
+  <div class="yt-episode-list" id="yt-episode-list">
+    <h3>Episodes</h3>
+    <div class="yt-episode-container" id="yt-episode-container"></div>
+  </div>
+</div>
+
+<script>
+// Configuration - UPDATE THESE WITH YOUR VALUES
+const YT_CONFIG = {
+  channelId: 'UCxxx',      // Change to your channel ID
+  playlistId: null,         // OR change to your playlist ID (leave null if using channelId)
+  apiBaseUrl: 'https://api.carolinapanorama.com/api/public/youtube'
+};
+
+const YT_EMBED_ORIGIN = 'https://www.youtube.com';
+const YT_PLAYLIST_PERF_WIDGET = 'youtube-playlist-carousel';
+
+let videoData = [];
+const featured = document.getElementById('yt-featured-player');
+const episodeContainer = document.getElementById('yt-episode-container');
+let current = 0;
+// Set once the reader presses play: later episode switches load the player directly
+let playerActivated = false;
+
+function waitForCarolinaPanorama(callback, timeout = 5000) {
+  const start = Date.now();
+  (function check() {
+    if (window.CarolinaPanorama) {
+      callback();
+    } else if (Date.now() - start < timeout) {
+      setTimeout(check, 30);
+    } else {
+      console.error('CarolinaPanorama global not found for YouTube playlist carousel.');
+    }
+  })();
+}
+
+function escapeAttr(text) {
+  return String(text || '').replace(/&/g, '&amp;').replace(/"/g, '&quot;').replace(/</g, '&lt;');
+}
+
+async function fetchVideos() {
+  try {
+    const params = new URLSearchParams();
+    if (YT_CONFIG.channelId) {
+      params.append('channel_id', YT_CONFIG.channelId);
+    } else if (YT_CONFIG.playlistId) {
+      params.append('playlist_id', YT_CONFIG.playlistId);
+    } else {
+      console.error('No channel_id or playlist_id configured');
+      return;
+    }
+    params.append('max_results', 10);
+
+    const result = await window.CarolinaPanorama.timePhase(YT_PLAYLIST_PERF_WIDGET, 'fetch',
+      () => window.CarolinaPanorama.fetchYouTubeVideos(`${YT_CONFIG.apiBaseUrl}?${params}`));
+
+    if (result.success) {
+      videoData = result.data;
+      const endRender = window.CarolinaPanorama.perfStart(YT_PLAYLIST_PERF_WIDGET, 'render');
+      renderFeatured();
+      renderEpisodeList();
+      endRender();
+    } else {
+      console.error('API Error:', result.error);
+    }
+  } catch (error) {
+    console.error('Error fetching videos:', error);
+  }
+}
+
+// Warm up the connection to YouTube when the reader looks likely to press play
+function preconnectYouTube() {
+  if (document.querySelector(`link[rel="preconnect"][href="${YT_EMBED_ORIGIN}"]`)) return;
+  const link = document.createElement('link');
+  link.rel = 'preconnect';
+  link.href = YT_EMBED_ORIGIN;
+  document.head.appendChild(link);
+}
+
+function loadPlayer(frame, v) {
+  frame.innerHTML = `<iframe src="${YT_EMBED_ORIGIN}/embed/${v.video_id}?autoplay=1" title="${escapeAttr(v.title)}" width="640" height="360" allow="autoplay; encrypted-media; picture-in-picture" allowfullscreen></iframe>`;
+}
+
+function renderFeatured() {
+  if (videoData.length === 0) return;
+  const v = videoData[current];
+  featured.innerHTML = `
+    <div class="yt-player-frame"></div>
+    <div class="yt-featured-title">${v.title}</div>
+  `;
+  const frame = featured.querySelector('.yt-player-frame');
+  if (playerActivated) {
+    loadPlayer(frame, v);
+    return;
+  }
+
+  // Facade: the thumbnail stands in for the player until it's clicked, so readers
+  // who never press play don't download YouTube's player
+  const thumbnail = v.thumbnail || `https://i.ytimg.com/vi/${v.video_id}/hqdefault.jpg`;
+  frame.innerHTML = `
+    <button type="button" class="yt-facade" aria-label="Play video: ${escapeAttr(v.title)}">
+      <img src="${thumbnail}" alt="" width="640" height="360">
+      <span class="yt-facade-play" aria-hidden="true"></span>
+    </button>
+  `;
+  const button = frame.querySelector('.yt-facade');
+  button.addEventListener('pointerover', preconnectYouTube, { once: true });
+  button.addEventListener('focus', preconnectYouTube, { once: true });
+  button.addEventListener('click', () => {
+    playerActivated = true;
+    loadPlayer(frame, v);
+  });
+}
+
+function renderEpisodeList() {
+  // Clear existing buttons
+  episodeContainer.innerHTML = '';
+  
+  videoData.forEach((v, i) => {
+    const btn = document.createElement('button');
+    btn.className = 'yt-episode-btn' + (i === current ? ' active' : '');
+    btn.onclick = function(e) {
+      e.preventDefault();
+      current = i;
+      renderFeatured();
+      renderEpisodeList();
+    };
+    btn.innerHTML = `
+      <img class="yt-episode-thumb" src="${v.thumbnail}" alt="${v.title}" loading="lazy">
+      <span class="yt-episode-title">${v.title}</span>
+    `;
+    episodeContainer.appendChild(btn);
+  });
+}
+
+// Fetch videos once the widget is near the viewport
+waitForCarolinaPanorama(() => {
+  window.CarolinaPanorama.whenVisible(document.querySelector('.yt-featured-wrapper'), fetchVideos);
+});
+</script>
+</div>
+    <?php
+    return ob_get_clean();
+}
+
+// Register shortcode
+add_shortcode( 'cp_youtube_playlist_carousel', 'cp_shortcode_youtube_playlist_carousel' );
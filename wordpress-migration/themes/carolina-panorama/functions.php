@@ -8,12 +8,28 @@ if ( ! defined( 'ABSPATH' ) ) {
     exit;
 }
 
+/**
+ * Content hash of the global JS, so telemetry samples split by deploy. Hashed once per
+ * file change: the transient is keyed on the file's mtime and has no expiry, so it is
+ * autoloaded with the other options instead of costing a query per request.
+ */
+function cp_global_js_version() {
+    $path   = get_template_directory() . '/js/carolina-panorama-global.js';
+    $mtime  = (int) @filemtime( $path );
+    $cached = get_transient( 'cp_global_js_version' );
+    if ( is_array( $cached ) && $cached['mtime'] === $mtime ) {
+        return $cached['hash'];
+    }
+    $hash = $mtime ? substr( md5_file( $path ), 0, 12 ) : '';
+    set_transient( 'cp_global_js_version', [ 'mtime' => $mtime, 'hash' => $hash ] );
+    return $hash;
+}
+
 /**
  * Enqueue global assets
  */
 function cp_enqueue_global_assets() {
     $theme_uri = get_template_directory_uri();
-    $theme_dir = get_template_directory();
 
     // Global CSS
     wp_enqueue_style(
@@ -35,6 +51,9 @@ function cp_enqueue_global_assets() {
     // Pass config to JS
     wp_localize_script( 'cp-global-js', 'CarolinaPanoramaConfig', [
         'apiBaseUrl' => get_option( 'cp_api_base_url', 'https://cms.carolinapanorama.org' ),
+        'homepageApiUrl' => is_front_page() ? get_option( 'cp_homepage_api_url', '' ) : '',
+        'telemetryUrl' => get_option( 'cp_telemetry_url', '' ),
+        'assetVersion' => cp_global_js_version(),
         'siteUrl'    => site_url(),
         'restUrl'    => rest_url(),
         'restNonce'  => wp_create_nonce( 'wp_rest' ),
@@ -77,34 +96,17 @@ function cp_enqueue_article_card_styles() {
 }
 
 /**
- * Enqueue external libraries (Algolia, Quill, YouTube, etc.)
+ * Register external libraries (Algolia, Quill). Nothing is enqueued here: shortcodes
+ * that use a library print or enqueue its handle when they render.
  */
-function cp_enqueue_external_libs() {
-    // Algolia InstantSearch CSS
-    wp_enqueue_style(
-        'algolia-instantsearch-css',
-        'https://cdn.jsdelivr.net/npm/instantsearch.css@7.4.5/themes/satellite-min.css',
-        [],
-        '7.4.5'
-    );
-
-    // Quill Rich Text Editor
-    wp_enqueue_style(
-        'quill-snow-css',
-        'https://cdn.quilljs.com/1.3.6/quill.snow.css',
-        [],
-        '1.3.6'
-    );
-
-    wp_enqueue_script(
-        'quill-js',
-        'https://cdn.quilljs.com/1.3.6/quill.min.js',
-        [],
-        '1.3.6',
-        true
-    );
+function cp_register_external_libs() {
+    wp_register_style( 'algolia-instantsearch-css', 'https://cdn.jsdelivr.net/npm/instantsearch.css@7.4.5/themes/satellite-min.css', [], '7.4.5' );
+    wp_register_script( 'algoliasearch-lite-js', 'https://cdn.jsdelivr.net/npm/algoliasearch@4.14.2/dist/algoliasearch-lite.umd.js', [], '4.14.2', [ 'in_footer' => true, 'strategy' => 'defer' ] );
+    wp_register_script( 'instantsearch-js', 'https://cdn.jsdelivr.net/npm/instantsearch.js@4.49.1/dist/instantsearch.production.min.js', [ 'algoliasearch-lite-js' ], '4.49.1', [ 'in_footer' => true, 'strategy' => 'defer' ] );
+    wp_register_style( 'quill-snow-css', 'https://cdn.quilljs.com/1.3.6/quill.snow.css', [], '1.3.6' );
+    wp_register_script( 'quill-js', 'https://cdn.quilljs.com/1.3.6/quill.min.js', [], '1.3.6', [ 'in_footer' => true ] );
 }
-add_action( 'wp_enqueue_scripts', 'cp_enqueue_external_libs', 11 );
+add_action( 'wp_enqueue_scripts', 'cp_register_external_libs', 5 );
 
 /**
  * Theme supports
@@ -168,3 +170,10 @@ require_once get_template_directory() . '/inc/template-tags.php';
  * Include blocks
  */
 require_once get_template_directory() . '/inc/blocks.php';
+
+/**
+ * Local mock CMS API (development only; written by SCAFFOLD_THEME.py --mock-cms)
+ */
+if ( file_exists( get_template_directory() . '/inc/mock-cms.php' ) ) {
+    require_once get_template_directory() . '/inc/mock-cms.php';
+}
@@ -473,6 +473,7 @@ function cp_shortcode_article_detail( $atts = [], $content = null, $tag = '' ) {
     
     // Path to your 404 page on the main site
     const notFoundUrl = '/404-page';
+    const PERF_WIDGET = 'article-detail-widget';
 
     function slugify(str) {
       return String(str || '')
@@ -650,10 +651,11 @@ function cp_shortcode_article_detail( $atts = [], $content = null, $tag = '' ) {
       console.log('[Article Detail Widget] Fetching article from:', url);
       
       try {
-        const res = await fetch(url);
-        console.log('[Article Detail Widget] Response status:', res.status);
-        
-        const json = await res.json();
+        const json = await window.CarolinaPanorama.timePhase(PERF_WIDGET, 'fetch', async () => {
+          const res = await fetch(url);
+          console.log('[Article Detail Widget] Response status:', res.status);
+          return res.json();
+        });
         console.log('[Article Detail Widget] Response data:', json);
         
         if (!json.success || !json.data) {
@@ -665,6 +667,7 @@ function cp_shortcode_article_detail( $atts = [], $content = null, $tag = '' ) {
         const article = json.data;
         const pageTitle = article.title || 'Article';
         console.log('[Article Detail Widget] Rendering article:', pageTitle);
+        const endRender = window.CarolinaPanorama.perfStart(PERF_WIDGET, 'render');
         
         titleEl.textContent = pageTitle;
         // Update browser tab title using meta_title if available
@@ -705,6 +708,7 @@ function cp_shortcode_article_detail( $atts = [], $content = null, $tag = '' ) {
 
         renderTags(article.tags || []);
         renderAuthor(article.author || null);
+        endRender();
         
         console.log('[Article Detail Widget] Article rendered successfully');
       } catch (e) {
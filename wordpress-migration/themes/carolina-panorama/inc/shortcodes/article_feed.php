@@ -256,6 +256,7 @@ waitForCarolinaPanorama(function() {
     const container  = document.getElementById('article-feed-container');
     const pagination = document.getElementById('article-feed-pagination');
     const ARTICLES_PER_PAGE = 10;
+    const PERF_WIDGET = 'article-feed-widget';
     let currentPage  = 1;
     let totalCount   = 0;
 
@@ -369,13 +370,17 @@ waitForCarolinaPanorama(function() {
 
         // WP REST for CPTs uses /wp/v2/{post_type} where slug == CPT name
         const url = `${restBase}/wp/v2/article?${params.toString()}`;
-        const res = await fetch(url, { headers: restHeaders });
+        const data = await window.CarolinaPanorama.timePhase(PERF_WIDGET, 'fetch', async () => {
+            const res = await fetch(url, { headers: restHeaders });
 
-        // WP sends total count in headers
-        totalCount = parseInt(res.headers.get('X-WP-Total') || '0', 10);
+            // WP sends total count in headers
+            totalCount = parseInt(res.headers.get('X-WP-Total') || '0', 10);
 
-        const data = await res.json();
+            return res.json();
+        });
+        const endParse = window.CarolinaPanorama.perfStart(PERF_WIDGET, 'parse');
         if (!Array.isArray(data)) {
+            endParse({ ok: false });
             return { articles: [], categoryDetails, authorDetails };
         }
 
@@ -404,6 +409,7 @@ waitForCarolinaPanorama(function() {
                 categories:  cats.length ? cats : ['News'],
             };
         });
+        endParse();
 
         return { articles, categoryDetails, authorDetails };
     }
@@ -415,8 +421,8 @@ waitForCarolinaPanorama(function() {
             container.innerHTML = '<p style="text-align:center;color:#666;">No articles found.</p>';
             return;
         }
-        const cardsHTML = await Promise.all(articles.map((data, index) => createArticleCard(data, index)));
-        container.innerHTML = cardsHTML.join('');
+        await window.CarolinaPanorama.timePhase(PERF_WIDGET, 'render',
+            () => window.CarolinaPanorama.renderCards(container, articles, createArticleCard));
     }
 
     function renderPagination(page, total) {
@@ -433,14 +439,9 @@ waitForCarolinaPanorama(function() {
         document.getElementById('feed-next').onclick = () => { if (!nextDisabled) debouncedChangePage(page + 1); };
     }
 
-    async function createArticleCard(data, index) {
-        const categoryTagsHTML = await Promise.all(
-            data.categories.slice(0, 2).map(async cat => {
-                const cls   = cat.toLowerCase().replace(/\s+/g, '-');
-                const style = await window.CarolinaPanorama.getCategoryStyle(cat);
-                return `<span class="cp-article-tag ${cls}" style="${style}">${cat}</span>`;
-            })
-        );
+    // Synchronous - renderCards() has loaded the categories
+    function createArticleCard(data, index) {
+        const categoryTagsHTML = data.categories.slice(0, 2).map(window.CarolinaPanorama.categoryTagHtml);
         const imageUrl   = data.image || 'https://storage.googleapis.com/msgsndr/9Iv8kFcMiUgScXzMPv23/media/697bd8644d56831c95c3248d.svg';
         const loadingAttr = index >= 3 ? 'loading="lazy"' : 'loading="eager"';
         return `
@@ -490,7 +491,7 @@ waitForCarolinaPanorama(function() {
             if (categoryDetails.color_code) {
                 headerContainer.setAttribute('style', `background-color:${categoryDetails.color_code};`);
             } else {
-                const style = await window.CarolinaPanorama.getCategoryStyle(categoryDetails.name);
+                const style = window.CarolinaPanorama.getCategoryStyleSync(categoryDetails.name);
                 if (style) headerContainer.setAttribute('style', style);
             }
             headerTitle.innerHTML = `<span class="header-title">${categoryDetails.name}</span>`;
@@ -333,8 +333,10 @@ waitForCarolinaPanorama(function() {
     const ARTICLES_PER_CATEGORY = 3;
     const FEATURED_ARTICLES = 1;
     const CONDENSED_ARTICLES = 2;
-    const CACHE_KEY = 'cp_homepage_feed_cache_v2';
+    const CACHE_KEY = 'article-list-feed';
     const CACHE_DURATION = 5 * 60 * 1000; // 5 minutes
+    const FETCH_CONCURRENCY = 3; // category requests in flight at once
+    const PERF_WIDGET = 'article-list-feed';
 
     // Use global CarolinaPanorama helpers
     const apiBase = window.CarolinaPanorama.API_BASE_URL || 'https://cms.carolinapanorama.org';
@@ -396,13 +398,13 @@ waitForCarolinaPanorama(function() {
     async function fetchCategoryArticles(category) {
         const url = `${apiBase}/api/public/articles?category=${encodeURIComponent(category)}&per_page=${ARTICLES_PER_CATEGORY}&page=1`;
         
-        const res = await fetch(url);
-        const json = await res.json();
+        const json = await window.CarolinaPanorama.fetchJSON(url);
         
         if (!json.success || !Array.isArray(json.data)) {
             return [];
         }
         
+        const endParse = window.CarolinaPanorama.perfStart(PERF_WIDGET, 'parse');
         const articles = json.data.map(article => ({
             url: article.url || (article.slug ? `/article#${encodeURIComponent(article.slug)}` : ''),
             title: article.title,
@@ -420,62 +422,53 @@ waitForCarolinaPanorama(function() {
         
         // Sort by most recent publish date
         validArticles.sort((a, b) => new Date(b.date) - new Date(a.date));
+        endParse();
         
         return validArticles;
     }
 
-    // Fetch all articles with caching
+    // Fetch all articles through the shared stale-while-revalidate cache
     async function fetchAllArticles() {
-        // Check localStorage cache first
+        const endFetch = window.CarolinaPanorama.perfStart(PERF_WIDGET, 'fetch');
         try {
-            const cached = localStorage.getItem(CACHE_KEY);
-            if (cached) {
-                const { data, timestamp } = JSON.parse(cached);
-                const age = Date.now() - timestamp;
-                
-                if (age < CACHE_DURATION) {
-                    console.log('[Article List Feed] Loaded from cache (age:', Math.round(age / 1000), 'seconds)');
-                    return data;
+            const feed = await window.CarolinaPanorama.cachedFetch(CACHE_KEY, async () => {
+                console.log('[Article List Feed] Fetching fresh data from API...');
+                const allArticles = {};
+
+                // Fetch categories concurrently (capped) - latency is the slowest request, not the sum
+                const results = await window.CarolinaPanorama.mapWithConcurrency(CATEGORIES, FETCH_CONCURRENCY, async category => {
+                    try {
+                        return await fetchCategoryArticles(category);
+                    } catch (e) {
+                        console.error(`[Article List Feed] Failed to load ${category}:`, e);
+                        return [];
+                    }
+                });
+                CATEGORIES.forEach((category, index) => {
+                    if (results[index].length > 0) {
+                        allArticles[category] = results[index];
+                    }
+                });
+
+                // Nothing loaded: keep whatever is cached rather than caching an empty feed
+                if (Object.keys(allArticles).length === 0) {
+                    throw new Error('No articles loaded');
                 }
-                // Cache expired
-                localStorage.removeItem(CACHE_KEY);
-            }
+                return allArticles;
+            }, { maxAge: CACHE_DURATION });
+            endFetch();
+            return feed;
         } catch (e) {
-            console.warn('[Article List Feed] Failed to read cache:', e);
+            endFetch({ ok: false });
+            console.error('[Article List Feed] Failed to load articles:', e);
+            return {};
         }
-        
-        // Fetch fresh data from API
-        console.log('[Article List Feed] Fetching fresh data from API...');
-        const allArticles = {};
-        
-        for (const category of CATEGORIES) {
-            try {
-                const articles = await fetchCategoryArticles(category);
-                if (articles.length > 0) {
-                    allArticles[category] = articles;
-                }
-            } catch (e) {
-                console.error(`[Article List Feed] Failed to load ${category}:`, e);
-            }
-        }
-        
-        // Cache the results
-        try {
-            localStorage.setItem(CACHE_KEY, JSON.stringify({
-                data: allArticles,
-                timestamp: Date.now()
-            }));
-            console.log('[Article List Feed] Cached', Object.keys(allArticles).length, 'categories');
-        } catch (e) {
-            console.warn('[Article List Feed] Failed to cache results:', e);
-        }
-        
-        return allArticles;
     }
 
     // Initialize feed
     async function initializeFeed() {
         const allArticles = await fetchAllArticles();
+        const endRender = window.CarolinaPanorama.perfStart(PERF_WIDGET, 'render');
         let html = '';
         
         // Build sections from cached or fresh data
@@ -506,10 +499,12 @@ waitForCarolinaPanorama(function() {
 
         if (!html) {
             container.innerHTML = '<p style="text-align: center; color: #666;">No articles found.</p>';
+            endRender({ ok: false });
             return;
         }
 
         container.innerHTML = html;
+        endRender();
     }
 
     // Initialize on page load
@@ -10,7 +10,7 @@ function cp_shortcode_article_search( $atts = [], $content = null, $tag = '' ) {
 
     ob_start();
     ?>
-<link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/instantsearch.css@7.4.5/themes/satellite-min.css" />
+<?php wp_print_styles( 'algolia-instantsearch-css' ); ?>
 
 <style>
     .search-container {
@@ -272,8 +272,8 @@ function cp_shortcode_article_search( $atts = [], $content = null, $tag = '' ) {
     </div>
 </div>
 
-<script src="https://cdn.jsdelivr.net/npm/algoliasearch@4.14.2/dist/algoliasearch-lite.umd.js" defer></script>
-<script src="https://cdn.jsdelivr.net/npm/instantsearch.js@4.49.1/dist/instantsearch.production.min.js" defer></script>
+<?php wp_print_scripts( 'algoliasearch-lite-js' ); ?>
+<?php wp_print_scripts( 'instantsearch-js' ); ?>
 
 <script defer>
     // Wait for scripts to load before initializing
@@ -554,6 +554,11 @@ function cp_shortcode_article_search( $atts = [], $content = null, $tag = '' ) {
         })
     ]);
 
+    // Time from start() to the first rendered results (Algolia request included), reported
+    // through carolina-panorama-global.js telemetry when the global script is on the page
+    const perfStart = (window.CarolinaPanorama && window.CarolinaPanorama.perfStart) || (() => () => {});
+    const endFirstRender = perfStart('article-search', 'render');
+    search.once('render', () => endFirstRender());
     search.start();
     }); // End DOMContentLoaded
 </script>
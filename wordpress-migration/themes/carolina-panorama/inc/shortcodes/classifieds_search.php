@@ -11,7 +11,7 @@ function cp_shortcode_classifieds_search( $atts = [], $content = null, $tag = ''
     ob_start();
     ?>
 <meta name="viewport" content="width=device-width, initial-scale=1.0, user-scalable=yes">
-<link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/instantsearch.css@7.4.5/themes/satellite-min.css" />
+<?php wp_print_styles( 'algolia-instantsearch-css' ); ?>
 <link rel="preconnect" href="https://fonts.googleapis.com">
 <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
 <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap" rel="stylesheet">
@@ -886,8 +886,8 @@ function cp_shortcode_classifieds_search( $atts = [], $content = null, $tag = ''
 </div>
 </div>
 
-<script src="https://cdn.jsdelivr.net/npm/algoliasearch@4.14.2/dist/algoliasearch-lite.umd.js"></script>
-<script src="https://cdn.jsdelivr.net/npm/instantsearch.js@4.49.1/dist/instantsearch.production.min.js"></script>
+<?php wp_print_scripts( 'algoliasearch-lite-js' ); ?>
+<?php wp_print_scripts( 'instantsearch-js' ); ?>
 
 <script>
 (function() {
@@ -1004,6 +1004,11 @@ function cp_shortcode_classifieds_search( $atts = [], $content = null, $tag = ''
         })
     ]);
 
+    // Time from start() to the first rendered results (Algolia request included), reported
+    // through carolina-panorama-global.js telemetry when the global script is on the page
+    const perfStart = (window.CarolinaPanorama && window.CarolinaPanorama.perfStart) || (() => () => {});
+    const endFirstRender = perfStart('classifieds-search', 'render');
+    search.once('render', () => endFirstRender());
     search.start();
     }
     
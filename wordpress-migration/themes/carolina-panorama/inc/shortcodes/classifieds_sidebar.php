@@ -11,7 +11,7 @@ function cp_shortcode_classifieds_sidebar( $atts = [], $content = null, $tag = '
     ob_start();
     ?>
 <meta name="viewport" content="width=device-width, initial-scale=1.0, user-scalable=yes">
-<link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/instantsearch.css@7.4.5/themes/satellite-min.css" />
+<?php wp_print_styles( 'algolia-instantsearch-css' ); ?>
 
 <style>
     .classifieds-sidebar-widget {
@@ -116,7 +116,7 @@ function cp_shortcode_classifieds_sidebar( $atts = [], $content = null, $tag = '
     <div id="sidebar-items" class="sidebar-items"></div>
 </div>
 
-<script src="https://cdn.jsdelivr.net/npm/algoliasearch@4.14.2/dist/algoliasearch-lite.umd.js"></script>
+<?php wp_print_scripts( 'algoliasearch-lite-js' ); ?>
 
 <script>
 (function() {
@@ -136,6 +136,10 @@ function cp_shortcode_classifieds_sidebar( $atts = [], $content = null, $tag = '
         const client = searchClient;
         const indexName = 'prod_CarolinaPanorama_Classifieds';
         
+        // Phase timing through carolina-panorama-global.js telemetry, when the global script is on the page
+        const perfStart = (window.CarolinaPanorama && window.CarolinaPanorama.perfStart) || (() => () => {});
+        const endFetch = perfStart('classifieds-sidebar-widget', 'fetch');
+        
         // Search for all classifieds, limited to top results
         client.search([
             {
@@ -148,6 +152,8 @@ function cp_shortcode_classifieds_sidebar( $atts = [], $content = null, $tag = '
                 }
             }
         ]).then(({ results }) => {
+            endFetch();
+            const endRender = perfStart('classifieds-sidebar-widget', 'render');
             const hits = results[0].hits;
             const container = document.getElementById('sidebar-items');
             
@@ -160,6 +166,7 @@ function cp_shortcode_classifieds_sidebar( $atts = [], $content = null, $tag = '
             
             if (sorted.length === 0) {
                 container.innerHTML = '<div class="sidebar-empty">No classifieds available</div>';
+                endRender();
                 return;
             }
             
@@ -175,7 +182,9 @@ function cp_shortcode_classifieds_sidebar( $atts = [], $content = null, $tag = '
                     </div>
                 </div>
             `).join('');
+            endRender();
         }).catch(err => {
+            endFetch({ ok: false });
             console.error('Error fetching classifieds:', err);
             document.getElementById('sidebar-items').innerHTML = '<div class="sidebar-empty">Unable to load classifieds</div>';
         });
@@ -12,6 +12,7 @@ function cp_shortcode_file_list_preview( $atts = [], $content = null, $tag = ''
     ?>
 <script>
     const WORKER_URL = 'https://file-list-worker.carolinapanorama.org';
+    const FILE_CACHE_KEY = 'cp_file_list_cache';
 </script>
 
 <style>
@@ -582,17 +583,50 @@ function cp_shortcode_file_list_preview( $atts = [], $content = null, $tag = ''
             });
         }
 
-        // Fetch files from Cloudflare Worker
-        async function loadFiles() {
+        // Last list we rendered, keyed by the worker's ETag
+        function readCachedFiles() {
+            try {
+                return JSON.parse(localStorage.getItem(FILE_CACHE_KEY));
+            } catch (e) {
+                return null;
+            }
+        }
+
+        // Phase timing through carolina-panorama-global.js telemetry, when the global script is on the page
+        function perfStart(phase) {
+            const cp = window.CarolinaPanorama;
+            return cp && cp.perfStart ? cp.perfStart('file-list-preview', phase) : () => {};
+        }
+
+        // Fetch files from Cloudflare Worker. Its ETag/Cache-Control headers let the
+        // browser revalidate with If-None-Match, so an unchanged list costs a 304.
+        // Resolves to null when the cached copy is still current.
+        async function loadFiles(cached) {
+            const endFetch = perfStart('fetch');
             try {
                 const response = await fetch(WORKER_URL);
                 if (!response.ok) {
                     throw new Error(`HTTP error! status: ${response.status}`);
                 }
+                const etag = response.headers.get('ETag');
+                if (cached && etag && cached.etag === etag) {
+                    endFetch();
+                    return null;
+                }
                 const data = await response.json();
+                endFetch();
+                try {
+                    localStorage.setItem(FILE_CACHE_KEY, JSON.stringify({ etag, data }));
+                } catch (e) {
+                    // Storage full or disabled - just skip caching
+                }
                 return data;
             } catch (error) {
+                endFetch({ ok: false });
                 console.error('Error loading files:', error);
+                if (cached) {
+                    return null; // keep showing the cached list
+                }
                 const fileListElement = document.getElementById('fileList');
                 fileListElement.innerHTML = '<div style="padding: 20px; text-align: center; color: #6b7280;">Unable to load files.</div>';
                 return {};
@@ -602,10 +636,22 @@ function cp_shortcode_file_list_preview( $atts = [], $content = null, $tag = ''
         // Initialize the widget
         setupModalHandlers();
         
-        loadFiles().then(loadedFiles => {
+        // Render the cached list immediately, then revalidate
+        const cachedFiles = readCachedFiles();
+        if (cachedFiles && cachedFiles.data && Object.keys(cachedFiles.data).length > 0) {
+            files = cachedFiles.data;
+            renderFileList();
+        }
+        
+        loadFiles(cachedFiles).then(loadedFiles => {
+            if (loadedFiles === null) {
+                return;
+            }
             if (Object.keys(loadedFiles).length > 0) {
                 files = loadedFiles;
+                const endRender = perfStart('render');
                 renderFileList();
+                endRender();
             } else if (Object.keys(loadedFiles).length === 0) {
                 const fileListElement = document.getElementById('fileList');
                 fileListElement.innerHTML = '<div style="padding: 20px; text-align: center; color: #6b7280;">No files available.</div>';
@@ -274,6 +274,7 @@ add_shortcode( 'cp_trending_carousel', 'cp_shortcode_trending_carousel' );
     waitForCarolinaPanorama(function() {
         const track = document.getElementById('trending-track');
         const apiBase = window.CarolinaPanorama.API_BASE_URL || 'https://cms.carolinapanorama.org';
+        const PERF_WIDGET = 'trending-carousel-v2';
 
         function formatDate(dateStr) {
             if (!dateStr) return '';
@@ -285,19 +286,9 @@ add_shortcode( 'cp_trending_carousel', 'cp_shortcode_trending_carousel' );
             }
         }
 
-        function slugify(str) {
-            return String(str || '')
-                .toLowerCase()
-                .trim()
-                .replace(/[^a-z0-9\s-]/g, '')
-                .replace(/\s+/g, '-');
-        }
-
-        // Create article card HTML
-        async function createArticleCard(article) {
+        // Create article card HTML (synchronous - renderCards() has loaded the categories)
+        function createArticleCard(article) {
             const categoryTag = article.categories?.[0]?.name || 'News';
-            const categoryClass = slugify(categoryTag);
-            const style = await window.CarolinaPanorama.getCategoryStyle(categoryTag);
             const placeholderUrl = 'https://storage.googleapis.com/msgsndr/9Iv8kFcMiUgScXzMPv23/media/697bd8644d56831c95c3248d.svg';
             const imageUrl = article.featured_image || placeholderUrl;
             const authorName = article.author?.name || 'Carolina Panorama';
@@ -309,7 +300,7 @@ add_shortcode( 'cp_trending_carousel', 'cp_shortcode_trending_carousel' );
                             <img src="${imageUrl}" alt="${article.featured_image_alt || article.title}" class="cp-article-image">
                             <div class="cp-article-content">
                                 <div class="cp-article-tags">
-                                    <span class="cp-article-tag ${categoryClass}" style="${style}">${categoryTag}</span>
+                                    ${window.CarolinaPanorama.categoryTagHtml(categoryTag)}
                                 </div>
                                 <h3 class="cp-article-title">${article.title}</h3>
                                 <div class="cp-article-meta">
@@ -329,24 +320,30 @@ add_shortcode( 'cp_trending_carousel', 'cp_shortcode_trending_carousel' );
                 const url = `${apiBase}/api/public/trending`;
                 console.log('[Trending Carousel] Fetching from:', url);
                 
-                const res = await fetch(url);
-                const json = await res.json();
+                // Category colors load alongside the articles
+                window.CarolinaPanorama.fetchCategories();
+                const json = await window.CarolinaPanorama.timePhase(PERF_WIDGET, 'fetch',
+                    () => window.CarolinaPanorama.fetchJSON(url));
                 
+                const endParse = window.CarolinaPanorama.perfStart(PERF_WIDGET, 'parse');
                 if (!json.success || !json.data || json.data.length === 0) {
+                    endParse({ ok: false });
                     console.error('[Trending Carousel] No articles returned from API');
                     return;
                 }
                 
-                let articles = json.data;
+                // Copy: the response object is shared through the global cache
+                const articles = json.data.slice();
                 const source = json.source;
                 
                 // Sort by most recent publish date
                 articles.sort((a, b) => new Date(b.publish_date) - new Date(a.publish_date));
+                endParse();
                 
                 console.log(`[Trending Carousel] Loaded ${articles.length} articles (source: ${source}, sorted by date)`);
                 
-                const cardsHTML = await Promise.all(articles.map(article => createArticleCard(article)));
-                track.innerHTML = cardsHTML.join('');
+                await window.CarolinaPanorama.timePhase(PERF_WIDGET, 'render',
+                    () => window.CarolinaPanorama.renderCards(track, articles, createArticleCard));
             } catch (e) {
                 console.error('[Trending Carousel] Failed to load articles:', e);
             }